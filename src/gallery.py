@@ -4,6 +4,8 @@ Photo gallery generator for redshell.
 
 Scans a directory tree for photos, optionally deduplicates them, generates
 thumbnails and mid-size images, and creates a JSON index for the gallery viewer.
+With sqlite, the index is kept in an SQLite database and the JSON is exported
+from it.
 
 Usage:
     gallery.py scan [OPTIONS] DIRECTORY
@@ -13,11 +15,13 @@ import os
 import sys
 import json
 import hashlib
+import itertools
 import shutil
+import sqlite3
 import multiprocessing
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque
 from functools import partial
 
 # Try to import PIL for image processing
@@ -39,6 +43,15 @@ THUMB_SIZE = 300
 MID_SIZE = 1600
 QUALITY = 85
 GALLERY_DIR_NAME = ".gallery"
+HASH_CACHE_NAME = "hashes.json"
+JOURNAL_NAME = "journal.jsonl"
+SQLITE_INDEX_NAME = "photos.db"
+# Bytes read from each end of a file for the partial hash
+PARTIAL_HASH_SIZE = 16384
+# Photos that go through each stage of scan at a time
+SCAN_BATCH_SIZE = 1000
+# Batches that can wait to be resized before scan stops walking
+MAX_PENDING_BATCHES = 2
 
 # Patterns to exclude from scanning
 EXCLUDE_PATTERNS = [
@@ -78,6 +91,543 @@ def compute_hash(filepath: Path) -> tuple[Path, str | None]:
         return filepath, None
 
 
+def compute_partial_hash(filepath: Path) -> tuple[Path, str | None]:
+    """
+    Compute SHA256 hash of the first and last PARTIAL_HASH_SIZE bytes of file.
+
+    Files of up to twice that size are hashed whole, so for them the result
+    is the same as compute_hash's. Returns (filepath, hash) for pool.map.
+    """
+    sha256 = hashlib.sha256()
+    try:
+        with open(filepath, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size <= 2 * PARTIAL_HASH_SIZE:
+                sha256.update(f.read())
+            else:
+                sha256.update(f.read(PARTIAL_HASH_SIZE))
+                f.seek(-PARTIAL_HASH_SIZE, os.SEEK_END)
+                sha256.update(f.read(PARTIAL_HASH_SIZE))
+        return filepath, sha256.hexdigest()
+    except Exception as e:
+        print(f"Error hashing {filepath}: {e}", file=sys.stderr)
+        return filepath, None
+
+
+class HashCache:
+    """
+    Persistent cache of file hashes, stored in the gallery directory.
+
+    Entries are keyed by path and are only reused while the file's size,
+    mtime and inode are unchanged. Each entry can hold several kinds of hash,
+    like 'sha256' and 'partial'. Saving keeps only the entries that were
+    looked up or stored, so files that disappeared are dropped. If a journal
+    is given, stored hashes are also appended to it.
+    """
+
+    def __init__(self, cache_path: Path | None, load: bool = True, journal=None):
+        self.cache_path = cache_path
+        self.journal = journal
+        self._entries = {}  # path -> [size, mtime_ns, inode, {kind: hash}]
+        self._used = {}
+        if load and cache_path.exists():
+            try:
+                with open(cache_path) as f:
+                    self._entries = json.load(f)
+            except Exception as e:
+                print(f"Warning: Could not load hash cache: {e}", file=sys.stderr)
+
+    @staticmethod
+    def _key(st: os.stat_result) -> list:
+        return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+    def _load_entry(self, path: str) -> list | None:
+        return self._entries.get(path)
+
+    def _entry(self, filepath: Path, st: os.stat_result) -> list | None:
+        path = str(filepath)
+        entry = self._used.get(path) or self._load_entry(path)
+        if entry and entry[:3] == self._key(st) and isinstance(entry[3], dict):
+            self._used[path] = entry
+            return entry
+        return None
+
+    def lookup(self, filepath: Path, st: os.stat_result, kind: str = 'sha256') -> str | None:
+        """Return the cached hash of filepath, or None if it's missing or stale."""
+        entry = self._entry(filepath, st)
+        return entry[3].get(kind) if entry else None
+
+    def store(self, filepath: Path, st: os.stat_result, file_hash: str, kind: str = 'sha256'):
+        entry = self._entry(filepath, st)
+        if entry is None:
+            entry = self._used[str(filepath)] = self._key(st) + [{}]
+        entry[3][kind] = file_hash
+        if self.journal:
+            self.journal.append({'hash': str(filepath), 'key': entry[:3],
+                                 'kind': kind, 'value': file_hash})
+
+    def restore(self, path: str, key: list, kind: str, file_hash: str):
+        """Add a hash stored by an interrupted scan, as if it had been loaded."""
+        entry = self._entries.get(path)
+        if not entry or entry[:3] != key or not isinstance(entry[3], dict):
+            entry = self._entries[path] = key + [{}]
+        entry[3][kind] = file_hash
+
+    def save(self):
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(self._used, f)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            print(f"Warning: Could not save hash cache: {e}", file=sys.stderr)
+
+
+class SqliteHashCache(HashCache):
+    """Hash cache kept in the hashes table of a SqliteIndex."""
+
+    def __init__(self, db: sqlite3.Connection, load: bool = True, journal=None):
+        super().__init__(None, load=False, journal=journal)
+        self.db = db
+        self.load = load
+
+    def _load_entry(self, path: str) -> list | None:
+        # Hashes restored from the journal come first
+        entry = super()._load_entry(path)
+        if entry is None and self.load:
+            row = self.db.execute(
+                "SELECT size, mtime_ns, inode, partial, sha256 FROM hashes WHERE path = ?",
+                (path,)).fetchone()
+            if row:
+                hashes = {'partial': row[3], 'sha256': row[4]}
+                entry = list(row[:3]) + [{k: v for k, v in hashes.items() if v}]
+        return entry
+
+    def store(self, filepath: Path, st: os.stat_result, file_hash: str, kind: str = 'sha256'):
+        super().store(filepath, st, file_hash, kind)
+        size, mtime_ns, inode, hashes = self._used[str(filepath)]
+        self.db.execute(
+            """INSERT INTO hashes (path, size, mtime_ns, inode, partial, sha256)
+               VALUES (?, ?, ?, ?, ?, ?)
+               ON CONFLICT (path) DO UPDATE SET
+                   size = excluded.size, mtime_ns = excluded.mtime_ns,
+                   inode = excluded.inode, partial = excluded.partial,
+                   sha256 = excluded.sha256""",
+            (str(filepath), size, mtime_ns, inode, hashes.get('partial'), hashes.get('sha256')))
+
+    def save(self):
+        """Drop hashes of files that were not looked up or stored."""
+        self.db.execute("CREATE TEMP TABLE IF NOT EXISTS used_hashes (path TEXT PRIMARY KEY)")
+        self.db.execute("DELETE FROM used_hashes")
+        self.db.executemany("INSERT INTO used_hashes VALUES (?)",
+                            ((path,) for path in self._used))
+        self.db.execute("DELETE FROM hashes WHERE path NOT IN (SELECT path FROM used_hashes)")
+
+
+def _write_json_index(json_path: Path, title: str, photos) -> None:
+    """
+    Write photos.json from an iterable of photo entries, without holding them
+    all in memory. The output is the same as json.dump with indent=2.
+    """
+    tmp_path = json_path.with_name(json_path.name + ".tmp")
+    with open(tmp_path, 'w') as f:
+        f.write('{\n  "title": ' + json.dumps(title) + ',\n  "photos": [')
+        separator = '\n'
+        for photo in photos:
+            f.write(separator)
+            f.write('\n'.join('    ' + line for line in json.dumps(photo, indent=2).split('\n')))
+            separator = ',\n'
+        f.write(']\n}' if separator == '\n' else '\n  ]\n}')
+    os.replace(tmp_path, json_path)
+
+
+class JsonIndex:
+    """
+    Gallery index kept only in photos.json, which every scan loads and
+    rewrites in full.
+    """
+
+    def __init__(self, json_path: Path, load: bool = True):
+        self.json_path = json_path
+        self.title = None
+        self._existing = {}  # original_path -> photo_data
+        self._photos = []
+        if load and json_path.exists():
+            try:
+                with open(json_path) as f:
+                    existing_data = json.load(f)
+                if isinstance(existing_data, dict):
+                    self.title = existing_data.get('title')
+                    for photo in existing_data.get('photos', []):
+                        self._existing[photo['original_path']] = photo
+                print(f"Loaded {len(self._existing)} existing entries from gallery index")
+            except Exception as e:
+                print(f"Warning: Could not load existing gallery data: {e}", file=sys.stderr)
+
+    def __len__(self) -> int:
+        return len(self._photos)
+
+    def get(self, original_path: str) -> dict | None:
+        """Return the entry of an indexed photo, or None if it's not indexed."""
+        return self._existing.get(original_path)
+
+    def add(self, photo: dict, indexed: dict | None = None):
+        """Add a photo found by this scan, new or already indexed."""
+        self._photos.append(photo)
+
+    def needs_image(self, photo: dict, dest_path: Path) -> bool:
+        """Whether a thumbnail or mid-size image of a photo is missing."""
+        return not dest_path.exists()
+
+    def image_done(self, dest_path: str):
+        """Record that a thumbnail or mid-size image was generated."""
+
+    def commit(self, title: str):
+        """Write the photos added by this scan, sorted by date."""
+        self._photos.sort(key=lambda x: x['date'])
+        _write_json_index(self.json_path, title, self._photos)
+
+
+class SqliteIndex:
+    """
+    Gallery index kept in an SQLite database, with photos.json exported from
+    it.
+
+    The database holds a row per photo with its generated images, the hash
+    cache, and the title. Scans only write rows that changed, and
+    photos.json is only exported again if something did. Images the
+    database records as generated aren't looked for on disk again. All changes of a
+    scan are one transaction, so an interrupted scan leaves the database as
+    it was and resumes from its journal.
+    """
+
+    # Columns of a photo's entry in photos.json
+    KEYS = ('filename', 'original_path', 'date', 'date_source')
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS photos (
+            original_path TEXT PRIMARY KEY,
+            filename TEXT NOT NULL,
+            date TEXT NOT NULL,
+            date_source TEXT NOT NULL,
+            thumb INTEGER NOT NULL DEFAULT 0,
+            mid INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS photos_date ON photos (date, original_path);
+        CREATE INDEX IF NOT EXISTS photos_filename ON photos (filename);
+        CREATE TABLE IF NOT EXISTS hashes (
+            path TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            inode INTEGER NOT NULL,
+            partial TEXT,
+            sha256 TEXT
+        );
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+        CREATE TEMP TABLE seen (original_path TEXT PRIMARY KEY);
+    """
+
+    def __init__(self, db_path: Path, json_path: Path, load: bool = True):
+        self.json_path = json_path
+        self.load = load
+        self._changed = False
+        is_new = not db_path.exists()
+        self.db = sqlite3.connect(db_path)
+        self.db.executescript(self.SCHEMA)
+
+        # Start from photos.json the first time, if there is one
+        if is_new and load and json_path.exists():
+            legacy = JsonIndex(json_path)
+            self.db.executemany(
+                "INSERT OR REPLACE INTO photos (original_path, filename, date, date_source) "
+                "VALUES (:original_path, :filename, :date, :date_source)",
+                legacy._existing.values())
+            if legacy.title:
+                self.db.execute("INSERT INTO meta VALUES ('title', ?)", (legacy.title,))
+            self.db.commit()
+
+        row = self.db.execute("SELECT value FROM meta WHERE key = 'title'").fetchone()
+        self._stored_title = row[0] if row else None
+        self.title = self._stored_title if load else None
+        if load:
+            print(f"Loaded gallery index with {len(self)} entries")
+
+    def __len__(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM photos").fetchone()[0]
+
+    def get(self, original_path: str) -> dict | None:
+        """
+        Return the entry of an indexed photo, or None if it's not indexed.
+        The entry also has the photo's thumb and mid flags.
+        """
+        if not self.load:
+            return None
+        row = self.db.execute(
+            "SELECT filename, original_path, date, date_source, thumb, mid FROM photos "
+            "WHERE original_path = ?", (original_path,)).fetchone()
+        if row is None:
+            return None
+        return dict(zip(self.KEYS + ('thumb', 'mid'), row))
+
+    def add(self, photo: dict, indexed: dict | None = None):
+        """
+        Add a photo found by this scan, and write it if it differs from
+        indexed, the entry get() returned for it.
+        """
+        self.db.execute("INSERT OR IGNORE INTO seen VALUES (?)", (photo['original_path'],))
+        if indexed and all(photo[key] == indexed[key] for key in self.KEYS):
+            return
+        self.db.execute(
+            """INSERT INTO photos (original_path, filename, date, date_source)
+               VALUES (:original_path, :filename, :date, :date_source)
+               ON CONFLICT (original_path) DO UPDATE SET
+                   filename = excluded.filename, date = excluded.date,
+                   date_source = excluded.date_source, thumb = 0, mid = 0""",
+            photo)
+        self._changed = True
+
+    def needs_image(self, photo: dict, dest_path: Path) -> bool:
+        """
+        Whether a thumbnail or mid-size image of a photo is missing. Images
+        found on disk but not in the database, e.g. after starting from
+        photos.json, are recorded so that later scans don't look again.
+        """
+        column = self._image_column(dest_path)
+        if photo.get(column):
+            return False
+        if not dest_path.exists():
+            return True
+        self.db.execute(
+            f"UPDATE photos SET {column} = 1 WHERE original_path = ?",
+            (photo['original_path'],))
+        return False
+
+    def image_done(self, dest_path: str):
+        """Record that a thumbnail or mid-size image was generated."""
+        column = self._image_column(dest_path)
+        self.db.execute(
+            f"UPDATE photos SET {column} = 1 WHERE filename = ? AND {column} = 0",
+            (Path(dest_path).name,))
+
+    @staticmethod
+    def _image_column(dest_path) -> str:
+        return 'thumb' if Path(dest_path).parent.name == 'thumbs' else 'mid'
+
+    def commit(self, title: str):
+        """Drop photos that weren't found, commit, and export photos.json."""
+        deleted = self.db.execute(
+            "DELETE FROM photos WHERE original_path NOT IN (SELECT original_path FROM seen)")
+        if deleted.rowcount > 0:
+            self._changed = True
+        if title != self._stored_title:
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES ('title', ?)", (title,))
+            self._changed = True
+        self.db.commit()
+
+        if self._changed or not self.json_path.exists():
+            rows = self.db.execute(
+                "SELECT filename, original_path, date, date_source FROM photos "
+                "ORDER BY date, original_path")
+            _write_json_index(self.json_path, title, (dict(zip(self.KEYS, row)) for row in rows))
+        else:
+            print("Gallery index unchanged, kept photos.json")
+
+
+class ScanJournal:
+    """
+    Append-only log of the per-file results of a scan, stored in the gallery
+    directory.
+
+    Each line is a JSON record: the scan's options, then index entries of new
+    photos, hashes and finished images as they complete. A scan with the same
+    options resumes from the records of an interrupted one. When a scan
+    succeeds, the journal is compacted into photos.json and the hash cache,
+    and deleted.
+    """
+
+    def __init__(self, journal_path: Path, options: dict):
+        self.journal_path = journal_path
+        self.photos = {}  # original_path -> photo_data
+        self.resized = set()  # paths of finished images
+        self.hashes = []  # (path, [size, mtime_ns, inode], kind, hash)
+
+        resumed = self._load(options)
+        self._file = open(journal_path, 'a' if resumed else 'w', buffering=1)
+        if not resumed:
+            self.append({'options': options})
+
+    def _load(self, options: dict) -> bool:
+        """Load records of an earlier scan with the same options."""
+        try:
+            with open(self.journal_path) as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"Warning: Could not load scan journal: {e}", file=sys.stderr)
+            return False
+
+        try:
+            if json.loads(lines[0]) != {'options': options}:
+                print("Discarding journal of an interrupted scan with different options")
+                return False
+        except (IndexError, ValueError):
+            return False
+
+        for line in lines[1:]:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # The last line is cut short if the scan was killed mid-write
+                continue
+            if 'photo' in record:
+                self.photos[record['photo']['original_path']] = record['photo']
+            elif 'resized' in record:
+                self.resized.add(record['resized'])
+            elif 'hash' in record:
+                self.hashes.append((record['hash'], record['key'],
+                                    record['kind'], record['value']))
+        return True
+
+    def append(self, record: dict):
+        self._file.write(json.dumps(record) + "\n")
+
+    def sync(self):
+        """Make records written so far survive a crash of the machine."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def compact(self):
+        """Delete the journal, once its records are in the index and cache."""
+        self._file.close()
+        self.journal_path.unlink(missing_ok=True)
+
+
+class Deduper:
+    """
+    Drops duplicate photos from batches of files given in order, keeping the
+    first file of each set of identical ones.
+
+    Files are grouped by size first, and files with a unique size are never
+    read. The rest get a partial hash of their first and last bytes, and only
+    files that share a partial hash are hashed in full. The result is the same
+    as comparing the SHA256 hashes of all files at once. Between batches, only
+    the kept files and their hashes are remembered.
+    """
+
+    def __init__(self, pool, cache: HashCache, num_workers: int = 1):
+        self.pool = pool
+        self.cache = cache
+        self.num_workers = num_workers
+        self._kept = defaultdict(list)  # size -> kept files
+        self._stats = {}  # kept file -> os.stat_result
+        self._hashes = {'partial': {}, 'sha256': {}}  # kind -> {file: hash}
+        self.seen_count = 0
+        self.unique_count = 0
+        self.candidate_count = 0  # files that shared a size
+        self.hashed_count = 0  # files that needed a full hash
+
+    def _hash(self, files: list[Path], stats: dict, kind: str, hash_func):
+        """Hash files in the pool, reusing and updating cached hashes of kind."""
+        hashes = self._hashes[kind]
+        to_hash = []
+        for filepath in files:
+            if filepath in hashes:
+                continue
+            cached = self.cache.lookup(filepath, stats[filepath], kind)
+            if cached:
+                hashes[filepath] = cached
+            else:
+                to_hash.append(filepath)
+
+        chunksize = pool_chunksize(len(to_hash), self.num_workers)
+        for filepath, file_hash in self.pool.imap_unordered(hash_func, to_hash, chunksize):
+            if file_hash:
+                hashes[filepath] = file_hash
+                self.cache.store(filepath, stats[filepath], file_hash, kind)
+
+    def add(self, files: list[Path]) -> list[Path]:
+        """Return the files that are not duplicates of earlier ones, in order."""
+        self.seen_count += len(files)
+        stats = {}
+        by_size = defaultdict(list)
+        for filepath in files:
+            try:
+                st = os.stat(filepath)
+            except OSError as e:
+                print(f"Error hashing {filepath}: {e}", file=sys.stderr)
+                continue
+            stats[filepath] = st
+            by_size[st.st_size].append(filepath)
+
+        # Files that share a size with another file, new or kept
+        candidates = []
+        for size, group in by_size.items():
+            if len(group) > 1 or size in self._kept:
+                self.candidate_count += len(group)
+                candidates.extend(group)
+                for kept in self._kept.get(size, []):
+                    candidates.append(kept)
+                    stats[kept] = self._stats[kept]
+
+        partial = self._hashes['partial']
+        full = self._hashes['sha256']
+        self._hash(candidates, stats, 'partial', compute_partial_hash)
+        by_partial = defaultdict(list)
+        for filepath in candidates:
+            if filepath in partial:
+                by_partial[(stats[filepath].st_size, partial[filepath])].append(filepath)
+
+        # The partial hash of a small file covers all of it
+        to_hash = [
+            filepath
+            for (size, _), group in by_partial.items()
+            if len(group) > 1 and size > 2 * PARTIAL_HASH_SIZE
+            for filepath in group
+        ]
+        self.hashed_count += sum(1 for filepath in to_hash if filepath not in self._stats)
+        self._hash(to_hash, stats, 'sha256', compute_hash)
+        candidates_set = set(candidates)
+        to_hash = set(to_hash)
+
+        # Files get equal keys only if they are identical. None means the
+        # file couldn't be read.
+        def key(filepath):
+            size = stats[filepath].st_size
+            if filepath not in candidates_set:
+                return ('size', size)
+            if filepath not in partial:
+                return None
+            if filepath in to_hash:
+                return ('sha256', full[filepath]) if filepath in full else None
+            return ('partial', size, partial[filepath])
+
+        seen = {key(filepath) for filepath in candidates if filepath in self._stats}
+        unique = []
+        for filepath in files:
+            if filepath not in stats:
+                continue
+            file_key = key(filepath)
+            if file_key is None or file_key in seen:
+                continue
+            seen.add(file_key)
+            unique.append(filepath)
+            self._kept[stats[filepath].st_size].append(filepath)
+            self._stats[filepath] = stats[filepath]
+
+        # Only kept files can be compared against later
+        for filepath in candidates:
+            if filepath not in self._stats:
+                partial.pop(filepath, None)
+                full.pop(filepath, None)
+
+        self.unique_count += len(unique)
+        return unique
+
+
 def get_exif_date(filepath: Path) -> datetime | None:
     """Try to get date from EXIF data."""
     if not HAS_PIL:
@@ -117,52 +667,78 @@ def get_file_date(filepath: Path) -> tuple[datetime, str]:
         return datetime.now(), 'now'
 
 
-def should_exclude(filepath: Path) -> bool:
-    """Check if a path should be excluded from scanning."""
-    path_str = str(filepath)
+def _is_excluded_name(name: str) -> bool:
+    """Check if a file or directory name matches any exclude pattern."""
     for pattern in EXCLUDE_PATTERNS:
-        if pattern in path_str:
+        if pattern in name:
             return True
     return False
 
 
-def find_photos(root_path: Path) -> list[Path]:
-    """Find all photo files in directory tree."""
-    photos = []
-    for ext in PHOTO_EXTENSIONS:
-        # Case-insensitive search using glob
-        photos.extend(root_path.rglob(f"*{ext}"))
-        photos.extend(root_path.rglob(f"*{ext.upper()}"))
+def iter_photos(root_path: Path):
+    """
+    Yield photo files under root_path as they are found, in sorted order.
+
+    Walks the tree once with os.scandir. Excluded directories are pruned
+    before descending into them, and symlinked directories are not followed.
+    Extensions are matched case-insensitively.
+
+    Args:
+        root_path: Directory to walk
 
-    # Filter out excluded paths and dedupe (since we search both cases)
-    seen = set()
-    filtered = []
-    for p in photos:
-        if p in seen:
+    Yields:
+        Path of each photo, in the same order as sorted() would give
+    """
+    try:
+        with os.scandir(root_path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError as e:
+        print(f"Error reading {root_path}: {e}", file=sys.stderr)
+        return
+
+    for entry in entries:
+        if _is_excluded_name(entry.name):
             continue
-        seen.add(p)
-        if not should_exclude(p):
-            filtered.append(p)
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_photos(Path(entry.path))
+            elif (os.path.splitext(entry.name)[1].lower() in PHOTO_EXTENSIONS
+                    and entry.is_file()):
+                yield Path(entry.path)
+        except OSError:
+            continue
+
 
-    return sorted(filtered)
+def _scaled_size(size: tuple[int, int], max_size: int) -> tuple[int, int] | None:
+    """Return size scaled down to fit max_size, or None if it already fits."""
+    width, height = size
+    ratio = min(max_size / width, max_size / height)
+    if ratio < 1:
+        return int(width * ratio), int(height * ratio)
+    return None
 
 
-def resize_image_task(task: tuple) -> tuple[str, bool]:
+def resize_image_task(task: tuple) -> list[tuple[str, bool]]:
     """
     Worker function for parallel thumbnail generation.
 
+    Decodes the source once and writes every requested size from it, largest
+    first, each one resized from the previous. JPEGs at least twice the
+    largest size are decoded at a reduced scale (see Image.draft).
+
     Args:
-        task: (src_path, dest_path, max_size) tuple
+        task: (src_path, [(dest_path, max_size), ...]) tuple
 
     Returns:
-        (dest_path, success) tuple
+        List of (dest_path, success) tuples
     """
-    src_path, dest_path, max_size = task
+    src_path, targets = task
     src_path = Path(src_path)
-    dest_path = Path(dest_path)
+    targets = sorted(targets, key=lambda t: t[1], reverse=True)
+    failed = [(str(dest_path), False) for dest_path, _ in targets]
 
-    if not HAS_PIL:
-        return str(dest_path), False
+    if not HAS_PIL or not targets:
+        return failed
 
     try:
         with Image.open(src_path) as img:
@@ -171,7 +747,14 @@ def resize_image_task(task: tuple) -> tuple[str, bool]:
                 try:
                     import pillow_heif
                 except ImportError:
-                    return str(dest_path), False
+                    return failed
+
+            # JPEGs can be decoded at 1/2, 1/4 or 1/8 scale. Draft picks the
+            # smallest one that still covers the largest size. Output sizes
+            # are computed from the full size, so they don't depend on it.
+            full_size = img.size
+            largest = targets[0][1]
+            img.draft(None, (largest, largest))
 
             # Convert to RGB if necessary
             if img.mode in ('RGBA', 'P', 'LA'):
@@ -179,23 +762,35 @@ def resize_image_task(task: tuple) -> tuple[str, bool]:
             elif img.mode != 'RGB':
                 img = img.convert('RGB')
 
-            # Calculate new size preserving aspect ratio
-            ratio = min(max_size / img.width, max_size / img.height)
-            if ratio < 1:
-                new_size = (int(img.width * ratio), int(img.height * ratio))
-                img = img.resize(new_size, Image.LANCZOS)
+            results = []
+            for dest_path, max_size in targets:
+                dest_path = Path(dest_path)
+                new_size = _scaled_size(full_size, max_size)
+                if new_size:
+                    img = img.resize(new_size, Image.LANCZOS, reducing_gap=3.0)
 
-            # Save with optimization
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-            img.save(dest_path, 'JPEG', quality=QUALITY, optimize=True)
-            return str(dest_path), True
+                # Save with optimization. The image is renamed into place,
+                # so an interrupted scan doesn't leave a truncated one.
+                try:
+                    dest_path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = dest_path.with_name(dest_path.name + ".tmp")
+                    img.save(tmp_path, 'JPEG', quality=QUALITY, optimize=True)
+                    os.replace(tmp_path, dest_path)
+                    results.append((str(dest_path), True))
+                except Exception:
+                    results.append((str(dest_path), False))
+            return results
     except Exception as e:
-        return str(dest_path), False
+        return failed
+
 
+def read_file_date(filepath: Path) -> tuple[Path, tuple[datetime, str]]:
+    """Worker function for get_file_date. Returns (filepath, (date, source))."""
+    return filepath, get_file_date(filepath)
 
-def generate_date_filename(filepath: Path, date_counts: dict) -> str:
-    """Generate a date-based filename for a photo."""
-    file_date, _ = get_file_date(filepath)
+
+def date_filename(file_date: datetime, date_counts: dict) -> str:
+    """Generate a date-based filename, numbering photos with the same date."""
     date_str = file_date.strftime("%Y-%m-%d_%H%M%S")
     date_counts[date_str] += 1
 
@@ -205,6 +800,37 @@ def generate_date_filename(filepath: Path, date_counts: dict) -> str:
         return f"{date_str}_{date_counts[date_str]}.jpg"
 
 
+def pool_chunksize(count: int, num_workers: int) -> int:
+    """Chunk size for pool.imap that gives each worker a few chunks."""
+    return max(1, min(64, count // (num_workers * 4)))
+
+
+def batched(iterable, size: int):
+    """Yield lists of up to size items from iterable."""
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def record_resizes(results, journal: ScanJournal, index) -> int:
+    """
+    Journal and index the finished images from an iterator over
+    resize_image_task results.
+
+    Returns:
+        Number of images that failed
+    """
+    fail_count = 0
+    for task_results in results:
+        for dest_path, success in task_results:
+            if success:
+                journal.append({'resized': dest_path})
+                index.image_done(dest_path)
+            else:
+                fail_count += 1
+    return fail_count
+
+
 def get_cpu_count() -> int:
     """Get number of CPUs to use for parallel processing."""
     try:
@@ -215,7 +841,8 @@ def get_cpu_count() -> int:
 
 
 def scan(directory: str, dedupe: str = "", copy_to: str = "",
-         gallery_dir: str = "", force: str = "", title: str = ""):
+         gallery_dir: str = "", force: str = "", title: str = "",
+         sqlite: str = ""):
     """
     Scan directory for photos and generate gallery data.
 
@@ -226,10 +853,13 @@ def scan(directory: str, dedupe: str = "", copy_to: str = "",
         gallery_dir: Where to put .gallery data (defaults to directory or copy_to)
         force: If "True", regenerate thumbnails even if they exist
         title: Gallery title (defaults to directory name)
+        sqlite: If "True", keep the index in .gallery/photos.db and export
+            photos.json from it
     """
     # Convert string bools from bash
     dedupe_flag = dedupe.lower() == "true" if dedupe else False
     force_flag = force.lower() == "true" if force else False
+    sqlite_flag = sqlite.lower() == "true" if sqlite else False
 
     if not HAS_PIL:
         print("Warning: PIL not available, thumbnails will not be generated", file=sys.stderr)
@@ -246,12 +876,12 @@ def scan(directory: str, dedupe: str = "", copy_to: str = "",
     print(f"Using {num_workers} worker processes")
 
     print(f"Scanning for photos in {root_path}...")
-    photos = find_photos(root_path)
-    print(f"Found {len(photos)} photo files")
-
-    if not photos:
+    photos = iter_photos(root_path)
+    first_photo = next(photos, None)
+    if first_photo is None:
         print("No photos found.")
         return 0
+    photos = itertools.chain([first_photo], photos)
 
     # Determine where to put gallery data
     if copy_to:
@@ -271,136 +901,188 @@ def scan(directory: str, dedupe: str = "", copy_to: str = "",
 
     # Load existing gallery data to avoid re-scanning known files
     json_path = gallery_path / "photos.json"
-    existing_photos = {}  # original_path -> photo_data
-    existing_title = None
-    if json_path.exists() and not force_flag:
-        try:
-            with open(json_path) as f:
-                existing_data = json.load(f)
-            if isinstance(existing_data, dict):
-                existing_title = existing_data.get('title')
-                for photo in existing_data.get('photos', []):
-                    existing_photos[photo['original_path']] = photo
-            print(f"Loaded {len(existing_photos)} existing entries from gallery index")
-        except Exception as e:
-            print(f"Warning: Could not load existing gallery data: {e}", file=sys.stderr)
-
-    # Deduplicate if requested (parallel hashing)
+    if sqlite_flag:
+        index = SqliteIndex(gallery_path / SQLITE_INDEX_NAME, json_path, load=not force_flag)
+    else:
+        index = JsonIndex(json_path, load=not force_flag)
+
+    # Resume from the journal of an interrupted scan with the same options
+    journal = ScanJournal(gallery_path / JOURNAL_NAME, {
+        'directory': str(root_path),
+        'copy_to': str(copy_path) if copy_path else None,
+        'dedupe': dedupe_flag,
+        'force': force_flag,
+    })
+    resumed_photos = journal.photos
+    if resumed_photos or journal.resized:
+        print(f"Resuming interrupted scan: {len(resumed_photos)} photos and "
+              f"{len(journal.resized)} images already done")
+
+    # Photos stream through the pipeline in batches: discovery, dedupe, date
+    # extraction and resizing. Resizing runs in its own pool, so a batch is
+    # resized while the next one is walked, hashed and read, without those
+    # tasks queueing behind the resizes. Walking stops while more than
+    # MAX_PENDING_BATCHES batches are waiting to be resized. Files whose size,
+    # mtime and inode match the hash cache are not read again for dedupe.
+    print("\nProcessing photos...")
+    cache = None
     if dedupe_flag:
-        print("\nComputing hashes for deduplication...")
-        with multiprocessing.Pool(num_workers) as pool:
-            results = list(progress_wrapper(
-                pool.imap(compute_hash, photos),
-                desc="Hashing",
-                total=len(photos)
-            ))
-
-        hash_to_files = defaultdict(list)
-        for filepath, file_hash in results:
-            if file_hash:
-                hash_to_files[file_hash].append(filepath)
-
-        unique_count = len(hash_to_files)
-        dupe_count = len(photos) - unique_count
-        print(f"Found {unique_count} unique photos ({dupe_count} duplicates)")
-        photos = [files[0] for files in hash_to_files.values()]
-
-    # Process photos - collect metadata and prepare resize tasks
-    print("\nCollecting photo metadata...")
-    photo_data = []
+        if sqlite_flag:
+            cache = SqliteHashCache(index.db, load=not force_flag, journal=journal)
+        else:
+            cache = HashCache(gallery_path / HASH_CACHE_NAME, load=not force_flag, journal=journal)
+        for path, key, kind, file_hash in journal.hashes:
+            cache.restore(path, key, kind, file_hash)
     date_counts = defaultdict(int)
-    resize_tasks = []  # (src, dest, size) tuples
+    found_count = 0
     new_count = 0
     skipped_count = 0
-
-    for filepath in progress_wrapper(photos, desc="Metadata"):
-        # Compute the original_path to check if already indexed
-        if copy_path:
-            # When copying, we need to generate the filename first to know the path
-            gallery_filename = generate_date_filename(filepath, date_counts)
-            dest_path = copy_path / gallery_filename
-            original_path = str(dest_path.relative_to(gallery_base))
-            source_for_resize = dest_path
-        else:
-            original_path = str(filepath.relative_to(gallery_base))
-            source_for_resize = filepath
-            gallery_filename = None  # Will get from existing or generate
-
-        # Check if this file is already indexed
-        if original_path in existing_photos and not force_flag:
-            # Use existing metadata
-            photo_entry = existing_photos[original_path]
-            photo_data.append(photo_entry)
-            gallery_filename = photo_entry['filename']
-            skipped_count += 1
-        else:
-            # New file - collect metadata
-            if gallery_filename is None:
-                gallery_filename = generate_date_filename(filepath, date_counts)
-
+    image_count = 0
+    fail_count = 0
+    pending = deque()  # Iterators over resize results, oldest first
+
+    with multiprocessing.Pool(num_workers) as pool, \
+            multiprocessing.Pool(num_workers) as resize_pool:
+        deduper = Deduper(pool, cache, num_workers) if dedupe_flag else None
+        for batch in batched(progress_wrapper(photos, desc="Scanning"), SCAN_BATCH_SIZE):
+            found_count += len(batch)
+            if deduper:
+                batch = deduper.add(batch)
+
+            # Read dates in parallel, once per file. Indexed and resumed files
+            # only need one when copying, because the name of the copy
+            # depends on it.
             if copy_path:
-                try:
-                    shutil.copy2(filepath, dest_path)
-                except Exception as e:
-                    print(f"Error copying {filepath}: {e}", file=sys.stderr)
-                    continue
-
-            file_date, date_source = get_file_date(filepath)
-            photo_data.append({
-                'filename': gallery_filename,
-                'original_path': original_path,
-                'date': file_date.isoformat(),
-                'date_source': date_source,
-            })
-            new_count += 1
-
-        # Always check for missing thumbnails (even for existing entries)
-        thumb_path = thumb_dir / gallery_filename
-        mid_path = mid_dir / gallery_filename
-
-        if force_flag or not thumb_path.exists():
-            resize_tasks.append((str(source_for_resize), str(thumb_path), THUMB_SIZE))
-
-        if force_flag or not mid_path.exists():
-            resize_tasks.append((str(source_for_resize), str(mid_path), MID_SIZE))
+                to_read = batch
+            else:
+                to_read = []
+                for filepath in batch:
+                    original_path = str(filepath.relative_to(gallery_base))
+                    if original_path in resumed_photos:
+                        continue
+                    if index.get(original_path):
+                        continue
+                    to_read.append(filepath)
+            file_dates = dict(pool.imap_unordered(
+                read_file_date, to_read,
+                chunksize=pool_chunksize(len(to_read), num_workers)
+            ))
+
+            # Assign filenames and prepare resize tasks in order, so that
+            # numbering of photos with the same date is deterministic
+            resize_tasks = []  # (src, [(dest, size), ...]) tuples
+            for filepath in batch:
+                # Compute the original_path to check if already indexed
+                if copy_path:
+                    # When copying, we need to generate the filename first to know the path
+                    gallery_filename = date_filename(file_dates[filepath][0], date_counts)
+                    dest_path = copy_path / gallery_filename
+                    original_path = str(dest_path.relative_to(gallery_base))
+                    source_for_resize = dest_path
+                else:
+                    original_path = str(filepath.relative_to(gallery_base))
+                    source_for_resize = filepath
+                    gallery_filename = None  # Will get from existing or generate
+
+                # Check if this file is already indexed
+                indexed = index.get(original_path)
+                if indexed:
+                    # Use existing metadata
+                    photo_entry = indexed
+                    index.add(photo_entry, indexed)
+                    gallery_filename = photo_entry['filename']
+                    skipped_count += 1
+                elif original_path in resumed_photos:
+                    # Done by the interrupted scan, including any copy
+                    photo_entry = resumed_photos[original_path]
+                    index.add(photo_entry)
+                    gallery_filename = photo_entry['filename']
+                    if not copy_path:
+                        # Count the date like the interrupted scan did, so
+                        # the following photos get the same names
+                        date_filename(datetime.fromisoformat(photo_entry['date']), date_counts)
+                    new_count += 1
+                else:
+                    # New file - collect metadata
+                    file_date, date_source = file_dates[filepath]
+                    if gallery_filename is None:
+                        gallery_filename = date_filename(file_date, date_counts)
+
+                    if copy_path:
+                        try:
+                            shutil.copy2(filepath, dest_path)
+                        except Exception as e:
+                            print(f"Error copying {filepath}: {e}", file=sys.stderr)
+                            continue
+
+                    photo_entry = {
+                        'filename': gallery_filename,
+                        'original_path': original_path,
+                        'date': file_date.isoformat(),
+                        'date_source': date_source,
+                    }
+                    index.add(photo_entry)
+                    journal.append({'photo': photo_entry})
+                    new_count += 1
+
+                # Check for missing thumbnails, even for existing entries.
+                # index.needs_image looks on disk in JSON mode, while the
+                # SQLite index trusts the images it has recorded.
+                thumb_path = thumb_dir / gallery_filename
+                mid_path = mid_dir / gallery_filename
+
+                targets = []
+                for dest_path, size in ((thumb_path, THUMB_SIZE), (mid_path, MID_SIZE)):
+                    if str(dest_path) in journal.resized:
+                        continue
+                    if force_flag or index.needs_image(photo_entry, dest_path):
+                        targets.append((str(dest_path), size))
+
+                if targets:
+                    resize_tasks.append((str(source_for_resize), targets))
+
+            # Resize one task per photo for all its sizes, in the background
+            if resize_tasks:
+                image_count += sum(len(targets) for _, targets in resize_tasks)
+                pending.append(resize_pool.imap_unordered(resize_image_task, resize_tasks))
+            while len(pending) > MAX_PENDING_BATCHES:
+                fail_count += record_resizes(pending.popleft(), journal, index)
+            journal.sync()
+
+        while pending:
+            fail_count += record_resizes(pending.popleft(), journal, index)
+
+    if cache:
+        cache.save()
+
+    print(f"Found {found_count} photo files")
+    if deduper:
+        dupe_count = deduper.seen_count - deduper.unique_count
+        print(f"Found {deduper.unique_count} unique photos ({dupe_count} duplicates)")
+        print(f"  {deduper.candidate_count} files shared a size, "
+              f"{deduper.hashed_count} needed a full hash")
 
     if skipped_count > 0:
         print(f"  Skipped {skipped_count} already-indexed files, found {new_count} new files")
 
-    # Generate thumbnails in parallel
-    if resize_tasks:
-        print(f"\nGenerating {len(resize_tasks)} thumbnail/mid-size images...")
-        with multiprocessing.Pool(num_workers) as pool:
-            results = list(progress_wrapper(
-                pool.imap(resize_image_task, resize_tasks),
-                desc="Resizing",
-                total=len(resize_tasks)
-            ))
-
-        success_count = sum(1 for _, success in results if success)
-        fail_count = len(results) - success_count
+    if image_count:
+        print(f"Generated {image_count} thumbnail/mid-size images")
         if fail_count > 0:
             print(f"  {fail_count} images failed to process", file=sys.stderr)
     else:
-        print("\nAll thumbnails already exist, skipping generation.")
-
-    # Sort by date
-    photo_data.sort(key=lambda x: x['date'])
+        print("All thumbnails already exist, skipping generation.")
 
     # Default title to: provided title > existing title > directory name
-    gallery_title = title if title else (existing_title if existing_title else root_path.name)
+    gallery_title = title if title else (index.title if index.title else root_path.name)
 
-    # Write JSON index
-    json_path = gallery_path / "photos.json"
-    gallery_data = {
-        'title': gallery_title,
-        'photos': photo_data,
-    }
-    with open(json_path, 'w') as f:
-        json.dump(gallery_data, f, indent=2)
+    # Write the index, then drop the journal it now contains
+    index.commit(gallery_title)
+    journal.compact()
 
     print(f"\nGallery data written to: {gallery_path}")
-    print(f"  Photos indexed: {len(photo_data)}")
+    print(f"  Photos indexed: {len(index)}")
+    if sqlite_flag:
+        print(f"  SQLite index: {gallery_path / SQLITE_INDEX_NAME}")
     print(f"  JSON index: {json_path}")
     print(f"  Thumbnails: {thumb_dir}")
     print(f"  Mid-size: {mid_dir}")
@@ -541,7 +541,7 @@ tqdm"
 # .gallery hidden directory. The original photos can either be left in place
 # (referenced by path) or copied to a new directory with date-based names.
 #
-# Usage: net_gallery [--dedupe] [--copy-to DIR] [--scan-only] [--serve-only] [--force] [--clean] [--title TITLE] [-l|--port PORT] [-u|--username USER] [-P|--password PASS] [-C|--certfile FILE] [--keyfile FILE] [DIR]
+# Usage: net_gallery [--dedupe] [--copy-to DIR] [--scan-only] [--serve-only] [--force] [--clean] [--sqlite] [--title TITLE] [-l|--port PORT] [-u|--username USER] [-P|--password PASS] [-C|--certfile FILE] [--keyfile FILE] [DIR]
 #
 # Options:
 #   --dedupe              Deduplicate photos by hash before indexing.
@@ -553,6 +553,10 @@ tqdm"
 #   --force               Regenerate thumbnails even if they exist.
 #   --clean               Delete all generated gallery files (.gallery/ and
 #                         gallery.html) and exit.
+#   --sqlite              Keep the index in .gallery/photos.db and only update
+#                         changed photos. photos.json is exported from it.
+#                         Thumbnails it has recorded aren't checked again, so
+#                         use --force if they were deleted.
 #   --title TITLE         Gallery title. Defaults to the directory name.
 #   -l, --port PORT       Port to serve on. Default is 8080.
 #   -u, --username USER   Username for basic auth.
@@ -576,6 +580,7 @@ function net_gallery() {
     local force=""
     local clean=""
     local serve_only=""
+    local sqlite=""
     local title=""
     local username=""
     local password=""
@@ -603,6 +608,9 @@ function net_gallery() {
             --clean)
                 clean="True"
                 ;;
+            --sqlite)
+                sqlite="True"
+                ;;
             --title)
                 title="${2}"
                 shift
@@ -692,6 +700,7 @@ function net_gallery() {
             --gallery_dir "${gallery_dir}" \
             --force "${force}" \
             --title "${title}" \
+            --sqlite "${sqlite}" \
             || return $?
     fi
 
@@ -39,16 +39,50 @@ function __fix_stupid_virtualenv_behavior() {
     popd
 }
 
+# Prints the checksum of requirements.txt in the current directory, or "none".
+function __python_requirements_sum() {
+    if [[ -f requirements.txt ]]; then
+        cksum < requirements.txt
+    else
+        echo none
+    fi
+}
+
+# Usage: __python_venv_stamp PYTHONPATH REQUIREMENTS_SUM
+#
+# Marks ./.venv as ready: pip works and requirements.txt with this checksum is
+# installed.
+function __python_venv_stamp() {
+    printf "%s\n%s\n" "$1" "$2" > ./.venv/redshell_ready
+}
+
+# Prints the interpreter of ./.venv: the python it links to, if it's an absolute
+# link (as __fix_stupid_virtualenv_behavior makes it), or else its own python.
+function __python_venv_interpreter() {
+    local target="$(readlink ./.venv/bin/python)"
+    if [[ "${target}" == /* ]]; then
+        echo "${target}"
+    else
+        echo "$(pwd)/.venv/bin/python"
+    fi
+}
+
 # Usage: python_venv [-I|--install-requirements] [-p|--python-path PATH] [-q|--quiet] [VERSION]
 #
 # Create a new virtualenv in the current directory, using the latest available
 # python version. If a virtualenv already exists, activate it. If -I is passed,
 # install requirements.txt. If -p is passed, use the specified Python binary. If
 # VERSION is passed, find a python binary with that version.
+#
+# Once a virtualenv is set up, python_venv stamps it with the interpreter path
+# and the checksum of requirements.txt (in .venv/redshell_ready). While neither
+# changes, later calls just activate it, without probing pip or installing
+# anything. If requirements.txt changes, it's installed again. If installing
+# it fails, the virtualenv isn't stamped and python_venv returns non-zero.
 function python_venv() {
     local install_reqs=""
     local stderr=/dev/stderr
-    local pythonpath="$(python_latest)"
+    local pythonpath=""
 
     while [[ "${#}" -ne 0 ]]; do
         case "$1" in
@@ -68,6 +102,22 @@ function python_venv() {
         esac
         shift
     done
+
+    local reqs_sum="$(__python_requirements_sum)"
+    local stamp_python=""
+    local stamp_sum=""
+    if [[ -f ./.venv/redshell_ready ]]; then
+        { read -r stamp_python; read -r stamp_sum; } < ./.venv/redshell_ready
+        # -I always installs, so it can't take the fast path.
+        if [[ -z "${install_reqs}" && -x "${stamp_python}" && "${stamp_sum}" == "${reqs_sum}" \
+            && ( -z "${pythonpath}" || "${pythonpath}" == "${stamp_python}" ) ]]; then
+            echo "Activating ready environment (${stamp_python})" >$stderr
+            source ./.venv/bin/activate
+            return 0
+        fi
+    fi
+
+    [[ -z "${pythonpath}" ]] && pythonpath="$(python_latest)"
     echo "Using Python: ${pythonpath}" >$stderr
 
     # Ensure PIP is installed.
@@ -77,9 +127,15 @@ function python_venv() {
     if [[ -d "./.venv" ]]; then
         echo "Activating existing environment" >$stderr
         source ./.venv/bin/activate
-        if [[ -n "${install_reqs}" ]]; then
-            pip install --upgrade -r "${install_reqs}" 2> $stderr
+        # Also install requirements.txt if it changed since the last stamp,
+        # or if there is no stamp to say it was installed.
+        if [[ -n "${install_reqs}" \
+            || ( "${stamp_sum}" != "${reqs_sum}" && "${reqs_sum}" != none ) ]]; then
+            pip install --upgrade -r requirements.txt 2> $stderr || return 4
         fi
+        # The venv may predate this call, and use another python than the
+        # one picked above.
+        __python_venv_stamp "$(__python_venv_interpreter)" "${reqs_sum}"
         return 0
     fi
 
@@ -98,8 +154,11 @@ function python_venv() {
     __fix_stupid_virtualenv_behavior "${pythonpath}" "$(pwd)/.venv" 2> $stderr || return $?
     source ./.venv/bin/activate
     pip install --upgrade pip 2> $stderr
-    [[ -f requirements.txt ]] && pip install --upgrade -r requirements.txt 2> $stderr
     echo "Virtualenv created" >$stderr
+    if [[ -f requirements.txt ]]; then
+        pip install --upgrade -r requirements.txt 2> $stderr || return 4
+    fi
+    __python_venv_stamp "${pythonpath}" "${reqs_sum}"
 }
 
 alias venv=python_venv
@@ -209,7 +268,40 @@ function python_latest() {
     fi
 }
 
-# Usage: python_func -f|--function FUNCTION -p|--path PATH [-J|--json_output] [--clean] [--debug] [--quiet] [--no-venv] [--] [ARGS...]
+# Prints the current time in seconds, with microseconds.
+function __python_now() {
+    [[ -n "${_REDSHELL_ZSH}" ]] && zmodload zsh/datetime
+    echo "${EPOCHREALTIME:-$(date +%s)}"
+}
+
+# Usage: __python_func_worker EXE MODULE SCRIPT
+#
+# Runs SCRIPT in the python_worker.py worker for EXE and the current directory,
+# starting the worker if it's not running.
+function __python_func_worker() {
+    local exe="$(command -v "$1")"
+    local dir="${HOME}/.redshell_persist/python_workers"
+    local key="$(printf '%s\n%s\n' "${exe}" "${PWD}" | cksum | cut -d' ' -f1)"
+    # Anyone who can connect to a worker can run code as this user, so only
+    # this user may reach its socket.
+    mkdir -p -m 700 "${dir}" || return 1
+    if [[ ! -O "${dir}" ]]; then
+        >&2 echo "${dir} is not owned by $(id -un), not starting a worker"
+        return 1
+    fi
+    chmod 700 "${dir}" || return 1
+    "${exe}" -S "${HOME}/.redshell/src/python_worker.py" \
+        call "${dir}/${key}.sock" "$2" "$3"
+}
+
+# Usage: python_func_stop_workers
+#
+# Stops all python_func --daemon workers.
+function python_func_stop_workers() {
+    pkill -f "python_worker.py serve"
+}
+
+# Usage: python_func -f|--function FUNCTION -p|--path PATH [-J|--json_output] [--clean] [--debug] [--quiet] [--no-venv] [-D|--daemon] [-B|--batch] [--profile] [--pstats FILE] [--] [ARGS...]
 #
 # Run a Python function from a file. Calls `q python venv` to setup the
 # environment. The function must be defined in the file and must be a top-level
@@ -229,6 +321,39 @@ function python_latest() {
 # --debug: Print the Python script that was executed.
 # --quiet: Do not print any output from the virtualenv creation.
 # --no-venv: Do not create a virtualenv.
+# -D|--daemon: Run the function in a persistent worker process (see below).
+# -B|--batch: Read calls as JSON Lines from stdin (see below).
+# --profile: Print where the time went (see below).
+# --pstats FILE: Also save the cProfile data to FILE. Implies --profile.
+#
+# If the function returns a generator or another iterator, each item is printed
+# as soon as it's produced, and with --json-output, each is one JSON line.
+#
+# With --daemon, or if ~/.redshell_persist/python_daemon exists, the call goes
+# to a worker that keeps the module imported between calls (python_worker.py).
+# There is one worker per interpreter and directory, started on first use and
+# stopped after 30 minutes without calls. The worker reloads the module if the
+# file changed. Arguments and output work the same as without it.
+#
+# With --batch, each line of stdin is one call, as a JSON object:
+#
+#   {"function": "NAME", "args": [...], "kwargs": {...}, "id": ...}
+#
+# All calls run in one interpreter, in order. For each call, one JSON line is
+# printed as soon as it returns: {"ok": true, "result": ...} or {"ok": false,
+# "error": "..."}, with the call's "id" if it had one. A failed call doesn't
+# stop the batch. "function" defaults to FUNCTION. String arguments are
+# converted like command-line arguments; other JSON values are passed as-is.
+#
+# Example:
+#   printf '%s\n' '{"args": ["a.bash", "/"]}' '{"args": ["b.bash", "/"]}' \
+#       | python_func -p quick.py --no-venv --batch path_to_package
+#
+# With --profile, python_func prints a breakdown to stderr after the call: the
+# time spent checking the venv, starting the interpreter, importing the module
+# and running the call, a cProfile report of the call, and the slowest imports
+# of the module (measured in a separate, fresh interpreter with
+# -X importtime). Load the --pstats file with python -m pstats FILE.
 function python_func() {
     local function
     local json_out="False"
@@ -239,6 +364,11 @@ function python_func() {
     local debug
     local quiet
     local use_venv="1"
+    local daemon
+    local batch
+    local profile
+    local pstats_out
+    [[ -f "${HOME}/.redshell_persist/python_daemon" ]] && daemon="True"
 
     while [[ "${#}" -ne 0 ]]; do
         case "$1" in
@@ -265,6 +395,21 @@ function python_func() {
             --no-venv)
                 use_venv=""
                 ;;
+            -D|--daemon)
+                daemon="True"
+                ;;
+            -B|--batch)
+                batch="True"
+                ;;
+            --profile)
+                profile="True"
+                ;;
+            --pstats)
+                profile="True"
+                pstats_out="$2"
+                [[ "${pstats_out}" == /* ]] || pstats_out="${PWD}/${pstats_out}"
+                shift
+                ;;
             --)
                 shift
                 break;
@@ -291,7 +436,7 @@ function python_func() {
     kwargs+="}"
     args+="]"
 
-    if [[ -z "${function}" ]]; then
+    if [[ -z "${function}" && -z "${batch}" ]]; then
         >&2 echo "No function specified"
         return 1
     fi
@@ -303,6 +448,8 @@ function python_func() {
 
     pushd "$(dirname "${_path}")" > /dev/null
 
+    local venv_started venv_done
+    [[ -n "${profile}" ]] && venv_started="$(__python_now)"
     if [[ -n "${use_venv}" ]]; then
         if [[ -n "${quiet}" ]]; then
             python_venv --quiet
@@ -310,19 +457,36 @@ function python_func() {
             python_venv
         fi
     fi
+    [[ -n "${profile}" ]] && venv_done="$(__python_now)"
+
+    # With --profile, the script records when it started and when the imports
+    # were done, and reports the rest at exit.
+    local profile_head=""
+    local profile_imported=""
+    if [[ -n "${profile}" ]]; then
+        profile_head="import time as __profile_time
+__profile_started = __profile_time.time()
+"
+        profile_imported="__profile_imported = __profile_time.time()
+"
+    fi
 
     trap "trap - INT" INT
-    script="from $(basename "${_path}" .py) import *
+    script="${profile_head}from $(basename "${_path}" .py) import *
 import typing
 import shlex
 import datetime
-kwargs = ${kwargs}
+import json
+from collections.abc import Iterator
+${profile_imported}kwargs = ${kwargs}
 args = ${args}
 json_out = ${json_out}
 
 def __convert_arg(
     arg: str, arg_type: typing.Any
 ) -> typing.Any:
+    if not isinstance(arg, str):
+        return arg
     try:
         if arg_type is None:
             return arg
@@ -371,15 +535,104 @@ def __convert_args(
     for arg_name, arg in kwargs.items():
         converted_args[arg_name] = __convert_arg(arg, hints.get(arg_name))
     return converted_args
-
+"
+    if [[ -n "${profile}" ]]; then
+        script+="
+import atexit
+import cProfile
+import pstats
+import sys
+
+__profiler = cProfile.Profile()
+
+def __profile_report() -> None:
+    __profiler.disable()
+    done = __profile_time.time()
+    phases = [
+        ('venv check', ${venv_done} - ${venv_started}),
+        ('interpreter startup', __profile_started - __PROFILE_LAUNCHED),
+        ('imports', __profile_imported - __profile_started),
+        ('call', done - __profile_call_started),
+    ]
+    sys.stdout.flush()
+    sys.stderr.write('\npython_func profile of ${function} (${_path}):\n')
+    for name, seconds in phases:
+        sys.stderr.write('  {:<22}{:>10.1f} ms\n'.format(name, seconds * 1000))
+    sys.stderr.write('\ncProfile of the call, by cumulative time:\n')
+    stats = pstats.Stats(__profiler, stream=sys.stderr)
+    stats.sort_stats('cumulative').print_stats(25)
+    if r'${pstats_out}':
+        stats.dump_stats(r'${pstats_out}')
+        sys.stderr.write('Saved cProfile data to ${pstats_out}\n')
+
+atexit.register(__profile_report)
+__profile_call_started = __profile_time.time()
+__profiler.enable()
+"
+    fi
+    if [[ -n "${batch}" ]]; then
+        script+="
+import sys
+import traceback
+
+def __shell_quote(arg: typing.Any, arg_type: typing.Any) -> typing.Any:
+    # Strings for str and list[str] parameters are quoted like the shell quotes
+    # command-line arguments, since only those are shlex.split on conversion.
+    if typing.get_origin(arg_type) == typing.Union:
+        type_args = [t for t in typing.get_args(arg_type) if t != type(None)]
+        if len(type_args) == 1:
+            arg_type = type_args[0]
+    if isinstance(arg, str) and arg_type in (str, list[str]):
+        return shlex.quote(arg)
+    return arg
+
+for line in sys.stdin:
+    if not line.strip():
+        continue
+    out = {}
+    try:
+        spec = json.loads(line)
+        if 'id' in spec:
+            out['id'] = spec['id']
+        name = spec.get('function') or '${function}'
+        func = globals().get(name)
+        if not callable(func):
+            raise NameError('name {!r} is not defined'.format(name))
+        hints = typing.get_type_hints(func)
+        arg_names = func.__code__.co_varnames
+        kwargs = __convert_args(
+            func,
+            [__shell_quote(arg, hints.get(arg_names[i]))
+             for i, arg in enumerate(spec.get('args', []))],
+            {k: __shell_quote(v, hints.get(k))
+             for k, v in spec.get('kwargs', {}).items()})
+        res = func(**kwargs)
+        if isinstance(res, Iterator):
+            res = list(res)
+        out.update(ok=True, result=res)
+    except Exception as e:
+        sys.stderr.write(traceback.format_exc()+'\n')
+        out.update(ok=False, error='{}: {}'.format(type(e).__name__, e))
+    print(json.dumps(out, default=__json_default), flush=True)
+"
+    else
+        script+="
 try:
     kwargs = __convert_args(${function}, args, kwargs)
     res = ${function}(**kwargs)
-    if json_out:
-        import json
-        from typing import Generator
-        if isinstance(res, Generator):
-            res = list(res)
+    if isinstance(res, Iterator):
+        # Stream generators and iterators: each item is printed (as one JSON
+        # line with json_out) as soon as it's produced.
+        try:
+            for item in res:
+                if json_out:
+                    item = json.dumps(item, default=__json_default)
+                print(item, flush=True)
+        except BrokenPipeError:
+            # The reader is gone (e.g. head). Stop without an error.
+            import os
+            os.dup2(os.open(os.devnull, os.O_WRONLY), 1)
+    elif json_out:
         print(json.dumps(res, default=__json_default))
     else:
         print(res)
@@ -389,11 +642,24 @@ except Exception as e:
     sys.stderr.write(traceback.format_exc()+'\n')
     sys.exit(1)
 "
+    fi
     local ret
     local exe="python"
     [[ -z "${use_venv}" ]] && exe="$(python_latest)"
-    "${exe}" -c "${script}"
+    [[ -n "${profile}" ]] && script="${script//__PROFILE_LAUNCHED/$(__python_now)}"
+    if [[ -n "${daemon}" ]]; then
+        __python_func_worker "${exe}" "$(basename "${_path}" .py)" "${script}"
+    else
+        "${exe}" -c "${script}"
+    fi
     ret="$?"
+    if [[ -n "${profile}" ]]; then
+        >&2 echo ""
+        >&2 echo "Slowest imports in a fresh interpreter (-X importtime, cumulative us):"
+        "${exe}" -X importtime -c "import $(basename "${_path}" .py)" 2>&1 > /dev/null \
+            | grep '^import time:' | sed 1d | sort -t '|' -k2,2nr | head -n 15 \
+            | awk -F '|' '{ printf "  %10d  %s\n", $2, $3 }' >&2
+    fi
 
     [[ -n "${use_venv}" ]] && deactivate
     if [[ -n "${clean}" ]]; then
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Persistent worker for python_func --daemon.
+
+A worker serves one directory with one interpreter, usually the venv's. It
+keeps the modules that python_func calls into imported, and runs each call in
+a forked child, so calls don't pay for interpreter startup and imports.
+
+The client sends the same script that python_func would run with python -c,
+along with its working directory, environment, and stdin, stdout and stderr
+(passed over the socket with SCM_RIGHTS). The child runs the script with those
+and the worker sends back its exit code. Argument conversion and output are
+therefore exactly the same as without the daemon. A module is reloaded before
+a call if its file has changed. The worker exits after being idle for a while.
+
+Usage:
+    python_worker.py serve SOCKET DIR [IDLE_TIMEOUT]
+    python_worker.py call SOCKET MODULE SCRIPT
+
+The client only needs the standard library and is meant to be run with
+python -S, to keep its own startup short.
+"""
+
+import os
+import socket
+import struct
+import sys
+import time
+
+# Seconds without calls after which a worker exits.
+IDLE_TIMEOUT = 1800
+# How long a client waits for a worker it started to accept connections.
+START_TIMEOUT = 10.0
+
+HEADER = struct.Struct("!I")
+
+
+def _recv_exact(conn: socket.socket, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = conn.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Client disconnected")
+        data += chunk
+    return data
+
+
+class _Worker:
+    def __init__(self, socket_path: str, directory: str, idle_timeout: float):
+        import threading
+
+        self.socket_path = socket_path
+        self.directory = directory
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._active = 0
+        self._mtimes: dict[str, int] = {}
+
+    def _load(self, module: str) -> None:
+        """Imports module, or reloads it if its file changed since last time.
+
+        Errors are ignored: the script imports the module again in the child,
+        which reports them to the client like python -c would.
+        """
+        import importlib
+
+        try:
+            mtime = os.stat(os.path.join(self.directory, module + ".py")).st_mtime_ns
+        except OSError:
+            mtime = 0
+        try:
+            if module not in sys.modules:
+                importlib.import_module(module)
+            elif self._mtimes.get(module) != mtime:
+                importlib.reload(sys.modules[module])
+            self._mtimes[module] = mtime
+        except Exception:
+            sys.modules.pop(module, None)
+            self._mtimes.pop(module, None)
+
+    def _run_child(self, request: dict, fds: list[int]) -> None:
+        """Runs the script in the forked child. Never returns."""
+        import atexit
+        import signal
+        import traceback
+
+        code = 0
+        try:
+            for target, fd in enumerate(fds):
+                os.dup2(fd, target)
+            for fd in fds:
+                os.close(fd)
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+            os.chdir(request["cwd"])
+            os.environ.clear()
+            os.environ.update(request["env"])
+            sys.stdin = open(0, "r", closefd=False)
+            sys.stdout = open(1, "w", buffering=1, closefd=False)
+            sys.stderr = open(2, "w", buffering=1, closefd=False)
+            exec(compile(request["script"], "<string>", "exec"), {"__name__": "__main__"})
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                code = e.code or 0
+            else:
+                sys.stderr.write(f"{e.code}\n")
+                code = 1
+        except KeyboardInterrupt:
+            traceback.print_exc()
+            code = 130
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+        finally:
+            try:
+                # Like python -c, run atexit handlers before exiting.
+                atexit._run_exitfuncs()
+                sys.stdout.flush()
+                sys.stderr.flush()
+            finally:
+                os._exit(code)
+
+    def _handle(self, conn: socket.socket) -> None:
+        import json
+        import signal
+        import threading
+
+        with conn:
+            fds: list[int] = []
+            try:
+                msg, fds, _, _ = socket.recv_fds(conn, HEADER.size, 3)
+                if len(msg) < HEADER.size:
+                    msg += _recv_exact(conn, HEADER.size - len(msg))
+                (size,) = HEADER.unpack(msg)
+                request = json.loads(_recv_exact(conn, size))
+                with self._lock:
+                    self._load(request["module"])
+                    pid = os.fork()
+                if pid == 0:
+                    conn.close()
+                    self._run_child(request, fds)
+            finally:
+                for fd in fds:
+                    os.close(fd)
+
+            # The client sends a byte when it gets SIGINT, and closes the
+            # connection if it dies. Both interrupt the call.
+            done = threading.Event()
+
+            def interrupt() -> None:
+                while not done.is_set():
+                    try:
+                        data = conn.recv(1)
+                    except OSError:
+                        data = b""
+                    if done.is_set():
+                        return
+                    try:
+                        os.kill(pid, signal.SIGINT)
+                    except ProcessLookupError:
+                        return
+                    if not data:
+                        return
+
+            threading.Thread(target=interrupt, daemon=True).start()
+            _, status = os.waitpid(pid, 0)
+            done.set()
+            code = os.waitstatus_to_exitcode(status)
+            if code < 0:
+                code = 128 - code
+            try:
+                conn.sendall(f"{code}\n".encode())
+            except OSError:
+                pass
+
+    def _handle_counted(self, conn: socket.socket) -> None:
+        try:
+            self._handle(conn)
+        except Exception as e:
+            sys.stderr.write(f"python_worker: {e}\n")
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def serve(self) -> None:
+        import threading
+
+        os.chdir(self.directory)
+        sys.path.insert(0, self.directory)
+        # The script python_func generates imports these. Loading them now
+        # saves the time in every child.
+        import datetime
+        import json
+        import shlex
+        import typing
+
+        # Another client might have started a worker at the same time.
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+            return
+        except OSError:
+            pass
+        finally:
+            probe.close()
+
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Create the socket without access for others, so that nobody else can
+        # connect before the chmod.
+        umask = os.umask(0o077)
+        try:
+            server.bind(self.socket_path)
+        finally:
+            os.umask(umask)
+        os.chmod(self.socket_path, 0o600)
+        server.listen(16)
+        server.settimeout(self.idle_timeout)
+        try:
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    with self._lock:
+                        if self._active == 0:
+                            break
+                    continue
+                conn.settimeout(None)
+                with self._lock:
+                    self._active += 1
+                threading.Thread(
+                    target=self._handle_counted, args=(conn,), daemon=True
+                ).start()
+        finally:
+            server.close()
+            try:
+                os.unlink(self.socket_path)
+            except FileNotFoundError:
+                pass
+
+
+def serve(socket_path: str, directory: str, idle_timeout: float = IDLE_TIMEOUT) -> None:
+    """Runs a worker for modules in directory until it's idle for idle_timeout
+    seconds."""
+    _Worker(socket_path, os.path.abspath(directory), idle_timeout).serve()
+
+
+def _connect(socket_path: str) -> socket.socket:
+    """Connects to the worker, starting it first if it's not running."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+        return sock
+    except (FileNotFoundError, ConnectionRefusedError):
+        pass
+
+    import subprocess
+
+    log_path = os.path.splitext(socket_path)[0] + ".log"
+    with open(log_path, "a") as log:
+        subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "serve", socket_path, os.getcwd()],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+        )
+    deadline = time.monotonic() + START_TIMEOUT
+    while True:
+        try:
+            sock.connect(socket_path)
+            return sock
+        except (FileNotFoundError, ConnectionRefusedError):
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Worker didn't start, see {log_path}")
+            time.sleep(0.02)
+
+
+def call(socket_path: str, module: str, script: str) -> int:
+    """Runs script in the worker, with this process's stdio. Returns the exit
+    code of the script."""
+    import json
+
+    request = json.dumps({
+        "module": module,
+        "script": script,
+        "cwd": os.getcwd(),
+        "env": dict(os.environ),
+    }).encode()
+    with _connect(socket_path) as sock:
+        socket.send_fds(sock, [HEADER.pack(len(request))], [0, 1, 2])
+        sock.sendall(request)
+        reply = b""
+        while not reply.endswith(b"\n"):
+            try:
+                chunk = sock.recv(16)
+            except KeyboardInterrupt:
+                sock.sendall(b"I")
+                continue
+            if not chunk:
+                sys.stderr.write("python_worker: worker disconnected\n")
+                return 1
+            reply += chunk
+    return int(reply)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 4 and sys.argv[1] == "serve":
+        serve(sys.argv[2], sys.argv[3], *map(float, sys.argv[4:5]))
+    elif len(sys.argv) == 5 and sys.argv[1] == "call":
+        sys.exit(call(sys.argv[2], sys.argv[3], sys.argv[4]))
+    else:
+        sys.stderr.write(__doc__)
+        sys.exit(2)
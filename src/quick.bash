@@ -12,9 +12,33 @@ source "quick.gen.bash"
 if [[ -z "${_REDSHELL_QUICK}" || -n "${_REDSHELL_RELOAD}" ]]; then
 _REDSHELL_QUICK=1
 
-# Usage: __quick_build_all REDSHELL_PATH [EXTRA_PATH ...]
+# Usage: __quick_build_all [--no-cache] [--jobs N] [--dispatch case|table] [--autoload] [--watch] REDSHELL_PATH [EXTRA_PATH ...]
 function __quick_build_all() {
     [[ -n "${_REDSHELL_ZSH}" ]] && emulate -L ksh
+    local build_args=()
+    local func=build_all
+    while [[ "${1}" == -* ]]; do
+        case "${1}" in
+            --watch)
+                func=watch
+                ;;
+            --no-cache)
+                build_args+=(--cache_path none)
+                ;;
+            --jobs)
+                build_args+=(--workers "${2}")
+                shift
+                ;;
+            --dispatch)
+                build_args+=(--dispatch "${2}")
+                shift
+                ;;
+            --autoload)
+                build_args+=(--autoload True)
+                ;;
+        esac
+        shift
+    done
     local rs_path="${1}"
     local all_paths=()
     while [[ "${#}" -ne 0 ]]; do
@@ -25,12 +49,33 @@ function __quick_build_all() {
     python_func \
         -p "${rs_path}/quick.py" \
         --no-venv \
-        build_all \
+        "${func}" \
         --paths "${paths_arg}" \
-        --output "${rs_path}/quick.gen.bash"
+        --output "${rs_path}/quick.gen.bash" \
+        "${build_args[@]}"
 }
 
-# Usage: quick_rebuild [--src-path PATH] [--skip-extra-paths]
+# Usage: quick_rebuild [--src-path PATH] [--skip-extra-paths] [--no-cache] [-j|--jobs N] [--dispatch STRING] [--autoload] [-w|--watch]
+#
+# Regenerate quick.gen.bash from all modules in src and module_paths.txt. Parsed
+# modules are cached by content hash in ~/.redshell_persist/quick_cache.json, so
+# only changed files are re-parsed. Pass --no-cache to parse everything.
+#
+# With --jobs N, modules are parsed by N processes in parallel (0 means one per
+# CPU). This helps with large module_paths.txt trees.
+#
+# --dispatch table makes q look functions up in an associative array instead of
+# a case statement, which is faster with many modules. (Default: case.)
+#
+# --autoload also generates quick.gen.autoload.sh, with a stub for every
+# function that sources its module on first call. If it exists, bash_profile
+# sources only the stubs, init.bash and quick.bash at startup. Autoload stays on
+# for later rebuilds while ~/.redshell_persist/autoload exists; --autoload
+# creates it, and deleting it turns autoload off on the next rebuild.
+#
+# --watch keeps running and rebuilds whenever a module changes, until
+# interrupted with Ctrl-C. Only changed modules are re-parsed, and generated
+# files are only rewritten if their content changes.
 function quick_rebuild() {
     [[ -n "${_REDSHELL_ZSH}" ]] && emulate -L ksh
     local extra_paths=()
@@ -46,6 +91,9 @@ function quick_rebuild() {
         done < "${HOME}/.redshell_persist/module_paths.txt"
     fi
     local src_path="$(cd ~/.redshell/src && pwd)"
+    local build_args=()
+    local autoload=""
+    [[ -f "${HOME}/.redshell_persist/autoload" ]] && autoload=1
 
     while [[ "${#}" -ne 0 ]]; do
         case "${1}" in
@@ -59,11 +107,112 @@ function quick_rebuild() {
             --skip-extra-paths)
                 local extra_paths=()
                 ;;
+            --no-cache)
+                build_args+=(--no-cache)
+                ;;
+            -j|--jobs)
+                build_args+=(--jobs "${2}")
+                shift
+                ;;
+            --dispatch)
+                build_args+=(--dispatch "${2}")
+                shift
+                ;;
+            --autoload)
+                mkdir -p "${HOME}/.redshell_persist"
+                touch "${HOME}/.redshell_persist/autoload"
+                autoload=1
+                ;;
+            -w|--watch)
+                build_args+=(--watch)
+                ;;
         esac
         shift
     done
+    [[ -n "${autoload}" ]] && build_args+=(--autoload)
 
-    __quick_build_all "${src_path}" "${extra_paths[@]}"
+    __quick_build_all "${build_args[@]}" "${src_path}" "${extra_paths[@]}"
+}
+
+# Usage: quick_search [--index FILE] TERM...
+#
+# Find functions by the words in their name, aliases, argument names and doc
+# comment. Each TERM matches words that start with it, and every TERM must
+# match. Results are ranked by where the terms matched: the name first, then
+# aliases, arguments and the doc comment.
+#
+# Answers from quick.gen.search.tsv, which quick_rebuild writes next to
+# quick.gen.bash, without parsing any modules. (Default index:
+# ~/.redshell/src/quick.gen.search.tsv)
+function quick_search() {
+    [[ -n "${_REDSHELL_ZSH}" ]] && emulate -L ksh
+    local index="${HOME}/.redshell/src/quick.gen.search.tsv"
+    while [[ "${1}" == -* ]]; do
+        case "${1}" in
+            --index)
+                index="${2}"
+                shift
+                ;;
+            *)
+                echo "Unknown argument: ${1}" >&2
+                return 1
+                ;;
+        esac
+        shift
+    done
+    if [[ ! -f "${index}" ]]; then
+        echo "No search index at ${index}. Run q quick rebuild." >&2
+        return 1
+    fi
+
+    # Split the terms the same way quick.py splits the indexed text.
+    local terms=($(echo "$*" | tr '[:upper:]' '[:lower:]' | tr -cs 'a-z0-9' ' '))
+    if [[ "${#terms[@]}" -eq 0 ]]; then
+        echo "Usage: q search TERM..." >&2
+        return 1
+    fi
+
+    # The index is sorted, so grep only passes on the T lines for words with
+    # one of the prefixes, followed by all the D lines.
+    local patterns=(-e $'^D\t')
+    local term
+    for term in "${terms[@]}"; do
+        patterns+=(-e $'^T\t'"${term}")
+    done
+    local results
+    results="$(grep "${patterns[@]}" "${index}" \
+        | awk -F '\t' -v query="${terms[*]}" '
+            BEGIN { n = split(query, q, " "); doc = 0 }
+            $1 == "T" {
+                for (i = 1; i <= n; i++) {
+                    if (index($2, q[i]) != 1) continue
+                    m = split($3, postings, ",")
+                    for (j = 1; j <= m; j++) {
+                        split(postings[j], p, ":")
+                        if (p[2] + 0 > best[i, p[1]] + 0) best[i, p[1]] = p[2]
+                    }
+                }
+                next
+            }
+            {
+                score = 0
+                for (i = 1; i <= n; i++) {
+                    if (!((i, doc) in best)) {
+                        score = 0
+                        break
+                    }
+                    score += best[i, doc]
+                }
+                if (score) printf "%d\t%s\t%s\t%s\n", score, $2, $3, $5
+                doc++
+            }' \
+        | sort -t $'\t' -s -k1,1nr \
+        | awk -F '\t' '{ printf "%-32s %s\n", "q " $2 " " $3, $4 }')"
+    if [[ -z "${results}" ]]; then
+        echo "No functions match: ${terms[*]}" >&2
+        return 1
+    fi
+    echo "${results}"
 }
 
 function q() {
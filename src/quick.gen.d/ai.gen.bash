@@ -0,0 +1,42 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module ai, sourced by __q_load.
+
+function __q_help_ai() {
+  printf '%s' $'Usage: q ai FUNCTION [ARG...]
+AI tools setup and configuration.
+
+Available functions:
+\033[1m  install_claude_config
+\033[0m\033[36m\033[0m    Installs Claude Code configuration files from redshell.
+    
+    Copies skills to ~/.claude/skills and merges settings.json with any existing
+    settings (new keys override existing ones). Only skills listed in
+    _REDSHELL_CLAUDE_SKILLS are deleted/overwritten; other skills are preserved.
+\033[1m  q QUESTION\033[0m\033[1m [\033[0m\033[1m QUESTION\033[0m\033[1m ...\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Quickly runs a claude one-shot.
+'
+}
+
+function __q_dump_ai() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  install_claude_config)
+    $__dump_cmd ai_install_claude_config
+    ;;
+  q)
+    $__dump_cmd ai_q
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[ai/install_claude_config]=""
+__q_complete_positional[ai/install_claude_config]=""
+__q_complete_flags[ai/q]=""
+__q_complete_positional[ai/q]="STRING STRING"
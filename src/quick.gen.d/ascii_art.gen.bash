@@ -0,0 +1,136 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module ascii_art, sourced by __q_load.
+
+function __q_help_ascii_art() {
+  printf '%s' $'Usage: q ascii_art FUNCTION [ARG...]
+Assorted ascii art, screen drawing and speech bubbles.
+
+Available functions:
+\033[1m  print_speech_bubble
+\033[0m\033[36m\033[0m\033[1m  erase_lines
+\033[0m\033[36m\033[0m\033[1m  cursor_position
+\033[0m\033[36m\033[0m\033[1m  cursor_row
+\033[0m\033[36m\033[0m\033[1m  astronaut
+\033[0m\033[36m\033[0m\033[1m  bessy
+\033[0m\033[36m\033[0m\033[1m  bmo
+\033[0m\033[36m\033[0m\033[1m  dachshund
+\033[0m\033[36m\033[0m\033[1m  drwho
+\033[0m\033[36m\033[0m\033[1m  lighthouse
+\033[0m\033[36m\033[0m\033[1m  moose
+\033[0m\033[36m\033[0m\033[1m  pacman
+\033[0m\033[36m\033[0m\033[1m  saturn
+\033[0m\033[36m\033[0m\033[1m  snufkin
+\033[0m\033[36m\033[0m\033[1m  pedro [\033[0m\033[1m TEXT\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Print the pedro raccoon with random contrasting colors.
+\033[1m  print_pedro
+\033[0m\033[36m\033[0m\033[1m  scroll_output_pedro
+\033[0m\033[36m\033[0m\033[1m  select_visual
+\033[0m\033[36m\033[0m'
+}
+
+function __q_dump_ascii_art() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  _aa_random_element)
+    $__dump_cmd _aa_random_element
+    ;;
+  print_speech_bubble)
+    $__dump_cmd print_speech_bubble
+    ;;
+  erase_lines)
+    $__dump_cmd erase_lines
+    ;;
+  cursor_position)
+    $__dump_cmd cursor_position
+    ;;
+  cursor_row)
+    $__dump_cmd cursor_row
+    ;;
+  astronaut)
+    $__dump_cmd ascii_art_astronaut
+    ;;
+  bessy)
+    $__dump_cmd ascii_art_bessy
+    ;;
+  bmo)
+    $__dump_cmd ascii_art_bmo
+    ;;
+  dachshund)
+    $__dump_cmd ascii_art_dachshund
+    ;;
+  drwho)
+    $__dump_cmd ascii_art_drwho
+    ;;
+  lighthouse)
+    $__dump_cmd ascii_art_lighthouse
+    ;;
+  moose)
+    $__dump_cmd ascii_art_moose
+    ;;
+  pacman)
+    $__dump_cmd ascii_art_pacman
+    ;;
+  saturn)
+    $__dump_cmd ascii_art_saturn
+    ;;
+  snufkin)
+    $__dump_cmd ascii_art_snufkin
+    ;;
+  pedro)
+    $__dump_cmd ascii_art_pedro
+    ;;
+  print_pedro)
+    $__dump_cmd print_pedro
+    ;;
+  scroll_output_pedro)
+    $__dump_cmd scroll_output_pedro
+    ;;
+  select_visual)
+    $__dump_cmd select_visual
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[ascii_art/print_speech_bubble]=""
+__q_complete_positional[ascii_art/print_speech_bubble]=""
+__q_complete_flags[ascii_art/erase_lines]=""
+__q_complete_positional[ascii_art/erase_lines]=""
+__q_complete_flags[ascii_art/cursor_position]=""
+__q_complete_positional[ascii_art/cursor_position]=""
+__q_complete_flags[ascii_art/cursor_row]=""
+__q_complete_positional[ascii_art/cursor_row]=""
+__q_complete_flags[ascii_art/astronaut]=""
+__q_complete_positional[ascii_art/astronaut]=""
+__q_complete_flags[ascii_art/bessy]=""
+__q_complete_positional[ascii_art/bessy]=""
+__q_complete_flags[ascii_art/bmo]=""
+__q_complete_positional[ascii_art/bmo]=""
+__q_complete_flags[ascii_art/dachshund]=""
+__q_complete_positional[ascii_art/dachshund]=""
+__q_complete_flags[ascii_art/drwho]=""
+__q_complete_positional[ascii_art/drwho]=""
+__q_complete_flags[ascii_art/lighthouse]=""
+__q_complete_positional[ascii_art/lighthouse]=""
+__q_complete_flags[ascii_art/moose]=""
+__q_complete_positional[ascii_art/moose]=""
+__q_complete_flags[ascii_art/pacman]=""
+__q_complete_positional[ascii_art/pacman]=""
+__q_complete_flags[ascii_art/saturn]=""
+__q_complete_positional[ascii_art/saturn]=""
+__q_complete_flags[ascii_art/snufkin]=""
+__q_complete_positional[ascii_art/snufkin]=""
+__q_complete_flags[ascii_art/pedro]=""
+__q_complete_positional[ascii_art/pedro]="STRING"
+__q_complete_flags[ascii_art/print_pedro]=""
+__q_complete_positional[ascii_art/print_pedro]=""
+__q_complete_flags[ascii_art/scroll_output_pedro]=""
+__q_complete_positional[ascii_art/scroll_output_pedro]=""
+__q_complete_flags[ascii_art/select_visual]=""
+__q_complete_positional[ascii_art/select_visual]=""
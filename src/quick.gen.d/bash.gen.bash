@@ -0,0 +1,30 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module bash, sourced by __q_load.
+
+function __q_help_bash() {
+  printf '%s' $'Usage: q bash FUNCTION [ARG...]
+Parse bash files and automate bash scripting.
+
+Available functions:
+\033[1m  get_bash_functions
+\033[0m\033[36m\033[0m'
+}
+
+function __q_dump_bash() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  get_bash_functions)
+    $__dump_cmd get_bash_functions
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[bash/get_bash_functions]=""
+__q_complete_positional[bash/get_bash_functions]=""
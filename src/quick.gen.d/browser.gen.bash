@@ -0,0 +1,64 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module browser, sourced by __q_load.
+
+function __q_help_browser() {
+  printf '%s' $'Usage: q browser FUNCTION [ARG...]
+Browser automation, downloads, link generators.
+
+Available functions:
+\033[1m  gdocs_id URL\033[0m\033[1m
+\033[0m\033[36m\033[0m    Extracts a Google Docs ID from a URL.
+\033[1m  sheets_dl_link
+\033[0m\033[36m\033[0m    Usage sheets_dl_link URL [FORMAT]
+    Generates a direct download link for a Google Docs spreadsheet.
+    FORMAT is optional and defaults to "csv".
+\033[1m  chrome_path
+\033[0m\033[36m\033[0m    Returns the path to the Chrome executable.
+\033[1m  downloads_path
+\033[0m\033[36m\033[0m    Returns the path to the Downloads folder.
+\033[1m  dl URL\033[0m\033[1m
+\033[0m\033[36m\033[0m    Downloads a URL with the browser and returns the path to the downloaded file.
+    This is finnicky and relies on the browser downloading to the default
+    Downloads folder. If multiple new files are created around the same time, this
+    might behave in unpredictable ways. You\'ve been warned.
+'
+}
+
+function __q_dump_browser() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  gdocs_id)
+    $__dump_cmd gdocs_id
+    ;;
+  sheets_dl_link)
+    $__dump_cmd sheets_dl_link
+    ;;
+  chrome_path)
+    $__dump_cmd chrome_path
+    ;;
+  downloads_path)
+    $__dump_cmd downloads_path
+    ;;
+  dl)
+    $__dump_cmd browser_dl
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[browser/gdocs_id]=""
+__q_complete_positional[browser/gdocs_id]="STRING"
+__q_complete_flags[browser/sheets_dl_link]=""
+__q_complete_positional[browser/sheets_dl_link]=""
+__q_complete_flags[browser/chrome_path]=""
+__q_complete_positional[browser/chrome_path]=""
+__q_complete_flags[browser/downloads_path]=""
+__q_complete_positional[browser/downloads_path]=""
+__q_complete_flags[browser/dl]=""
+__q_complete_positional[browser/dl]="STRING"
@@ -0,0 +1,86 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module caldav, sourced by __q_load.
+
+function __q_help_caldav() {
+  printf '%s' $'Usage: q caldav FUNCTION [ARG...]
+CalDAV calendar fetching utilities.
+
+Passwords are stored under CalDAV/Accounts/$account, URLs under CalDAV/URLs/$account.
+
+Available functions:
+\033[1m  accounts
+\033[0m\033[36m\033[0m    List configured CalDAV accounts.
+\033[1m  fetch [\033[0m\033[1m -a|--account\033[0m\033[1m ACCOUNT\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -u|--username\033[0m\033[1m\033[92m USER\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m URL\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Fetch a CalDAV calendar and output its contents.
+    
+    
+    Options:
+    -a, --account ACCOUNT  Account name for password lookup via keys_var CalDAV/$account.
+    If omitted and exactly one account exists, uses that.
+    -u, --username USER    Username for authentication. Defaults to account name.
+    
+    The password is retrieved from pass using: keys_var CalDAV/$account
+    If URL is not provided, it is retrieved using: keys_var CalDAV/URLs/$account
+    
+    Example:
+    caldav_fetch -a fastmail -u user@fastmail.com https://caldav.fastmail.com/dav/calendars/user/...
+    caldav_fetch -a fastmail  # URL loaded from keys_var CalDAV/URLs/fastmail
+\033[1m  agenda [\033[0m\033[1m -a|--account\033[0m\033[1m ACCOUNT\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -u|--username\033[0m\033[1m\033[92m USER\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -d|--days\033[0m\033[1m DAYS\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m URL\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Show upcoming events from a CalDAV calendar.
+    
+    
+    Options:
+    -a, --account ACCOUNT  Account name for password lookup.
+    If omitted and exactly one account exists, uses that.
+    -u, --username USER    Username for authentication. Defaults to account name.
+    -d, --days DAYS        Number of days to show (from today). Defaults to 31.
+    
+    If URL is not provided, it is retrieved using: keys_var CalDAV/URLs/$account
+    
+    Example:
+    caldav_agenda -a fastmail -d 14 https://caldav.fastmail.com/dav/calendars/user/...
+    caldav_agenda -a fastmail  # URL loaded from keys_var CalDAV/URLs/fastmail
+'
+}
+
+function __q_dump_caldav() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  accounts)
+    $__dump_cmd caldav_accounts
+    ;;
+  __caldav_default_account)
+    $__dump_cmd __caldav_default_account
+    ;;
+  fetch)
+    $__dump_cmd caldav_fetch
+    ;;
+  agenda)
+    $__dump_cmd caldav_agenda
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[caldav/accounts]=""
+__q_complete_positional[caldav/accounts]=""
+__q_complete_flags[caldav/fetch]="-a --account -u --username"
+__q_complete_positional[caldav/fetch]="STRING"
+__q_complete_flag_type[caldav/fetch/-a]=STRING
+__q_complete_flag_type[caldav/fetch/--account]=STRING
+__q_complete_flag_type[caldav/fetch/-u]=USER
+__q_complete_flag_type[caldav/fetch/--username]=USER
+__q_complete_flags[caldav/agenda]="-a --account -u --username -d --days"
+__q_complete_positional[caldav/agenda]="STRING"
+__q_complete_flag_type[caldav/agenda/-a]=STRING
+__q_complete_flag_type[caldav/agenda/--account]=STRING
+__q_complete_flag_type[caldav/agenda/-u]=USER
+__q_complete_flag_type[caldav/agenda/--username]=USER
+__q_complete_flag_type[caldav/agenda/-d]=STRING
+__q_complete_flag_type[caldav/agenda/--days]=STRING
@@ -0,0 +1,86 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module crypt, sourced by __q_load.
+
+function __q_help_crypt() {
+  printf '%s' $'Usage: q crypt FUNCTION [ARG...]
+Encrypt/decrypt, signing, keypairs. SSH and GPG helpers.
+
+Available functions:
+\033[1m  encrypt_symmetric\033[91m FILE\033[0m\033[1m
+\033[0m\033[36m\033[0m\033[1m  decrypt_symmetric\033[91m FILE\033[0m\033[1m
+\033[0m\033[36m\033[0m\033[1m  gen_github_keypair
+\033[0m\033[36m\033[0m\033[1m  package
+\033[0m\033[36m\033[0m\033[1m  payloadify\033[91m FILE\033[0m\033[1m
+\033[0m\033[36m\033[0m\033[1m  downloadify\033[91m FILE\033[0m\033[1m
+\033[0m\033[36m\033[0m    Encrypt a file and wrap it in a base64 self-unpacking shell script.
+\033[1m  hash ALGO\033[0m\033[1m [\033[0m\033[1m INPUT\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m    alias h=\'q crypt hash\'
+\033[0m    Print a cryptographic hash of the input.
+    
+    If no INPUT is provided, read from stdin.
+    
+    Supported ALGO values: md5 or SHA version (1, 128, 224, 256, 512).
+    
+    hash 256 foo -> b5bb9d8014a0f9b1d61e21e796d78dccdf1352f23cd32812f4850b878ae4944c
+    hash md5 foo -> d3b07384d113edec49eaa6238ad5ff00
+\033[1m  selfsign [\033[0m\033[1m NAME\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m OPTIONS\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Generate a self-signed certificate.
+    
+    
+    Options are the same as for openssl req
+'
+}
+
+function __q_dump_crypt() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  encrypt_symmetric)
+    $__dump_cmd encrypt_symmetric
+    ;;
+  decrypt_symmetric)
+    $__dump_cmd decrypt_symmetric
+    ;;
+  gen_github_keypair)
+    $__dump_cmd gen_github_keypair
+    ;;
+  package)
+    $__dump_cmd package
+    ;;
+  payloadify)
+    $__dump_cmd payloadify
+    ;;
+  downloadify)
+    $__dump_cmd downloadify
+    ;;
+  hash)
+    $__dump_cmd crypt_hash
+    ;;
+  selfsign)
+    $__dump_cmd crypt_selfsign
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[crypt/encrypt_symmetric]=""
+__q_complete_positional[crypt/encrypt_symmetric]="FILE"
+__q_complete_flags[crypt/decrypt_symmetric]=""
+__q_complete_positional[crypt/decrypt_symmetric]="FILE"
+__q_complete_flags[crypt/gen_github_keypair]=""
+__q_complete_positional[crypt/gen_github_keypair]=""
+__q_complete_flags[crypt/package]=""
+__q_complete_positional[crypt/package]=""
+__q_complete_flags[crypt/payloadify]=""
+__q_complete_positional[crypt/payloadify]="FILE"
+__q_complete_flags[crypt/downloadify]=""
+__q_complete_positional[crypt/downloadify]="FILE"
+__q_complete_flags[crypt/hash]=""
+__q_complete_positional[crypt/hash]="STRING STRING"
+__q_complete_flags[crypt/selfsign]=""
+__q_complete_positional[crypt/selfsign]="STRING STRING"
@@ -0,0 +1,55 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module debian, sourced by __q_load.
+
+function __q_help_debian() {
+  printf '%s' $'Usage: q debian FUNCTION [ARG...]
+Debian setup and package management.
+
+Available functions:
+\033[1m  setup
+\033[0m\033[36m\033[0m\033[1m  install_extras
+\033[0m\033[36m\033[0m    Install the full development environment on Debian/Ubuntu.
+\033[1m  install_or_skip
+\033[0m\033[36m\033[0m\033[1m  install_imgcat
+\033[0m\033[36m\033[0m\033[1m  setup_mc
+\033[0m\033[36m\033[0m'
+}
+
+function __q_dump_debian() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  setup)
+    $__dump_cmd debian_setup
+    ;;
+  install_extras)
+    $__dump_cmd debian_install_extras
+    ;;
+  install_or_skip)
+    $__dump_cmd debian_install_or_skip
+    ;;
+  install_imgcat)
+    $__dump_cmd debian_install_imgcat
+    ;;
+  setup_mc)
+    $__dump_cmd debian_setup_mc
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[debian/setup]=""
+__q_complete_positional[debian/setup]=""
+__q_complete_flags[debian/install_extras]=""
+__q_complete_positional[debian/install_extras]=""
+__q_complete_flags[debian/install_or_skip]=""
+__q_complete_positional[debian/install_or_skip]=""
+__q_complete_flags[debian/install_imgcat]=""
+__q_complete_positional[debian/install_imgcat]=""
+__q_complete_flags[debian/setup_mc]=""
+__q_complete_positional[debian/setup_mc]=""
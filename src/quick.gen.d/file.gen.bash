@@ -0,0 +1,51 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module file, sourced by __q_load.
+
+function __q_help_file() {
+  printf '%s' $'Usage: q file FUNCTION [ARG...]
+File helpers.
+
+Available functions:
+\033[1m  mktemp [\033[0m\033[1m TITLE\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Cross-platform version of mktemp across BSD and GNU. Creates a temp file and
+    prints its path. If TITLE is supplied, it will be used as prefix or suffix.
+\033[1m  mtime [\033[0m\033[1m -g\033[0m\033[1m\033[91m PATH\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Returns the modification time of PATH in "YYYY-MM-DD HH:MM:SS" format.
+    
+    Options:
+    
+    -g    Use git to get the last modified time if the file is tracked.
+\033[1m  age [\033[0m\033[1m -s\033[0m\033[1m\033[91m PATH\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m'
+}
+
+function __q_dump_file() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  mktemp)
+    $__dump_cmd file_mktemp
+    ;;
+  mtime)
+    $__dump_cmd file_mtime
+    ;;
+  age)
+    $__dump_cmd file_age
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[file/mktemp]=""
+__q_complete_positional[file/mktemp]="STRING"
+__q_complete_flags[file/mtime]="-g"
+__q_complete_positional[file/mtime]=""
+__q_complete_flag_type[file/mtime/-g]=FILE
+__q_complete_flags[file/age]="-s"
+__q_complete_positional[file/age]=""
+__q_complete_flag_type[file/age/-s]=FILE
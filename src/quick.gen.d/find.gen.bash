@@ -0,0 +1,71 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module find, sourced by __q_load.
+
+function __q_help_find() {
+  printf '%s' $'Usage: q find FUNCTION [ARG...]
+Shorthands for find and grep.
+
+Available functions:
+\033[1m  f
+\033[0m\033[36m\033[0m    Shorthand for find
+\033[1m  fcc
+\033[0m\033[36m\033[0m\033[1m  fgo
+\033[0m\033[36m\033[0m\033[1m  fjava
+\033[0m\033[36m\033[0m\033[1m  faidl
+\033[0m\033[36m\033[0m\033[1m  fd
+\033[0m\033[36m\033[0m\033[1m  replace
+\033[0m\033[36m\033[0m    Usage find_replace [DIR] GLOB NEEDLE REPLACEMENT
+'
+}
+
+function __q_dump_find() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  f)
+    $__dump_cmd f
+    ;;
+  __f_args)
+    $__dump_cmd __f_args
+    ;;
+  fcc)
+    $__dump_cmd fcc
+    ;;
+  fgo)
+    $__dump_cmd fgo
+    ;;
+  fjava)
+    $__dump_cmd fjava
+    ;;
+  faidl)
+    $__dump_cmd faidl
+    ;;
+  fd)
+    $__dump_cmd fd
+    ;;
+  replace)
+    $__dump_cmd find_replace
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[find/f]=""
+__q_complete_positional[find/f]=""
+__q_complete_flags[find/fcc]=""
+__q_complete_positional[find/fcc]=""
+__q_complete_flags[find/fgo]=""
+__q_complete_positional[find/fgo]=""
+__q_complete_flags[find/fjava]=""
+__q_complete_positional[find/fjava]=""
+__q_complete_flags[find/faidl]=""
+__q_complete_positional[find/faidl]=""
+__q_complete_flags[find/fd]=""
+__q_complete_positional[find/fd]=""
+__q_complete_flags[find/replace]=""
+__q_complete_positional[find/replace]=""
@@ -0,0 +1,75 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module git, sourced by __q_load.
+
+function __q_help_git() {
+  printf '%s' $'Usage: q git FUNCTION [ARG...]
+Automate git and github operations.
+
+Available functions:
+\033[1m  review
+\033[0m\033[36m\033[0m\033[1m  mkproject
+\033[0m\033[36m\033[0m\033[1m  ssh_init
+\033[0m\033[36m\033[0m\033[1m  get_origin
+\033[0m\033[36m\033[0m\033[1m  master_branch
+\033[0m\033[36m\033[0m\033[1m  cherrypick_branch
+\033[0m\033[36m\033[0m\033[1m  sparse_clone REPO\033[0m\033[1m [\033[0m\033[1m -b\033[0m\033[1m BRANCH\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -p\033[0m\033[1m\033[91m PATH\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m\033[31m DIR\033[0m\033[1m ...\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Clones a git repository with only the specified subdirectories.
+\033[1m  changed_lines
+\033[0m\033[36m\033[0m'
+}
+
+function __q_dump_git() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  review)
+    $__dump_cmd git_review
+    ;;
+  mkproject)
+    $__dump_cmd mkproject
+    ;;
+  ssh_init)
+    $__dump_cmd git_ssh_init
+    ;;
+  get_origin)
+    $__dump_cmd git_get_origin
+    ;;
+  master_branch)
+    $__dump_cmd git_master_branch
+    ;;
+  cherrypick_branch)
+    $__dump_cmd git_cherrypick_branch
+    ;;
+  sparse_clone)
+    $__dump_cmd git_sparse_clone
+    ;;
+  changed_lines)
+    $__dump_cmd git_changed_lines
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[git/review]=""
+__q_complete_positional[git/review]=""
+__q_complete_flags[git/mkproject]=""
+__q_complete_positional[git/mkproject]=""
+__q_complete_flags[git/ssh_init]=""
+__q_complete_positional[git/ssh_init]=""
+__q_complete_flags[git/get_origin]=""
+__q_complete_positional[git/get_origin]=""
+__q_complete_flags[git/master_branch]=""
+__q_complete_positional[git/master_branch]=""
+__q_complete_flags[git/cherrypick_branch]=""
+__q_complete_positional[git/cherrypick_branch]=""
+__q_complete_flags[git/sparse_clone]="-b -p"
+__q_complete_positional[git/sparse_clone]="STRING DIRECTORY"
+__q_complete_flag_type[git/sparse_clone/-b]=STRING
+__q_complete_flag_type[git/sparse_clone/-p]=FILE
+__q_complete_flags[git/changed_lines]=""
+__q_complete_positional[git/changed_lines]=""
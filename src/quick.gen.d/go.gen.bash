@@ -0,0 +1,30 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module go, sourced by __q_load.
+
+function __q_help_go() {
+  printf '%s' $'Usage: q go FUNCTION [ARG...]
+Helpers for dealing with Go packages.
+
+Available functions:
+\033[1m  pkg_do
+\033[0m\033[36m\033[0m'
+}
+
+function __q_dump_go() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  pkg_do)
+    $__dump_cmd go_pkg_do
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[go/pkg_do]=""
+__q_complete_positional[go/pkg_do]=""
@@ -0,0 +1,51 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module hg, sourced by __q_load.
+
+function __q_help_hg() {
+  printf '%s' $'Usage: q hg FUNCTION [ARG...]
+Mercurial helpers.
+
+Available functions:
+\033[1m  root
+\033[0m\033[36m\033[0m    Fast check for mercurial. (About 100 times faster than `hg root`.) Prints the
+    root directory of the repository if the current directory is in a repository.
+    Otherwise returns 1.
+\033[1m  repo_name
+\033[0m\033[36m\033[0m\033[1m  branch_name
+\033[0m\033[36m\033[0m\033[1m  ps1_widget
+\033[0m\033[36m\033[0m'
+}
+
+function __q_dump_hg() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  root)
+    $__dump_cmd hg_root
+    ;;
+  repo_name)
+    $__dump_cmd hg_repo_name
+    ;;
+  branch_name)
+    $__dump_cmd hg_branch_name
+    ;;
+  ps1_widget)
+    $__dump_cmd hg_ps1_widget
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[hg/root]=""
+__q_complete_positional[hg/root]=""
+__q_complete_flags[hg/repo_name]=""
+__q_complete_positional[hg/repo_name]=""
+__q_complete_flags[hg/branch_name]=""
+__q_complete_positional[hg/branch_name]=""
+__q_complete_flags[hg/ps1_widget]=""
+__q_complete_positional[hg/ps1_widget]=""
@@ -0,0 +1,24 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module init, sourced by __q_load.
+
+function __q_help_init() {
+  printf '%s' $'Usage: q init FUNCTION [ARG...]
+Initialization routines.
+
+Available functions:
+'
+}
+
+function __q_dump_init() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
@@ -0,0 +1,80 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module install, sourced by __q_load.
+
+function __q_help_install() {
+  printf '%s' $'Usage: q install FUNCTION [ARG...]
+Install a file into another file, optionally with a keyword.
+
+Available functions:
+\033[1m  file -s|--sfile\033[0m\033[1m\033[91m SFILE\033[0m\033[1m -d|--dfile\033[0m\033[1m\033[91m DFILE\033[0m\033[1m [\033[0m\033[1m -c|--char\033[0m\033[1m CHAR\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -k|--section\033[0m\033[1m SECTION\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -d|--append\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m --uninstall\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Installs the contents of DFILE into SFILE, guarded by a comment at the first
+    and last line. Optional arguments CHAR and SECTION control what the commend
+    guard looks like. Default CHAR is \'#\' and default SECTION is \'REDSHELL\' for:
+    
+    # REDSHELL
+    ... contents
+    # /REDSHELL
+    
+    Subsequent calls to install_file remove the old contents before intalling the
+    new contents. New contents replace the old contents in-place.
+    
+    Pass --append to install the contents always at the end of the file, rather
+    than in-place. Pass --uninstall to only uninstall the file.
+    
+    On Linux, this attempts to flock DFILE. If the file is already locked, the
+    function will immediately return 254.
+\033[1m  reinstall_file\033[91m SFILE\033[0m\033[1m\033[91m DFILE\033[0m\033[1m [\033[0m\033[1m CHAR\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m SECTION\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    This is a legacy form of install_file. It is kept for backwards compatibility.
+    
+    Installs the contents of DFILE into SFILE, guarded by a comment at the first
+    and last line. Optional arguments CHAR and SECTION control what the commend
+    guard looks like. Default CHAR is \'#\' and default SECTION is \'REDSHELL\' for:
+    
+    # REDSHELL
+    ... contents
+    # /REDSHELL
+    
+    Subsequent calls to reinstall_file remove the old contents before intalling
+    the new contents.
+'
+}
+
+function __q_dump_install() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  file)
+    $__dump_cmd install_file
+    ;;
+  reinstall_file)
+    $__dump_cmd reinstall_file
+    ;;
+  __install_file)
+    $__dump_cmd __install_file
+    ;;
+  __uninstall_file)
+    $__dump_cmd __uninstall_file
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[install/file]="-d --append --uninstall -s --sfile -d --dfile -c --char -k --section"
+__q_complete_positional[install/file]=""
+__q_complete_flag_type[install/file/-s]=FILE
+__q_complete_flag_type[install/file/--sfile]=FILE
+__q_complete_flag_type[install/file/-d]=FILE
+__q_complete_flag_type[install/file/--dfile]=FILE
+__q_complete_flag_type[install/file/-c]=STRING
+__q_complete_flag_type[install/file/--char]=STRING
+__q_complete_flag_type[install/file/-k]=STRING
+__q_complete_flag_type[install/file/--section]=STRING
+__q_complete_flag_type[install/file/--append]=SWITCH
+__q_complete_flag_type[install/file/--uninstall]=SWITCH
+__q_complete_flags[install/reinstall_file]=""
+__q_complete_positional[install/reinstall_file]="FILE FILE STRING STRING"
@@ -0,0 +1,36 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module kagi, sourced by __q_load.
+
+function __q_help_kagi() {
+  printf '%s' $'Usage: q kagi FUNCTION [ARG...]
+Kagi search and API wrappers.
+
+Available functions:
+\033[1m  search_json
+\033[0m\033[36m\033[0m\033[1m  summarize_json
+\033[0m\033[36m\033[0m'
+}
+
+function __q_dump_kagi() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  search_json)
+    $__dump_cmd kagi_search_json
+    ;;
+  summarize_json)
+    $__dump_cmd kagi_summarize_json
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[kagi/search_json]=""
+__q_complete_positional[kagi/search_json]=""
+__q_complete_flags[kagi/summarize_json]=""
+__q_complete_positional[kagi/summarize_json]=""
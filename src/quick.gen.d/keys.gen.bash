@@ -0,0 +1,86 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module keys, sourced by __q_load.
+
+function __q_help_keys() {
+  printf '%s' $'Usage: q keys FUNCTION [ARG...]
+Key management utils using pass and gpg.
+
+All keys managed by this code are stored under the "Redshell/" folder in pass.
+
+We support two types of keys which are treated slightly differently:
+- .key: Typically larger secrets that are exported as files, e.g. SSH keys or
+certificates. You should take care to periodically expire these when not
+needed, or further protect them with passwords and file permissions.
+- .var keys: Small secrets used as ENV variables or arguments. They are not
+cached as files during use.
+
+Available functions:
+\033[1m  git [\033[0m\033[1m ARGS\033[0m\033[1m ...\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Wraps git for use with the keys repository.
+\033[1m  path [\033[0m\033[1m -f\033[0m\033[1m KEY\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Dumps the contents of the given key in a file and returns the path.
+    
+    If -f is given, forces regeneration of the file. The file is also regenerated
+    if it exists but is empty.
+    
+    Caution: the file will persist until keys_flush is called, so be sure to
+    manage its lifecycle appropriately.
+\033[1m  var KEY\033[0m\033[1m [\033[0m\033[1m VALUE|--delete\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Returns the conents of a given .var key in pass. If VALUE is provided, instead
+    the value is stored in the key. If --delete is provided, the key is removed.
+\033[1m  key KEY\033[0m\033[1m [\033[0m\033[1m VALUE|--delete\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Returns the contents of a given .key key in pass. If VALUE is provided,
+    instead the value is stored in the key. If --delete is provided, the key is
+    removed.
+\033[1m  flush
+\033[0m\033[36m\033[0m    Removes all cached key files.
+\033[1m  sync
+\033[0m\033[36m\033[0m    Pulls the latest changes from the keys git repository and pushes any local
+    changes.
+'
+}
+
+function __q_dump_keys() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  git)
+    $__dump_cmd keys_git
+    ;;
+  path)
+    $__dump_cmd keys_path
+    ;;
+  var)
+    $__dump_cmd keys_var
+    ;;
+  key)
+    $__dump_cmd keys_key
+    ;;
+  flush)
+    $__dump_cmd keys_flush
+    ;;
+  sync)
+    $__dump_cmd keys_sync
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[keys/git]=""
+__q_complete_positional[keys/git]="STRING"
+__q_complete_flags[keys/path]="-f"
+__q_complete_positional[keys/path]=""
+__q_complete_flag_type[keys/path/-f]=STRING
+__q_complete_flags[keys/var]=""
+__q_complete_positional[keys/var]="STRING STRING"
+__q_complete_flags[keys/key]=""
+__q_complete_positional[keys/key]="STRING STRING"
+__q_complete_flags[keys/flush]=""
+__q_complete_positional[keys/flush]=""
+__q_complete_flags[keys/sync]=""
+__q_complete_positional[keys/sync]=""
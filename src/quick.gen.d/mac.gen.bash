@@ -0,0 +1,199 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module mac, sourced by __q_load.
+
+function __q_help_mac() {
+  printf '%s' $'Usage: q mac FUNCTION [ARG...]
+Mac setup, package management and various helpers.
+
+Available functions:
+\033[1m  setup
+\033[0m\033[36m\033[0m\033[1m  install_extras
+\033[0m\033[36m\033[0m    Install the full development environment on macOS. This includes switching to
+    Homebrew bash, installing Xcode, VS Code, and various dev packages.
+\033[1m  brew
+\033[0m\033[36m\033[0m\033[1m  reinstall_brew
+\033[0m\033[36m\033[0m\033[1m  enable_ipconfig_verbose
+\033[0m\033[36m\033[0m\033[1m  get_user_shell
+\033[0m\033[36m\033[0m\033[1m  brew_bash_path
+\033[0m\033[36m\033[0m\033[1m  switch_to_bash
+\033[0m\033[36m\033[0m\033[1m  icloud
+\033[0m\033[36m\033[0m\033[1m  icloud_evict
+\033[0m\033[36m\033[0m\033[1m  brew_install_or_skip
+\033[0m\033[36m\033[0m\033[1m  install_miniconda
+\033[0m\033[36m\033[0m\033[1m  install_devtools
+\033[0m\033[36m\033[0m\033[1m  kill_defender
+\033[0m\033[36m\033[0m    Kills Microsoft Defender in a way that tends to persist for an hour or so.
+    This is useful for working around bugs or surviving when they push and update
+    that breaks the OS.
+    
+    Use at your own risk, and only after discussing with your IT department. This
+    action is likely to be detected.
+\033[1m  suppress_defender
+\033[0m\033[36m\033[0m    Keeps Microsoft Defender from restarting.
+    
+    Use at your own risk, and only after discussing with your IT department. This
+    action is likely to be detected.
+\033[1m  kill_crashplan
+\033[0m\033[36m\033[0m    Stops CrashPlan from running. CrashPlan is a very poorly optimized backup
+    service. When you\'re running IO intensive workloads, it can slow them down
+    massively and eat up 2-3 CPU cores.
+\033[1m  hogs
+\033[0m\033[36m\033[0m\033[1m  cpu_hogs [\033[0m\033[1m --current\033[0m\033[1m PERCENT\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m --lifetime\033[0m\033[1m PERCENT\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Lists PIDs of processes using too much CPU.
+    
+    Checks both current CPU % and lifetime CPU % (accumulated CPU time divided
+    by process elapsed time). Lists processes exceeding either threshold.
+    
+    Output: tab-separated pid, lifetime cpu %, current cpu %, command name
+\033[1m  cpulimit LIMIT\033[0m\033[1m PID\033[0m\033[1m [\033[0m\033[1m PID\033[0m\033[1m ...\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Limits the CPU usage of processes to a certain percentage.
+\033[1m  disable_powernap
+\033[0m\033[36m\033[0m    Stop the computer from waking up to do random things and exhausting the
+    battery.
+\033[1m  power_stats
+\033[0m\033[36m\033[0m    Prints out some debug information about power management.
+\033[1m  fix_ssh_locale_config
+\033[0m\033[36m\033[0m    macOS uses the non-existent locale LC_CTYPE=UTF-8 by default, which breaks SSH
+    sessions. This function fixes that by way of global ssh client config.
+\033[1m  pid_suspend [\033[0m\033[1m --resume|--suspend\033[0m\033[1m PID\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m\033[1m  setup_iterm2
+\033[0m\033[36m\033[0m'
+}
+
+function __q_dump_mac() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  setup)
+    $__dump_cmd mac_setup
+    ;;
+  install_extras)
+    $__dump_cmd mac_install_extras
+    ;;
+  brew)
+    $__dump_cmd brew
+    ;;
+  reinstall_brew)
+    $__dump_cmd reinstall_brew
+    ;;
+  enable_ipconfig_verbose)
+    $__dump_cmd mac_enable_ipconfig_verbose
+    ;;
+  get_user_shell)
+    $__dump_cmd mac_get_user_shell
+    ;;
+  brew_bash_path)
+    $__dump_cmd mac_brew_bash_path
+    ;;
+  switch_to_bash)
+    $__dump_cmd mac_switch_to_bash
+    ;;
+  icloud)
+    $__dump_cmd icloud
+    ;;
+  icloud_evict)
+    $__dump_cmd icloud_evict
+    ;;
+  brew_install_or_skip)
+    $__dump_cmd brew_install_or_skip
+    ;;
+  install_miniconda)
+    $__dump_cmd mac_install_miniconda
+    ;;
+  install_devtools)
+    $__dump_cmd mac_install_devtools
+    ;;
+  kill_defender)
+    $__dump_cmd mac_kill_defender
+    ;;
+  suppress_defender)
+    $__dump_cmd mac_suppress_defender
+    ;;
+  kill_crashplan)
+    $__dump_cmd mac_kill_crashplan
+    ;;
+  hogs)
+    $__dump_cmd mac_hogs
+    ;;
+  cpu_hogs)
+    $__dump_cmd mac_cpu_hogs
+    ;;
+  cpulimit)
+    $__dump_cmd mac_cpulimit
+    ;;
+  disable_powernap)
+    $__dump_cmd mac_disable_powernap
+    ;;
+  power_stats)
+    $__dump_cmd mac_power_stats
+    ;;
+  fix_ssh_locale_config)
+    $__dump_cmd mac_fix_ssh_locale_config
+    ;;
+  pid_suspend)
+    $__dump_cmd mac_pid_suspend
+    ;;
+  setup_iterm2)
+    $__dump_cmd mac_setup_iterm2
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[mac/setup]=""
+__q_complete_positional[mac/setup]=""
+__q_complete_flags[mac/install_extras]=""
+__q_complete_positional[mac/install_extras]=""
+__q_complete_flags[mac/brew]=""
+__q_complete_positional[mac/brew]=""
+__q_complete_flags[mac/reinstall_brew]=""
+__q_complete_positional[mac/reinstall_brew]=""
+__q_complete_flags[mac/enable_ipconfig_verbose]=""
+__q_complete_positional[mac/enable_ipconfig_verbose]=""
+__q_complete_flags[mac/get_user_shell]=""
+__q_complete_positional[mac/get_user_shell]=""
+__q_complete_flags[mac/brew_bash_path]=""
+__q_complete_positional[mac/brew_bash_path]=""
+__q_complete_flags[mac/switch_to_bash]=""
+__q_complete_positional[mac/switch_to_bash]=""
+__q_complete_flags[mac/icloud]=""
+__q_complete_positional[mac/icloud]=""
+__q_complete_flags[mac/icloud_evict]=""
+__q_complete_positional[mac/icloud_evict]=""
+__q_complete_flags[mac/brew_install_or_skip]=""
+__q_complete_positional[mac/brew_install_or_skip]=""
+__q_complete_flags[mac/install_miniconda]=""
+__q_complete_positional[mac/install_miniconda]=""
+__q_complete_flags[mac/install_devtools]=""
+__q_complete_positional[mac/install_devtools]=""
+__q_complete_flags[mac/kill_defender]=""
+__q_complete_positional[mac/kill_defender]=""
+__q_complete_flags[mac/suppress_defender]=""
+__q_complete_positional[mac/suppress_defender]=""
+__q_complete_flags[mac/kill_crashplan]=""
+__q_complete_positional[mac/kill_crashplan]=""
+__q_complete_flags[mac/hogs]=""
+__q_complete_positional[mac/hogs]=""
+__q_complete_flags[mac/cpu_hogs]="--current --lifetime"
+__q_complete_positional[mac/cpu_hogs]=""
+__q_complete_flag_type[mac/cpu_hogs/--current]=STRING
+__q_complete_flag_type[mac/cpu_hogs/--lifetime]=STRING
+__q_complete_flags[mac/cpulimit]=""
+__q_complete_positional[mac/cpulimit]="STRING STRING STRING"
+__q_complete_flags[mac/disable_powernap]=""
+__q_complete_positional[mac/disable_powernap]=""
+__q_complete_flags[mac/power_stats]=""
+__q_complete_positional[mac/power_stats]=""
+__q_complete_flags[mac/fix_ssh_locale_config]=""
+__q_complete_positional[mac/fix_ssh_locale_config]=""
+__q_complete_flags[mac/pid_suspend]="--resume --suspend"
+__q_complete_positional[mac/pid_suspend]=""
+__q_complete_flag_type[mac/pid_suspend/--resume]=STRING
+__q_complete_flag_type[mac/pid_suspend/--suspend]=STRING
+__q_complete_flags[mac/setup_iterm2]=""
+__q_complete_positional[mac/setup_iterm2]=""
@@ -0,0 +1,31 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module media, sourced by __q_load.
+
+function __q_help_media() {
+  printf '%s' $'Usage: q media FUNCTION [ARG...]
+Functions for working with media, ffmpeg, youtube, etc.
+
+Available functions:
+\033[1m  yt-dl [\033[0m\033[1m OPTIONS\033[0m\033[1m ...\033[0m\033[1m ]\033[0m\033[1m URL\033[0m\033[1m
+\033[0m\033[36m\033[0m    Wrapper areound yt-dlp. Automatically ensures dependencies are installed.
+'
+}
+
+function __q_dump_media() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  yt-dl)
+    $__dump_cmd yt-dl
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[media/yt-dl]=""
+__q_complete_positional[media/yt-dl]="STRING STRING"
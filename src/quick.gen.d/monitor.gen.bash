@@ -0,0 +1,102 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module monitor, sourced by __q_load.
+
+function __q_help_monitor() {
+  printf '%s' $'Usage: q monitor FUNCTION [ARG...]
+System load monitoring and logging.
+
+Available functions:
+\033[1m  stream_load_stats
+\033[0m\033[36m\033[0m\033[1m  load_hist
+\033[0m\033[36m\033[0m\033[1m  latest_load_stats
+\033[0m\033[36m\033[0m\033[1m  write_load_stats
+\033[0m\033[36m\033[0m\033[1m  stream_top_stats
+\033[0m\033[36m\033[0m\033[1m  stream_net_stats
+\033[0m\033[36m\033[0m\033[1m  proc_stats
+\033[0m\033[36m\033[0m    Outputs:
+    1. CPU util
+    2. Physical RAM util
+    3. Total RSS
+    4. User time total
+    5. System time total
+    6. PID with the highest CPU util
+    7. Comm with the highest CPU util
+    8. CPU util of the proc with the highest CPU util
+    9. PID with the highest RSS
+    10. Comm with the highest RSS
+    11. RSS of the proc with the highest RSS
+'
+}
+
+function __q_dump_monitor() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  __load_stats_worker)
+    $__dump_cmd __load_stats_worker
+    ;;
+  __stream_tick)
+    $__dump_cmd __stream_tick
+    ;;
+  stream_load_stats)
+    $__dump_cmd stream_load_stats
+    ;;
+  __write_load_stats_worker)
+    $__dump_cmd __write_load_stats_worker
+    ;;
+  load_hist)
+    $__dump_cmd load_hist
+    ;;
+  latest_load_stats)
+    $__dump_cmd latest_load_stats
+    ;;
+  __parse_load_stats)
+    $__dump_cmd __parse_load_stats
+    ;;
+  write_load_stats)
+    $__dump_cmd write_load_stats
+    ;;
+  stream_top_stats)
+    $__dump_cmd stream_top_stats
+    ;;
+  __parse_top_header)
+    $__dump_cmd __parse_top_header
+    ;;
+  __parse_units)
+    $__dump_cmd __parse_units
+    ;;
+  __stream_net_stats_worker)
+    $__dump_cmd __stream_net_stats_worker
+    ;;
+  __parse_nettop)
+    $__dump_cmd __parse_nettop
+    ;;
+  stream_net_stats)
+    $__dump_cmd stream_net_stats
+    ;;
+  proc_stats)
+    $__dump_cmd proc_stats
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[monitor/stream_load_stats]=""
+__q_complete_positional[monitor/stream_load_stats]=""
+__q_complete_flags[monitor/load_hist]=""
+__q_complete_positional[monitor/load_hist]=""
+__q_complete_flags[monitor/latest_load_stats]=""
+__q_complete_positional[monitor/latest_load_stats]=""
+__q_complete_flags[monitor/write_load_stats]=""
+__q_complete_positional[monitor/write_load_stats]=""
+__q_complete_flags[monitor/stream_top_stats]=""
+__q_complete_positional[monitor/stream_top_stats]=""
+__q_complete_flags[monitor/stream_net_stats]=""
+__q_complete_positional[monitor/stream_net_stats]=""
+__q_complete_flags[monitor/proc_stats]=""
+__q_complete_positional[monitor/proc_stats]=""
@@ -0,0 +1,67 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module mtg, sourced by __q_load.
+
+function __q_help_mtg() {
+  printf '%s' $'Usage: q mtg FUNCTION [ARG...]
+Stuff for Magic: The Gathering.
+
+Available functions:
+\033[1m  oracle_json
+\033[0m\033[36m\033[0m    Fetch the latest oracle cards from Scryfall and return the path to the JSON
+    dump. The dump is cached for about two weeks.
+\033[1m  rules
+\033[0m\033[36m\033[0m\033[1m  card_json NAME\033[0m\033[1m
+\033[0m\033[36m\033[0m    Return the JSON object for the card with the given name. (Case sensitive.)
+\033[1m  card NAME\033[0m\033[1m
+\033[0m\033[36m\033[0m    Print the Magic: The Gathering card with the given name. (Case sensitive.)
+'
+}
+
+function __q_dump_mtg() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  __mtg_latest_scryfall_oracle_cards_uri)
+    $__dump_cmd __mtg_latest_scryfall_oracle_cards_uri
+    ;;
+  oracle_json)
+    $__dump_cmd mtg_oracle_json
+    ;;
+  rules)
+    $__dump_cmd mtg_rules
+    ;;
+  card_json)
+    $__dump_cmd mtg_card_json
+    ;;
+  __mtg_approx_match)
+    $__dump_cmd __mtg_approx_match
+    ;;
+  __colorize_mana)
+    $__dump_cmd __colorize_mana
+    ;;
+  __print_card)
+    $__dump_cmd __print_card
+    ;;
+  card)
+    $__dump_cmd mtg_card
+    ;;
+  __relevant_cards)
+    $__dump_cmd __relevant_cards
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[mtg/oracle_json]=""
+__q_complete_positional[mtg/oracle_json]=""
+__q_complete_flags[mtg/rules]=""
+__q_complete_positional[mtg/rules]=""
+__q_complete_flags[mtg/card_json]=""
+__q_complete_positional[mtg/card_json]="STRING"
+__q_complete_flags[mtg/card]=""
+__q_complete_positional[mtg/card]="STRING"
@@ -0,0 +1,58 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module multiple_choice, sourced by __q_load.
+
+function __q_help_multiple_choice() {
+  printf '%s' $'Usage: q multiple_choice FUNCTION [ARG...]
+Interactive multiple choice prompts.
+
+Available functions:
+\033[1m  multiple_choice [\033[0m\033[1m -n|-L|-N\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -i\033[0m\033[1m INPUT\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -p\033[0m\033[1m PAGE\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -m\033[0m\033[1m MSG\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -a\033[0m\033[1m ALPHABET\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -I\033[0m\033[1m CONTROLS\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -A\033[0m\033[1m CONTROL_ALPHABET\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -H\033[0m\033[1m HEADER\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Display an interactive menu with multiple choices, and then print the selected option to stdout.
+    
+    -n: return the number of the selected option
+    -L: return the string of the selected option
+    -N: return the alphabet character of the selected option
+    -p: page number to show
+    -m: prompt message
+    -a: alphabet
+    -I: control options
+    -A: control alphabet
+    -i: input (options to pick from)
+    -H: header to show above the options
+'
+}
+
+function __q_dump_multiple_choice() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  __prompt)
+    $__dump_cmd __prompt
+    ;;
+  __multiple_choice)
+    $__dump_cmd __multiple_choice
+    ;;
+  multiple_choice)
+    $__dump_cmd multiple_choice
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[multiple_choice/multiple_choice]="-n -L -N -i -p -m -a -I -A -H"
+__q_complete_positional[multiple_choice/multiple_choice]=""
+__q_complete_flag_type[multiple_choice/multiple_choice/-n]=SWITCH
+__q_complete_flag_type[multiple_choice/multiple_choice/-L]=SWITCH
+__q_complete_flag_type[multiple_choice/multiple_choice/-N]=SWITCH
+__q_complete_flag_type[multiple_choice/multiple_choice/-i]=STRING
+__q_complete_flag_type[multiple_choice/multiple_choice/-p]=STRING
+__q_complete_flag_type[multiple_choice/multiple_choice/-m]=STRING
+__q_complete_flag_type[multiple_choice/multiple_choice/-a]=STRING
+__q_complete_flag_type[multiple_choice/multiple_choice/-I]=STRING
+__q_complete_flag_type[multiple_choice/multiple_choice/-A]=STRING
+__q_complete_flag_type[multiple_choice/multiple_choice/-H]=STRING
@@ -0,0 +1,305 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module net, sourced by __q_load.
+
+function __q_help_net() {
+  printf '%s' $'Usage: q net FUNCTION [ARG...]
+Network and wifi helpers, netcat wrappers, etc.
+
+Available functions:
+\033[1m  host [\033[0m\033[1m -l|--port\033[0m\033[1m PORT\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -u|--username\033[0m\033[1m\033[92m USER\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -P|--password\033[0m\033[1m PASS\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -C|certfile\033[0m\033[1m\033[91m FILE\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m --keyfile\033[0m\033[1m\033[91m FILE\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m\033[31m DIR\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Hosts a folder contents over HTTPs.
+    
+    Also see net_serve.
+    
+    
+    Options:
+    -l, --port PORT     Port to listen on. Default is 8080.
+    -u, --username USER Username for basic auth.
+    -P, --password PASS Password for basic auth.
+    --certfile FILE     Path to the certificate file, or "auto" to generate one.
+    --keyfile FILE      Path to the key file.
+    
+    By default, the server will listen for HTTP connections. If certfile and
+    keyfile are specified, the server will listen for HTTPS connections.
+    
+    If certfile is set to "auto", the server will generate a self-signed cert.
+    Otherwise, the keyfile must be specified.
+    
+    If username and password are specified, the server will require basic auth.
+    Both or neither must be specified.
+    
+    The server will serve the contents of DIR. If DIR is not specified, the server
+    will serve the current directory.
+\033[1m  dl URL\033[0m\033[1m
+\033[0m\033[36m\033[0m    Recursively downloads the URL even if it\'s a folder. Accepts all wget options.
+    
+    This is basically only useful if you can\'t remember wget options.
+\033[1m  online
+\033[0m\033[36m\033[0m    Check if you have a usable internet connection.
+\033[1m  cidr_to_netmask CIDR\033[0m\033[1m
+\033[0m\033[36m\033[0m    Convert a CIDR notation (e.g. 24) to a netmask.
+\033[1m  health
+\033[0m\033[36m\033[0m\033[1m  ssh_fingerprint
+\033[0m\033[36m\033[0m\033[1m  dump_cert
+\033[0m\033[36m\033[0m\033[1m  ccurl [\033[0m\033[1m -M|--max-age\033[0m\033[1m SECONDS\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -K|--key\033[0m\033[1m KEY\033[0m\033[1m ]\033[0m\033[1m --\033[0m\033[1m CURL_ARGS\033[0m\033[1m
+\033[0m\033[36m\033[0m    Cached curl wrapper. Request parameters are converted to a key and used to
+    cache the response.
+    
+    Options:
+    -M, --max-age SECONDS  Maximum age of the cache in seconds. Default is 3600.
+    -K, --key KEY          Use the given key instead of the request parameters.
+\033[1m  dataurl\033[91m FILE\033[0m\033[1m
+\033[0m\033[36m\033[0m    Create a data URL from a file.
+\033[1m  undataurl
+\033[0m\033[36m    alias undataurl=\'q net undataurl\'
+\033[0m    Decode a dataurl from stdin onto stdout.
+\033[1m  rtt\033[34m HOST\033[0m\033[1m
+\033[0m\033[36m\033[0m    Average round-trip time to the specified host.
+\033[1m  ip4
+\033[0m\033[36m    alias ip4=\'q net ip4\'
+\033[0m    Print the non-localhost IPv4 addresses of this machine. One address per line.
+\033[1m  ip4gw
+\033[0m\033[36m    alias ip4gw=\'q net ip4gw\'
+\033[0m    Print the default gateway\'s IP address.
+\033[1m  port_hog PORT\033[0m\033[1m
+\033[0m\033[36m\033[0m    Find the process using a TCP port.
+    
+    Useful when you get "address already in use" errors and need to find
+    what\'s hogging the port.
+\033[1m  serve [\033[0m\033[1m -l\033[0m\033[1m PORT\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m\033[91m FILE\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Serves the contents of a file or stdin over HTTP once, then exits.
+    
+    Also see net_host.
+\033[1m  dump_url
+\033[0m\033[36m\033[0m\033[1m  wiki
+\033[0m\033[36m\033[0m\033[1m  wifi_device
+\033[0m\033[36m\033[0m\033[1m  wifi_name
+\033[0m\033[36m\033[0m    Print the name of the currently connected wifi network.
+\033[1m  ssh_fingerprint\033[34m HOST\033[0m\033[1m
+\033[0m\033[36m\033[0m\033[1m  ssh_aliases
+\033[0m\033[36m\033[0m    Prints the aliases and hostnames from the ssh config file.
+\033[1m  ssh_fqdn ALIAS\033[0m\033[1m
+\033[0m\033[36m\033[0m    Based on SSH config, looks up the full hostname of the given alias.
+\033[1m  wa_link PHONE_NUMBER\033[0m\033[1m
+\033[0m\033[36m\033[0m    Prints a link to WhatsApp Web for the given phone number.
+\033[1m  gallery [\033[0m\033[1m --dedupe\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m --copy-to\033[0m\033[1m\033[31m DIR\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m --scan-only\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m --serve-only\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m --force\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m --clean\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m --sqlite\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m --title\033[0m\033[1m TITLE\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -l|--port\033[0m\033[1m PORT\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -u|--username\033[0m\033[1m\033[92m USER\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -P|--password\033[0m\033[1m PASS\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -C|--certfile\033[0m\033[1m\033[91m FILE\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m --keyfile\033[0m\033[1m\033[91m FILE\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m\033[31m DIR\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Scan a directory for photos and serve a browsable gallery.
+    
+    This command scans a directory tree for photos, generates thumbnails and
+    mid-size images for fast browsing, and serves an HTML gallery.
+    
+    The gallery data (thumbnails, mid-size images, JSON index) is stored in a
+    .gallery hidden directory. The original photos can either be left in place
+    (referenced by path) or copied to a new directory with date-based names.
+    
+    
+    Options:
+    --dedupe              Deduplicate photos by hash before indexing.
+    --copy-to DIR         Copy photos to DIR with date-based names. If not
+    specified, photos are referenced in place.
+    --scan-only           Generate gallery data without serving. Useful for
+    preparing a gallery to be served later.
+    --serve-only          Skip scanning and serve existing gallery data.
+    --force               Regenerate thumbnails even if they exist.
+    --clean               Delete all generated gallery files (.gallery/ and
+    gallery.html) and exit.
+    --sqlite              Keep the index in .gallery/photos.db and only update
+    changed photos. photos.json is exported from it.
+    Thumbnails it has recorded aren\'t checked again, so
+    use --force if they were deleted.
+    --title TITLE         Gallery title. Defaults to the directory name.
+    -l, --port PORT       Port to serve on. Default is 8080.
+    -u, --username USER   Username for basic auth.
+    -P, --password PASS   Password for basic auth.
+    -C, --certfile FILE   Certificate file for HTTPS, or "auto" to generate.
+    --keyfile FILE        Key file for HTTPS.
+    
+    Examples:
+    net_gallery                     # Scan current dir and serve gallery
+    net_gallery ~/Photos            # Scan ~/Photos and serve gallery
+    net_gallery --dedupe ~/Backup   # Dedupe and serve photos from backup
+    net_gallery --scan-only .       # Generate gallery data only
+    net_gallery --copy-to ~/Clean ~/Messy  # Copy deduped photos to new dir
+'
+}
+
+function __q_dump_net() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  host)
+    $__dump_cmd net_host
+    ;;
+  dl)
+    $__dump_cmd net_dl
+    ;;
+  online)
+    $__dump_cmd net_online
+    ;;
+  cidr_to_netmask)
+    $__dump_cmd net_cidr_to_netmask
+    ;;
+  health)
+    $__dump_cmd net_health
+    ;;
+  ssh_fingerprint)
+    $__dump_cmd net_ssh_fingerprint
+    ;;
+  dump_cert)
+    $__dump_cmd net_dump_cert
+    ;;
+  ccurl)
+    $__dump_cmd net_ccurl
+    ;;
+  dataurl)
+    $__dump_cmd net_dataurl
+    ;;
+  undataurl)
+    $__dump_cmd net_undataurl
+    ;;
+  rtt)
+    $__dump_cmd net_rtt
+    ;;
+  ip4)
+    $__dump_cmd net_ip4
+    ;;
+  ip4gw)
+    $__dump_cmd net_ip4gw
+    ;;
+  port_hog)
+    $__dump_cmd net_port_hog
+    ;;
+  serve)
+    $__dump_cmd net_serve
+    ;;
+  dump_url)
+    $__dump_cmd dump_url
+    ;;
+  wiki)
+    $__dump_cmd wiki
+    ;;
+  wifi_device)
+    $__dump_cmd wifi_device
+    ;;
+  wifi_name)
+    $__dump_cmd net_wifi_name
+    ;;
+  ssh_fingerprint)
+    $__dump_cmd net_ssh_fingerprint
+    ;;
+  ssh_aliases)
+    $__dump_cmd net_ssh_aliases
+    ;;
+  ssh_fqdn)
+    $__dump_cmd net_ssh_fqdn
+    ;;
+  wa_link)
+    $__dump_cmd net_wa_link
+    ;;
+  __net_gallery_ensure_venv)
+    $__dump_cmd __net_gallery_ensure_venv
+    ;;
+  gallery)
+    $__dump_cmd net_gallery
+    ;;
+  __net_write_static_ip4_dhcp_config_debian)
+    $__dump_cmd __net_write_static_ip4_dhcp_config_debian
+    ;;
+  __net_make_static_dhcp_ip4_config_debian)
+    $__dump_cmd __net_make_static_dhcp_ip4_config_debian
+    ;;
+  __net_get_ip4_config_debian)
+    $__dump_cmd __net_get_ip4_config_debian
+    ;;
+  __net_modified_static_dhcp4_config_debian)
+    $__dump_cmd __net_modified_static_dhcp4_config_debian
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[net/host]="-l --port -u --username -P --password -C certfile --keyfile"
+__q_complete_positional[net/host]="DIRECTORY"
+__q_complete_flag_type[net/host/-l]=STRING
+__q_complete_flag_type[net/host/--port]=STRING
+__q_complete_flag_type[net/host/-u]=USER
+__q_complete_flag_type[net/host/--username]=USER
+__q_complete_flag_type[net/host/-P]=STRING
+__q_complete_flag_type[net/host/--password]=STRING
+__q_complete_flag_type[net/host/-C]=FILE
+__q_complete_flag_type[net/host/certfile]=FILE
+__q_complete_flag_type[net/host/--keyfile]=FILE
+__q_complete_flags[net/dl]=""
+__q_complete_positional[net/dl]="STRING"
+__q_complete_flags[net/online]=""
+__q_complete_positional[net/online]=""
+__q_complete_flags[net/cidr_to_netmask]=""
+__q_complete_positional[net/cidr_to_netmask]="STRING"
+__q_complete_flags[net/health]=""
+__q_complete_positional[net/health]=""
+__q_complete_flags[net/ssh_fingerprint]=""
+__q_complete_positional[net/ssh_fingerprint]=""
+__q_complete_flags[net/dump_cert]=""
+__q_complete_positional[net/dump_cert]=""
+__q_complete_flags[net/ccurl]="-M --max-age -K --key --"
+__q_complete_positional[net/ccurl]=""
+__q_complete_flag_type[net/ccurl/-M]=STRING
+__q_complete_flag_type[net/ccurl/--max-age]=STRING
+__q_complete_flag_type[net/ccurl/-K]=STRING
+__q_complete_flag_type[net/ccurl/--key]=STRING
+__q_complete_flag_type[net/ccurl/--]=STRING
+__q_complete_flags[net/dataurl]=""
+__q_complete_positional[net/dataurl]="FILE"
+__q_complete_flags[net/undataurl]=""
+__q_complete_positional[net/undataurl]=""
+__q_complete_flags[net/rtt]=""
+__q_complete_positional[net/rtt]="HOSTNAME"
+__q_complete_flags[net/ip4]=""
+__q_complete_positional[net/ip4]=""
+__q_complete_flags[net/ip4gw]=""
+__q_complete_positional[net/ip4gw]=""
+__q_complete_flags[net/port_hog]=""
+__q_complete_positional[net/port_hog]="STRING"
+__q_complete_flags[net/serve]="-l"
+__q_complete_positional[net/serve]="FILE"
+__q_complete_flag_type[net/serve/-l]=STRING
+__q_complete_flags[net/dump_url]=""
+__q_complete_positional[net/dump_url]=""
+__q_complete_flags[net/wiki]=""
+__q_complete_positional[net/wiki]=""
+__q_complete_flags[net/wifi_device]=""
+__q_complete_positional[net/wifi_device]=""
+__q_complete_flags[net/wifi_name]=""
+__q_complete_positional[net/wifi_name]=""
+__q_complete_flags[net/ssh_fingerprint]=""
+__q_complete_positional[net/ssh_fingerprint]="HOSTNAME"
+__q_complete_flags[net/ssh_aliases]=""
+__q_complete_positional[net/ssh_aliases]=""
+__q_complete_flags[net/ssh_fqdn]=""
+__q_complete_positional[net/ssh_fqdn]="STRING"
+__q_complete_flags[net/wa_link]=""
+__q_complete_positional[net/wa_link]="STRING"
+__q_complete_flags[net/gallery]="--dedupe --scan-only --serve-only --force --clean --sqlite --copy-to --title -l --port -u --username -P --password -C --certfile --keyfile"
+__q_complete_positional[net/gallery]="DIRECTORY"
+__q_complete_flag_type[net/gallery/--dedupe]=SWITCH
+__q_complete_flag_type[net/gallery/--copy-to]=DIRECTORY
+__q_complete_flag_type[net/gallery/--scan-only]=SWITCH
+__q_complete_flag_type[net/gallery/--serve-only]=SWITCH
+__q_complete_flag_type[net/gallery/--force]=SWITCH
+__q_complete_flag_type[net/gallery/--clean]=SWITCH
+__q_complete_flag_type[net/gallery/--sqlite]=SWITCH
+__q_complete_flag_type[net/gallery/--title]=STRING
+__q_complete_flag_type[net/gallery/-l]=STRING
+__q_complete_flag_type[net/gallery/--port]=STRING
+__q_complete_flag_type[net/gallery/-u]=USER
+__q_complete_flag_type[net/gallery/--username]=USER
+__q_complete_flag_type[net/gallery/-P]=STRING
+__q_complete_flag_type[net/gallery/--password]=STRING
+__q_complete_flag_type[net/gallery/-C]=FILE
+__q_complete_flag_type[net/gallery/--certfile]=FILE
+__q_complete_flag_type[net/gallery/--keyfile]=FILE
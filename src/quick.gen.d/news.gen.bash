@@ -0,0 +1,78 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module news, sourced by __q_load.
+
+function __q_help_news() {
+  printf '%s' $'Usage: q news FUNCTION [ARG...]
+News and weather.
+
+Available functions:
+\033[1m  all
+\033[0m\033[36m\033[0m\033[1m  stocks
+\033[0m\033[36m\033[0m\033[1m  weather
+\033[0m\033[36m\033[0m\033[1m  brutalist_report_source
+\033[0m\033[36m\033[0m\033[1m  nytimes
+\033[0m\033[36m\033[0m\033[1m  npr
+\033[0m\033[36m\033[0m\033[1m  pbs
+\033[0m\033[36m\033[0m\033[1m  register
+\033[0m\033[36m\033[0m\033[1m  cnbc
+\033[0m\033[36m\033[0m'
+}
+
+function __q_dump_news() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  all)
+    $__dump_cmd news_all
+    ;;
+  stocks)
+    $__dump_cmd news_stocks
+    ;;
+  weather)
+    $__dump_cmd news_weather
+    ;;
+  brutalist_report_source)
+    $__dump_cmd news_brutalist_report_source
+    ;;
+  nytimes)
+    $__dump_cmd news_nytimes
+    ;;
+  npr)
+    $__dump_cmd news_npr
+    ;;
+  pbs)
+    $__dump_cmd news_pbs
+    ;;
+  register)
+    $__dump_cmd news_register
+    ;;
+  cnbc)
+    $__dump_cmd news_cnbc
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[news/all]=""
+__q_complete_positional[news/all]=""
+__q_complete_flags[news/stocks]=""
+__q_complete_positional[news/stocks]=""
+__q_complete_flags[news/weather]=""
+__q_complete_positional[news/weather]=""
+__q_complete_flags[news/brutalist_report_source]=""
+__q_complete_positional[news/brutalist_report_source]=""
+__q_complete_flags[news/nytimes]=""
+__q_complete_positional[news/nytimes]=""
+__q_complete_flags[news/npr]=""
+__q_complete_positional[news/npr]=""
+__q_complete_flags[news/pbs]=""
+__q_complete_positional[news/pbs]=""
+__q_complete_flags[news/register]=""
+__q_complete_positional[news/register]=""
+__q_complete_flags[news/cnbc]=""
+__q_complete_positional[news/cnbc]=""
@@ -0,0 +1,389 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module notes, sourced by __q_load.
+
+function __q_help_notes() {
+  printf '%s' $'Usage: q notes FUNCTION [ARG...]
+Note management based on git and markdown.
+
+Available functions:
+\033[1m  note [\033[0m\033[1m NOTE\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Saves the provided note, intelligently placing it and generating a title. If
+    run with no arguments, instead opens vim and saves whatever is entered into
+    the file.
+\033[1m  list
+\033[0m\033[36m\033[0m\033[1m  sync
+\033[0m\033[36m\033[0m\033[1m  todo [\033[0m\033[1m TERM\033[0m\033[1m ...\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Shows an interactive listing of matching TODOs.
+    
+    Uses the following categories:
+    A - 💬 - Asynchronous Comms
+    B - 💰 - Bank
+    C - 📅 - Calendar
+    E - 🏃 - Errand
+    H - 🏠 - Home
+    M - 👥 - Meeting
+    L - 💩 - Long Task
+    O - 👔 - Office
+    R - 📚 - Reading
+    S - 🛒 - Shopping
+    T - 📞 - Telephone
+    W - 📝 - Writing
+    X - 🛠️ - Technical Task
+    Z - ⏩ - Misc Quick Task
+    📥 - Inbox
+\033[1m  undo [\033[0m\033[1m -f\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Undoes the last note change. If the last change was to a local note, it will
+    refuse to undo it, unless -f is passed.
+\033[1m  perl PROG\033[0m\033[1m [\033[0m\033[1m TERM\033[0m\033[1m ...\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Applies the provided perl program to matching notes to generate replacements.
+    Then allows the user to select which replacements to save.
+\033[1m  api_list_notes [\033[0m\033[1m -f\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -a\033[0m\033[1m TERM\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Outputs a list of notes files that match the given terms.
+    
+    Options:
+    -f: Only match files, not directories.
+    -a: Include archived files.
+    -w: Match whole words.
+    
+    Outputs:
+    1. relative path
+    2. mtime
+    3. age
+    4. line count
+    5. depth
+    6. absolute path
+    7. type (f or d)
+    8. title
+    9. location (g=git or l=local)
+    10. base path
+    11. Quick-TODO-aware title
+    12. Archived (A if archived - if not)
+\033[1m  backup
+\033[0m\033[36m\033[0m    Backs up the notes repository to a timestamped tarball in the notes root.
+\033[1m  api_empty_notes
+\033[0m\033[36m\033[0m    Lists empty notes.
+\033[1m  api_list_todos [\033[0m\033[1m CONTEXT\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m TERM\033[0m\033[1m ...\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Lists TODOs matching the given context and terms.
+    
+    Outputs:
+    
+    1. Path
+    2. Line number
+    3. State (TODO or DONE)
+    4. Text of the TODO
+    5. Absolute path
+    6. File age
+    7. File mtime
+    8. Current state: TODO|DONE|LATER|OVERDUE|SOON
+    9. Earliest date (if any)
+    10. Due date (if any)
+    11. Context (one letter)
+\033[1m  print_todo_categories
+\033[0m\033[36m\033[0m\033[1m  api_git [\033[0m\033[1m ARGS\033[0m\033[1m ...\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Forwards its args to git running with the correct key and in the notes root.
+\033[1m  api_pushd
+\033[0m\033[36m\033[0m\033[1m  api_clone
+\033[0m\033[36m\033[0m    Clones the git reposity.
+\033[1m  api_fsck
+\033[0m\033[36m\033[0m    Resets the mtime of notes files from git.
+\033[1m  nw
+\033[0m\033[36m\033[0m\033[1m  window
+\033[0m\033[36m    alias nwin=\'q notes window\'
+\033[0m\033[1m  api_find
+\033[0m\033[36m\033[0m    Runs find automatically scoped to the right mtime by the NEND and NSTART env
+    variables.
+\033[1m  api_quick_title
+\033[0m\033[36m\033[0m\033[1m  log
+\033[0m\033[36m\033[0m\033[1m  api_match_files
+\033[0m\033[36m\033[0m    Returns a list of files, as absolute paths, that match a search query. The
+    query is a list of terms, separated by spaces. Each term is either a
+    pro-pattern, or an anti-pattern:
+    
+    Pro-pattern terms are regular words (e.g. \'foo\') that MUST appear in the file.
+    If there are multiple pro-pattern terms, then they all must appear for a file
+    to match (match all).
+    
+    Anti-pattern terms start with a tilde `~` (e.g. `~bar`). Any file containing
+    even one of the anti-pattern terms is excluded from the results.
+    
+    Without any pro-patterns, starts with matching all files.
+    
+    Additional flags start with a dash \'-\', to be supplied in any position:
+    
+    -w match only complete words (DEFAULT) -W match substrings
+\033[1m  ls [\033[0m\033[1m TERM\033[0m\033[1m ...\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Prints a tree of notes, with the TERM as a filter.
+\033[1m  hist [\033[0m\033[1m N\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Prints the N most recent notes.
+\033[1m  api_drop_note NOTE\033[0m\033[1m
+\033[0m\033[36m\033[0m    Delete the note at the provided relative path.
+\033[1m  gc
+\033[0m\033[36m\033[0m    Deletes empty notes and runs git gc.
+\033[1m  api_update_note\033[91m RELPATH\033[0m\033[1m CONTENTS\033[0m\033[1m
+\033[0m\033[36m\033[0m    Updates the note at the given relative path with the given contents.
+\033[1m  api_edit_note\033[91m PATH\033[0m\033[1m [\033[0m\033[1m LINE\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Opens vim for the given relative note path, then updates the notes tree using
+    the result. Optional second argument is the line number to open vim at.
+\033[1m  api_perl_preview PROG\033[0m\033[1m [\033[0m\033[1m TERM\033[0m\033[1m ...\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Applies the provided perl program to matching notes to generate replacements.
+    Returns the potential replacements.
+\033[1m  claude
+\033[0m\033[36m\033[0m    Opens a Claude Code session in the notes repository.
+\033[1m  api_pushd
+\033[0m\033[36m\033[0m    Changes to the notes repository directory. (With pushd.)
+'
+}
+
+function __q_dump_notes() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  __elide)
+    $__dump_cmd __elide
+    ;;
+  __file_mtime_and_age)
+    $__dump_cmd __file_mtime_and_age
+    ;;
+  __notes_api_list_notes_batch)
+    $__dump_cmd __notes_api_list_notes_batch
+    ;;
+  note)
+    $__dump_cmd notes_note
+    ;;
+  list)
+    $__dump_cmd notes_list
+    ;;
+  sync)
+    $__dump_cmd notes_sync
+    ;;
+  todo)
+    $__dump_cmd notes_todo
+    ;;
+  undo)
+    $__dump_cmd notes_undo
+    ;;
+  perl)
+    $__dump_cmd notes_perl
+    ;;
+  api_list_notes)
+    $__dump_cmd notes_api_list_notes
+    ;;
+  __nonempty_wc_l)
+    $__dump_cmd __nonempty_wc_l
+    ;;
+  backup)
+    $__dump_cmd notes_backup
+    ;;
+  api_empty_notes)
+    $__dump_cmd notes_api_empty_notes
+    ;;
+  __date_add)
+    $__dump_cmd __date_add
+    ;;
+  __wday)
+    $__dump_cmd __wday
+    ;;
+  __date_sub)
+    $__dump_cmd __date_sub
+    ;;
+  __date_convert)
+    $__dump_cmd __date_convert
+    ;;
+  __wday_number)
+    $__dump_cmd __wday_number
+    ;;
+  __relative_moment)
+    $__dump_cmd __relative_moment
+    ;;
+  __when)
+    $__dump_cmd __when
+    ;;
+  __notes_api_list_todos_batch)
+    $__dump_cmd __notes_api_list_todos_batch
+    ;;
+  api_list_todos)
+    $__dump_cmd notes_api_list_todos
+    ;;
+  print_todo_categories)
+    $__dump_cmd print_todo_categories
+    ;;
+  __todo_context_emoji)
+    $__dump_cmd __todo_context_emoji
+    ;;
+  __select_todo)
+    $__dump_cmd __select_todo
+    ;;
+  api_git)
+    $__dump_cmd notes_api_git
+    ;;
+  api_pushd)
+    $__dump_cmd notes_api_pushd
+    ;;
+  api_clone)
+    $__dump_cmd notes_api_clone
+    ;;
+  __fix_mtime_from_git)
+    $__dump_cmd __fix_mtime_from_git
+    ;;
+  api_fsck)
+    $__dump_cmd notes_api_fsck
+    ;;
+  __date_unit)
+    $__dump_cmd __date_unit
+    ;;
+  __parse_age)
+    $__dump_cmd __parse_age
+    ;;
+  nw)
+    $__dump_cmd nw
+    ;;
+  window)
+    $__dump_cmd notes_window
+    ;;
+  api_find)
+    $__dump_cmd notes_api_find
+    ;;
+  api_quick_title)
+    $__dump_cmd notes_api_quick_title
+    ;;
+  __notes_filename)
+    $__dump_cmd __notes_filename
+    ;;
+  log)
+    $__dump_cmd notes_log
+    ;;
+  __match_files_one)
+    $__dump_cmd __match_files_one
+    ;;
+  __match_files_all)
+    $__dump_cmd __match_files_all
+    ;;
+  __match_files_regex)
+    $__dump_cmd __match_files_regex
+    ;;
+  api_match_files)
+    $__dump_cmd notes_api_match_files
+    ;;
+  __todo_title)
+    $__dump_cmd __todo_title
+    ;;
+  __notes_title)
+    $__dump_cmd __notes_title
+    ;;
+  __notes_category)
+    $__dump_cmd __notes_category
+    ;;
+  __preamble)
+    $__dump_cmd __preamble
+    ;;
+  ls)
+    $__dump_cmd notes_ls
+    ;;
+  hist)
+    $__dump_cmd notes_hist
+    ;;
+  api_drop_note)
+    $__dump_cmd notes_api_drop_note
+    ;;
+  __notes_gen)
+    $__dump_cmd __notes_gen
+    ;;
+  gc)
+    $__dump_cmd notes_gc
+    ;;
+  api_update_note)
+    $__dump_cmd notes_api_update_note
+    ;;
+  api_edit_note)
+    $__dump_cmd notes_api_edit_note
+    ;;
+  __notes_api_perl_preview_batch)
+    $__dump_cmd __notes_api_perl_preview_batch
+    ;;
+  api_perl_preview)
+    $__dump_cmd notes_api_perl_preview
+    ;;
+  __nperl_render_preview)
+    $__dump_cmd __nperl_render_preview
+    ;;
+  __nperl_apply)
+    $__dump_cmd __nperl_apply
+    ;;
+  claude)
+    $__dump_cmd notes_claude
+    ;;
+  api_pushd)
+    $__dump_cmd notes_api_pushd
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[notes/note]=""
+__q_complete_positional[notes/note]="STRING"
+__q_complete_flags[notes/list]=""
+__q_complete_positional[notes/list]=""
+__q_complete_flags[notes/sync]=""
+__q_complete_positional[notes/sync]=""
+__q_complete_flags[notes/todo]=""
+__q_complete_positional[notes/todo]="STRING"
+__q_complete_flags[notes/undo]="-f"
+__q_complete_positional[notes/undo]=""
+__q_complete_flag_type[notes/undo/-f]=SWITCH
+__q_complete_flags[notes/perl]=""
+__q_complete_positional[notes/perl]="STRING STRING"
+__q_complete_flags[notes/api_list_notes]="-f -a"
+__q_complete_positional[notes/api_list_notes]=""
+__q_complete_flag_type[notes/api_list_notes/-f]=SWITCH
+__q_complete_flag_type[notes/api_list_notes/-a]=STRING
+__q_complete_flags[notes/backup]=""
+__q_complete_positional[notes/backup]=""
+__q_complete_flags[notes/api_empty_notes]=""
+__q_complete_positional[notes/api_empty_notes]=""
+__q_complete_flags[notes/api_list_todos]=""
+__q_complete_positional[notes/api_list_todos]="STRING STRING"
+__q_complete_flags[notes/print_todo_categories]=""
+__q_complete_positional[notes/print_todo_categories]=""
+__q_complete_flags[notes/api_git]=""
+__q_complete_positional[notes/api_git]="STRING"
+__q_complete_flags[notes/api_pushd]=""
+__q_complete_positional[notes/api_pushd]=""
+__q_complete_flags[notes/api_clone]=""
+__q_complete_positional[notes/api_clone]=""
+__q_complete_flags[notes/api_fsck]=""
+__q_complete_positional[notes/api_fsck]=""
+__q_complete_flags[notes/nw]=""
+__q_complete_positional[notes/nw]=""
+__q_complete_flags[notes/window]=""
+__q_complete_positional[notes/window]=""
+__q_complete_flags[notes/api_find]=""
+__q_complete_positional[notes/api_find]=""
+__q_complete_flags[notes/api_quick_title]=""
+__q_complete_positional[notes/api_quick_title]=""
+__q_complete_flags[notes/log]=""
+__q_complete_positional[notes/log]=""
+__q_complete_flags[notes/api_match_files]=""
+__q_complete_positional[notes/api_match_files]=""
+__q_complete_flags[notes/ls]=""
+__q_complete_positional[notes/ls]="STRING"
+__q_complete_flags[notes/hist]=""
+__q_complete_positional[notes/hist]="STRING"
+__q_complete_flags[notes/api_drop_note]=""
+__q_complete_positional[notes/api_drop_note]="STRING"
+__q_complete_flags[notes/gc]=""
+__q_complete_positional[notes/gc]=""
+__q_complete_flags[notes/api_update_note]=""
+__q_complete_positional[notes/api_update_note]="FILE STRING"
+__q_complete_flags[notes/api_edit_note]=""
+__q_complete_positional[notes/api_edit_note]="FILE STRING"
+__q_complete_flags[notes/api_perl_preview]=""
+__q_complete_positional[notes/api_perl_preview]="STRING STRING"
+__q_complete_flags[notes/claude]=""
+__q_complete_positional[notes/claude]=""
+__q_complete_flags[notes/api_pushd]=""
+__q_complete_positional[notes/api_pushd]=""
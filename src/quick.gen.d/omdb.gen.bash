@@ -0,0 +1,79 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module omdb, sourced by __q_load.
+
+function __q_help_omdb() {
+  printf '%s' $'Usage: q omdb FUNCTION [ARG...]
+OMDB (Open Movie Database) helpers for bash.
+
+Available functions:
+\033[1m  set_key KEY\033[0m\033[1m
+\033[0m\033[36m\033[0m    Configure a new KEY for the OMDB API.
+\033[1m  register_key
+\033[0m\033[36m\033[0m    Interactive prompt to configure the API key for OMDB.
+\033[1m  get_key
+\033[0m\033[36m\033[0m    Prints the API key for OMDB.
+\033[1m  query [\033[0m\033[1m -f\033[0m\033[1m QUERY\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Query the OMDB API with the given query. Prints JSON to stdout. Results are
+    cached. Use -f to force a fresh query.
+    
+    The query consists of a series of PARAMETER=QUERY pairs. Valid parameters are
+    documented at http://www.omdbapi.com.
+    
+    Examples:
+    q omdb query "t=The Matrix"
+    q omdb query "i=tt0133093"
+    
+    Useful parameters include:
+    
+    - t: Title of the movie.
+    - i: IMDB ID of the movie.
+\033[1m  guess_title\033[91m FILE\033[0m\033[1m
+\033[0m\033[36m\033[0m    Guess the title of the movie based on the filename.
+'
+}
+
+function __q_dump_omdb() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  __omdb_key_path)
+    $__dump_cmd __omdb_key_path
+    ;;
+  set_key)
+    $__dump_cmd omdb_set_key
+    ;;
+  register_key)
+    $__dump_cmd omdb_register_key
+    ;;
+  get_key)
+    $__dump_cmd omdb_get_key
+    ;;
+  __omdb_query_string)
+    $__dump_cmd __omdb_query_string
+    ;;
+  query)
+    $__dump_cmd omdb_query
+    ;;
+  guess_title)
+    $__dump_cmd omdb_guess_title
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[omdb/set_key]=""
+__q_complete_positional[omdb/set_key]="STRING"
+__q_complete_flags[omdb/register_key]=""
+__q_complete_positional[omdb/register_key]=""
+__q_complete_flags[omdb/get_key]=""
+__q_complete_positional[omdb/get_key]=""
+__q_complete_flags[omdb/query]="-f"
+__q_complete_positional[omdb/query]=""
+__q_complete_flag_type[omdb/query/-f]=STRING
+__q_complete_flags[omdb/guess_title]=""
+__q_complete_positional[omdb/guess_title]="FILE"
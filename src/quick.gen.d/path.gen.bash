@@ -0,0 +1,54 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module path, sourced by __q_load.
+
+function __q_help_path() {
+  printf '%s' $'Usage: q path FUNCTION [ARG...]
+UNIX style path helpers.
+
+Available functions:
+\033[1m  expand\033[91m PATH\033[0m\033[1m
+\033[0m\033[36m\033[0m    Expands tilde, safely, in the path.
+\033[1m  resolve\033[91m PATH\033[0m\033[1m
+\033[0m\033[36m\033[0m    Prints the absolute path of PATH, with any tilde interpolated.
+\033[1m  push\033[31m DIRECTORY\033[0m\033[1m
+\033[0m\033[36m\033[0m    This is like pushd, except it also updates the name of the screen window to
+    the new path, if run from inside a screen session.
+\033[1m  pop
+\033[0m\033[36m\033[0m    This is like popd, except it also updates the name of the screen window to the
+    new path, if run from inside a screen session.
+'
+}
+
+function __q_dump_path() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  expand)
+    $__dump_cmd path_expand
+    ;;
+  resolve)
+    $__dump_cmd path_resolve
+    ;;
+  push)
+    $__dump_cmd path_push
+    ;;
+  pop)
+    $__dump_cmd path_pop
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[path/expand]=""
+__q_complete_positional[path/expand]="FILE"
+__q_complete_flags[path/resolve]=""
+__q_complete_positional[path/resolve]="FILE"
+__q_complete_flags[path/push]=""
+__q_complete_positional[path/push]="DIRECTORY"
+__q_complete_flags[path/pop]=""
+__q_complete_positional[path/pop]=""
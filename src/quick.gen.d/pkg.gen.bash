@@ -0,0 +1,32 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module pkg, sourced by __q_load.
+
+function __q_help_pkg() {
+  printf '%s' $'Usage: q pkg FUNCTION [ARG...]
+Cross-platform package management.
+
+Available functions:
+\033[1m  install_or_skip [\033[0m\033[1m PACKAGE\033[0m\033[1m ...\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Install packages using the system package manager, or skip, if the package is
+    already installed.
+'
+}
+
+function __q_dump_pkg() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  install_or_skip)
+    $__dump_cmd pkg_install_or_skip
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[pkg/install_or_skip]=""
+__q_complete_positional[pkg/install_or_skip]="STRING"
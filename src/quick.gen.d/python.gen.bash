@@ -0,0 +1,198 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module python, sourced by __q_load.
+
+function __q_help_python() {
+  printf '%s' $'Usage: q python FUNCTION [ARG...]
+Python env management, python-shell FFI and Jupyter.
+
+Available functions:
+\033[1m  venv [\033[0m\033[1m -I|--install-requirements\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -p|--python-path\033[0m\033[1m\033[91m PATH\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -q|--quiet\033[0m\033[1m VERSION\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m    alias venv=\'q python venv\'
+\033[0m    Create a new virtualenv in the current directory, using the latest available
+    python version. If a virtualenv already exists, activate it. If -I is passed,
+    install requirements.txt. If -p is passed, use the specified Python binary. If
+    VERSION is passed, find a python binary with that version.
+    
+    Once a virtualenv is set up, python_venv stamps it with the interpreter path
+    and the checksum of requirements.txt (in .venv/redshell_ready). While neither
+    changes, later calls just activate it, without probing pip or installing
+    anything. If requirements.txt changes, it\'s installed again. If installing
+    it fails, the virtualenv isn\'t stamped and python_venv returns non-zero.
+\033[1m  pip_run [\033[0m\033[1m -p|--python-path\033[0m\033[1m\033[91m PATH\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -P|--package\033[0m\033[1m PACKAGE\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m EXE\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m ARGS\033[0m\033[1m ...\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Run a Python script with the specified package installed.
+\033[1m  ipynb [\033[0m\033[1m -I|--install-requirements\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -p|--python-path\033[0m\033[1m\033[91m PATH\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m VERSION\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m    alias ipynb=\'q python ipynb\'
+\033[0m    Creates a new virtualenv in the current directory (as venv) and opens a new
+    Jupyter notebook.
+\033[1m  detect
+\033[0m\033[36m\033[0m    Find all available Python binaries in the PATH and their versions.
+    Prints a tab-separated list: VERSION  PATH  SHORT_VERSION
+\033[1m  latest
+\033[0m\033[36m\033[0m    Returns the path to the latest available Python binary.
+\033[1m  func_stop_workers
+\033[0m\033[36m\033[0m    Stops all python_func --daemon workers.
+\033[1m  func -f|--function\033[0m\033[1m FUNCTION\033[0m\033[1m -p|--path\033[0m\033[1m\033[91m PATH\033[0m\033[1m [\033[0m\033[1m -J|--json_output\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m --clean\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m --debug\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m --quiet\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m --no-venv\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -D|--daemon\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -B|--batch\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m --profile\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m --pstats\033[0m\033[1m\033[91m FILE\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m --\033[0m\033[1m ARGS\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Run a Python function from a file. Calls `q python venv` to setup the
+    environment. The function must be defined in the file and must be a top-level
+    function. The function must be defined with type hints for all arguments.
+    
+    Function arguments are passed as positional arguments or keyword arguments.
+    Keyword arguments are passed as --KEY VALUE. Positional arguments are passed
+    after a single --.
+    
+    Example: python_func -f my_function -p my_file.py --kwarg val -- --arg1 arg2
+    
+    Arguments:
+    -f|--function: The name of the function to run.
+    -p|--path: The path to the Python file.
+    -J|--json-output: Serialize the output as JSON.
+    --clean: Delete the virtualenv after running the function.
+    --debug: Print the Python script that was executed.
+    --quiet: Do not print any output from the virtualenv creation.
+    --no-venv: Do not create a virtualenv.
+    -D|--daemon: Run the function in a persistent worker process (see below).
+    -B|--batch: Read calls as JSON Lines from stdin (see below).
+    --profile: Print where the time went (see below).
+    --pstats FILE: Also save the cProfile data to FILE. Implies --profile.
+    
+    If the function returns a generator or another iterator, each item is printed
+    as soon as it\'s produced, and with --json-output, each is one JSON line.
+    
+    With --daemon, or if ~/.redshell_persist/python_daemon exists, the call goes
+    to a worker that keeps the module imported between calls (python_worker.py).
+    There is one worker per interpreter and directory, started on first use and
+    stopped after 30 minutes without calls. The worker reloads the module if the
+    file changed. Arguments and output work the same as without it.
+    
+    With --batch, each line of stdin is one call, as a JSON object:
+    
+    {"function": "NAME", "args": [...], "kwargs": {...}, "id": ...}
+    
+    All calls run in one interpreter, in order. For each call, one JSON line is
+    printed as soon as it returns: {"ok": true, "result": ...} or {"ok": false,
+    "error": "..."}, with the call\'s "id" if it had one. A failed call doesn\'t
+    stop the batch. "function" defaults to FUNCTION. String arguments are
+    converted like command-line arguments; other JSON values are passed as-is.
+    
+    Example:
+    printf \'%s\\n\' \'{"args": ["a.bash", "/"]}\' \'{"args": ["b.bash", "/"]}\' \\
+    | python_func -p quick.py --no-venv --batch path_to_package
+    
+    With --profile, python_func prints a breakdown to stderr after the call: the
+    time spent checking the venv, starting the interpreter, importing the module
+    and running the call, a cProfile report of the call, and the slowest imports
+    of the module (measured in a separate, fresh interpreter with
+    -X importtime). Load the --pstats file with python -m pstats FILE.
+\033[1m  black [\033[0m\033[1m\033[91m FILES\033[0m\033[1m ...\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Run the black code formatter on the specified files.
+'
+}
+
+function __q_dump_python() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  __python_ensurepip)
+    $__dump_cmd __python_ensurepip
+    ;;
+  __python_ensurevenv)
+    $__dump_cmd __python_ensurevenv
+    ;;
+  __fix_stupid_virtualenv_behavior)
+    $__dump_cmd __fix_stupid_virtualenv_behavior
+    ;;
+  __python_requirements_sum)
+    $__dump_cmd __python_requirements_sum
+    ;;
+  __python_venv_stamp)
+    $__dump_cmd __python_venv_stamp
+    ;;
+  __python_venv_interpreter)
+    $__dump_cmd __python_venv_interpreter
+    ;;
+  venv)
+    $__dump_cmd python_venv
+    ;;
+  pip_run)
+    $__dump_cmd python_pip_run
+    ;;
+  ipynb)
+    $__dump_cmd python_ipynb
+    ;;
+  detect)
+    $__dump_cmd python_detect
+    ;;
+  latest)
+    $__dump_cmd python_latest
+    ;;
+  __python_now)
+    $__dump_cmd __python_now
+    ;;
+  __python_func_worker)
+    $__dump_cmd __python_func_worker
+    ;;
+  func_stop_workers)
+    $__dump_cmd python_func_stop_workers
+    ;;
+  func)
+    $__dump_cmd python_func
+    ;;
+  black)
+    $__dump_cmd python_black
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[python/venv]="-I --install-requirements -p --python-path -q --quiet"
+__q_complete_positional[python/venv]=""
+__q_complete_flag_type[python/venv/-I]=SWITCH
+__q_complete_flag_type[python/venv/--install-requirements]=SWITCH
+__q_complete_flag_type[python/venv/-p]=FILE
+__q_complete_flag_type[python/venv/--python-path]=FILE
+__q_complete_flag_type[python/venv/-q]=STRING
+__q_complete_flag_type[python/venv/--quiet]=STRING
+__q_complete_flags[python/pip_run]="-p --python-path -P --package"
+__q_complete_positional[python/pip_run]="STRING STRING"
+__q_complete_flag_type[python/pip_run/-p]=FILE
+__q_complete_flag_type[python/pip_run/--python-path]=FILE
+__q_complete_flag_type[python/pip_run/-P]=STRING
+__q_complete_flag_type[python/pip_run/--package]=STRING
+__q_complete_flags[python/ipynb]="-I --install-requirements -p --python-path"
+__q_complete_positional[python/ipynb]="STRING"
+__q_complete_flag_type[python/ipynb/-I]=SWITCH
+__q_complete_flag_type[python/ipynb/--install-requirements]=SWITCH
+__q_complete_flag_type[python/ipynb/-p]=FILE
+__q_complete_flag_type[python/ipynb/--python-path]=FILE
+__q_complete_flags[python/detect]=""
+__q_complete_positional[python/detect]=""
+__q_complete_flags[python/latest]=""
+__q_complete_positional[python/latest]=""
+__q_complete_flags[python/func_stop_workers]=""
+__q_complete_positional[python/func_stop_workers]=""
+__q_complete_flags[python/func]="-J --json_output --clean --debug --quiet --no-venv -D --daemon -B --batch --profile -f --function -p --path --pstats --"
+__q_complete_positional[python/func]=""
+__q_complete_flag_type[python/func/-f]=STRING
+__q_complete_flag_type[python/func/--function]=STRING
+__q_complete_flag_type[python/func/-p]=FILE
+__q_complete_flag_type[python/func/--path]=FILE
+__q_complete_flag_type[python/func/-J]=SWITCH
+__q_complete_flag_type[python/func/--json_output]=SWITCH
+__q_complete_flag_type[python/func/--clean]=SWITCH
+__q_complete_flag_type[python/func/--debug]=SWITCH
+__q_complete_flag_type[python/func/--quiet]=SWITCH
+__q_complete_flag_type[python/func/--no-venv]=SWITCH
+__q_complete_flag_type[python/func/-D]=SWITCH
+__q_complete_flag_type[python/func/--daemon]=SWITCH
+__q_complete_flag_type[python/func/-B]=SWITCH
+__q_complete_flag_type[python/func/--batch]=SWITCH
+__q_complete_flag_type[python/func/--profile]=SWITCH
+__q_complete_flag_type[python/func/--pstats]=FILE
+__q_complete_flag_type[python/func/--]=STRING
+__q_complete_flags[python/black]=""
+__q_complete_positional[python/black]="FILE"
@@ -0,0 +1,82 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module quick, sourced by __q_load.
+
+function __q_help_quick() {
+  printf '%s' $'Usage: q quick FUNCTION [ARG...]
+Redshell function help, switch and autocomplete.
+
+Available functions:
+\033[1m  rebuild [\033[0m\033[1m --src-path\033[0m\033[1m\033[91m PATH\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m --skip-extra-paths\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m --no-cache\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -j|--jobs\033[0m\033[1m N\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m --dispatch\033[0m\033[1m STRING\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m --autoload\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -w|--watch\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Regenerate quick.gen.bash from all modules in src and module_paths.txt. Parsed
+    modules are cached by content hash in ~/.redshell_persist/quick_cache.json, so
+    only changed files are re-parsed. Pass --no-cache to parse everything.
+    
+    With --jobs N, modules are parsed by N processes in parallel (0 means one per
+    CPU). This helps with large module_paths.txt trees.
+    
+    --dispatch table makes q look functions up in an associative array instead of
+    a case statement, which is faster with many modules. (Default: case.)
+    
+    --autoload also generates quick.gen.autoload.sh, with a stub for every
+    function that sources its module on first call. If it exists, bash_profile
+    sources only the stubs, init.bash and quick.bash at startup. Autoload stays on
+    for later rebuilds while ~/.redshell_persist/autoload exists; --autoload
+    creates it, and deleting it turns autoload off on the next rebuild.
+    
+    --watch keeps running and rebuilds whenever a module changes, until
+    interrupted with Ctrl-C. Only changed modules are re-parsed, and generated
+    files are only rewritten if their content changes.
+\033[1m  search [\033[0m\033[1m --index\033[0m\033[1m\033[91m FILE\033[0m\033[1m ]\033[0m\033[1m TERM\033[0m\033[1m ...\033[0m\033[1m
+\033[0m\033[36m\033[0m    Find functions by the words in their name, aliases, argument names and doc
+    comment. Each TERM matches words that start with it, and every TERM must
+    match. Results are ranked by where the terms matched: the name first, then
+    aliases, arguments and the doc comment.
+    
+    Answers from quick.gen.search.tsv, which quick_rebuild writes next to
+    quick.gen.bash, without parsing any modules. (Default index:
+    ~/.redshell/src/quick.gen.search.tsv)
+\033[1m  q
+\033[0m\033[36m\033[0m'
+}
+
+function __q_dump_quick() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  __quick_build_all)
+    $__dump_cmd __quick_build_all
+    ;;
+  rebuild)
+    $__dump_cmd quick_rebuild
+    ;;
+  search)
+    $__dump_cmd quick_search
+    ;;
+  q)
+    $__dump_cmd q
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[quick/rebuild]="--skip-extra-paths --no-cache --autoload -w --watch --src-path -j --jobs --dispatch"
+__q_complete_positional[quick/rebuild]=""
+__q_complete_flag_type[quick/rebuild/--src-path]=FILE
+__q_complete_flag_type[quick/rebuild/--skip-extra-paths]=SWITCH
+__q_complete_flag_type[quick/rebuild/--no-cache]=SWITCH
+__q_complete_flag_type[quick/rebuild/-j]=STRING
+__q_complete_flag_type[quick/rebuild/--jobs]=STRING
+__q_complete_flag_type[quick/rebuild/--dispatch]=STRING
+__q_complete_flag_type[quick/rebuild/--autoload]=SWITCH
+__q_complete_flag_type[quick/rebuild/-w]=SWITCH
+__q_complete_flag_type[quick/rebuild/--watch]=SWITCH
+__q_complete_flags[quick/search]="--index"
+__q_complete_positional[quick/search]="STRING"
+__q_complete_flag_type[quick/search/--index]=FILE
+__q_complete_flags[quick/q]=""
+__q_complete_positional[quick/q]=""
@@ -0,0 +1,56 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module redhat, sourced by __q_load.
+
+function __q_help_redhat() {
+  printf '%s' $'Usage: q redhat FUNCTION [ARG...]
+Red Hat family (RHEL, Fedora, Rocky, Alma, CentOS) setup and package management.
+
+Available functions:
+\033[1m  setup
+\033[0m\033[36m\033[0m\033[1m  install_extras
+\033[0m\033[36m\033[0m    Install the full development environment on RHEL/Fedora/Rocky/Alma/CentOS.
+\033[1m  dnf_install_or_skip PACKAGE\033[0m\033[1m ...\033[0m\033[1m
+\033[0m\033[36m\033[0m    Install a package with dnf if it\'s not already installed.
+\033[1m  install_imgcat
+\033[0m\033[36m\033[0m\033[1m  setup_mc
+\033[0m\033[36m\033[0m'
+}
+
+function __q_dump_redhat() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  setup)
+    $__dump_cmd redhat_setup
+    ;;
+  install_extras)
+    $__dump_cmd redhat_install_extras
+    ;;
+  dnf_install_or_skip)
+    $__dump_cmd dnf_install_or_skip
+    ;;
+  install_imgcat)
+    $__dump_cmd redhat_install_imgcat
+    ;;
+  setup_mc)
+    $__dump_cmd redhat_setup_mc
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[redhat/setup]=""
+__q_complete_positional[redhat/setup]=""
+__q_complete_flags[redhat/install_extras]=""
+__q_complete_positional[redhat/install_extras]=""
+__q_complete_flags[redhat/dnf_install_or_skip]=""
+__q_complete_positional[redhat/dnf_install_or_skip]="STRING"
+__q_complete_flags[redhat/install_imgcat]=""
+__q_complete_positional[redhat/install_imgcat]=""
+__q_complete_flags[redhat/setup_mc]=""
+__q_complete_positional[redhat/setup_mc]=""
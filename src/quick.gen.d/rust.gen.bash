@@ -0,0 +1,36 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module rust, sourced by __q_load.
+
+function __q_help_rust() {
+  printf '%s' $'Usage: q rust FUNCTION [ARG...]
+Manage rust toolchain and environment.
+
+Available functions:
+\033[1m  rustup
+\033[0m\033[36m\033[0m\033[1m  install_goodies
+\033[0m\033[36m\033[0m'
+}
+
+function __q_dump_rust() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  rustup)
+    $__dump_cmd rustup
+    ;;
+  install_goodies)
+    $__dump_cmd rust_install_goodies
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[rust/rustup]=""
+__q_complete_positional[rust/rustup]=""
+__q_complete_flags[rust/install_goodies]=""
+__q_complete_positional[rust/install_goodies]=""
@@ -0,0 +1,54 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module screen, sourced by __q_load.
+
+function __q_help_screen() {
+  printf '%s' $'Usage: q screen FUNCTION [ARG...]
+Manage screen sessions.
+
+Available functions:
+\033[1m  session
+\033[0m\033[36m\033[0m\033[1m  window
+\033[0m\033[36m\033[0m\033[1m  rename
+\033[0m\033[36m\033[0m\033[1m  home
+\033[0m\033[36m\033[0m\033[1m  reset_dirname
+\033[0m\033[36m\033[0m'
+}
+
+function __q_dump_screen() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  session)
+    $__dump_cmd screen_session
+    ;;
+  window)
+    $__dump_cmd screen_window
+    ;;
+  rename)
+    $__dump_cmd screen_rename
+    ;;
+  home)
+    $__dump_cmd screen_home
+    ;;
+  reset_dirname)
+    $__dump_cmd screen_reset_dirname
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[screen/session]=""
+__q_complete_positional[screen/session]=""
+__q_complete_flags[screen/window]=""
+__q_complete_positional[screen/window]=""
+__q_complete_flags[screen/rename]=""
+__q_complete_positional[screen/rename]=""
+__q_complete_flags[screen/home]=""
+__q_complete_positional[screen/home]=""
+__q_complete_flags[screen/reset_dirname]=""
+__q_complete_positional[screen/reset_dirname]=""
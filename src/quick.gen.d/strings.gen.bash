@@ -0,0 +1,90 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module strings, sourced by __q_load.
+
+function __q_help_strings() {
+  printf '%s' $'Usage: q strings FUNCTION [ARG...]
+String helpers for bash and zsh.
+
+Available functions:
+\033[1m  urlencode
+\033[0m\033[36m\033[0m    Usage strings_urlencode STRING
+    
+    URL-encodes a string. DO NOT USE with curl: prefer --data-urlencode.
+\033[1m  strip_control
+\033[0m\033[36m\033[0m    Strips terminal escape sequences from standard input.
+\033[1m  repeat STRING\033[0m\033[1m N\033[0m\033[1m
+\033[0m\033[36m\033[0m    Prints STRING N times.
+\033[1m  join DELIMITER\033[0m\033[1m [\033[0m\033[1m STRING\033[0m\033[1m ...\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m\033[1m  sgrep [\033[0m\033[1m -C\033[0m\033[1m NUM\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m    alias sgrep=\'q strings sgrep\'
+\033[0m\033[1m  strip_prefix PREFIX\033[0m\033[1m STRING\033[0m\033[1m
+\033[0m\033[36m\033[0m    Strips the prefix from the string if it\'s there.
+\033[1m  trim STRING\033[0m\033[1m
+\033[0m\033[36m\033[0m    Strips leading and trailing whitespace from a string.
+\033[1m  elide TEXT\033[0m\033[1m LIMIT\033[0m\033[1m [\033[0m\033[1m COLOR\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Elides TEXT to LIMIT characters, inserting "(...)" in the middle if needed.
+    If COLOR is provided, it will be used to color the ellipsis.
+\033[1m  strip_prefix PREFIX\033[0m\033[1m STRING\033[0m\033[1m
+\033[0m\033[36m\033[0m    Strips the prefix from the string if it\'s there.
+'
+}
+
+function __q_dump_strings() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  urlencode)
+    $__dump_cmd strings_urlencode
+    ;;
+  strip_control)
+    $__dump_cmd strings_strip_control
+    ;;
+  repeat)
+    $__dump_cmd strings_repeat
+    ;;
+  join)
+    $__dump_cmd strings_join
+    ;;
+  sgrep)
+    $__dump_cmd strings_sgrep
+    ;;
+  strip_prefix)
+    $__dump_cmd strings_strip_prefix
+    ;;
+  trim)
+    $__dump_cmd strings_trim
+    ;;
+  elide)
+    $__dump_cmd strings_elide
+    ;;
+  strip_prefix)
+    $__dump_cmd strings_strip_prefix
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[strings/urlencode]=""
+__q_complete_positional[strings/urlencode]=""
+__q_complete_flags[strings/strip_control]=""
+__q_complete_positional[strings/strip_control]=""
+__q_complete_flags[strings/repeat]=""
+__q_complete_positional[strings/repeat]="STRING STRING"
+__q_complete_flags[strings/join]=""
+__q_complete_positional[strings/join]="STRING STRING"
+__q_complete_flags[strings/sgrep]="-C"
+__q_complete_positional[strings/sgrep]=""
+__q_complete_flag_type[strings/sgrep/-C]=STRING
+__q_complete_flags[strings/strip_prefix]=""
+__q_complete_positional[strings/strip_prefix]="STRING STRING"
+__q_complete_flags[strings/trim]=""
+__q_complete_positional[strings/trim]="STRING"
+__q_complete_flags[strings/elide]=""
+__q_complete_positional[strings/elide]="STRING STRING STRING"
+__q_complete_flags[strings/strip_prefix]=""
+__q_complete_positional[strings/strip_prefix]="STRING STRING"
@@ -0,0 +1,86 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module time, sourced by __q_load.
+
+function __q_help_time() {
+  printf '%s' $'Usage: q time FUNCTION [ARG...]
+Time and date helpers.
+
+Available functions:
+\033[1m  zones
+\033[0m\033[36m\033[0m    List all time zones know to the system. (In /usr/share/zoneinfo.)
+    
+    This doesn\'t include aliases declared in this package.
+\033[1m  get_tz
+\033[0m\033[36m\033[0m\033[1m  local
+\033[0m\033[36m\033[0m\033[1m  utc
+\033[0m\033[36m\033[0m\033[1m  in
+\033[0m\033[36m\033[0m    Usage time_in TIMEZONE [FORMAT]
+    
+    Sets the time zone to TIMEZONE and runs date with the remaining arguments.
+    Timezone resolution suppors fuzzy matching and aliases, so that cities like
+    San Francisco work as timezones.
+\033[1m  tz_diff
+\033[0m\033[36m\033[0m\033[1m  ts
+\033[0m\033[36m\033[0m\033[1m  convert TIME\033[0m\033[1m FROM_TZ\033[0m\033[1m TO_TZ\033[0m\033[1m [\033[0m\033[1m FORMAT\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m'
+}
+
+function __q_dump_time() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  zones)
+    $__dump_cmd time_zones
+    ;;
+  __time_get_tz_alias)
+    $__dump_cmd __time_get_tz_alias
+    ;;
+  __time_get_tz)
+    $__dump_cmd __time_get_tz
+    ;;
+  get_tz)
+    $__dump_cmd time_get_tz
+    ;;
+  local)
+    $__dump_cmd time_local
+    ;;
+  utc)
+    $__dump_cmd time_utc
+    ;;
+  in)
+    $__dump_cmd time_in
+    ;;
+  tz_diff)
+    $__dump_cmd time_tz_diff
+    ;;
+  ts)
+    $__dump_cmd time_ts
+    ;;
+  convert)
+    $__dump_cmd time_convert
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[time/zones]=""
+__q_complete_positional[time/zones]=""
+__q_complete_flags[time/get_tz]=""
+__q_complete_positional[time/get_tz]=""
+__q_complete_flags[time/local]=""
+__q_complete_positional[time/local]=""
+__q_complete_flags[time/utc]=""
+__q_complete_positional[time/utc]=""
+__q_complete_flags[time/in]=""
+__q_complete_positional[time/in]=""
+__q_complete_flags[time/tz_diff]=""
+__q_complete_positional[time/tz_diff]=""
+__q_complete_flags[time/ts]=""
+__q_complete_positional[time/ts]=""
+__q_complete_flags[time/convert]=""
+__q_complete_positional[time/convert]="STRING STRING STRING STRING"
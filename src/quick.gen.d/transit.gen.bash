@@ -0,0 +1,30 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module transit, sourced by __q_load.
+
+function __q_help_transit() {
+  printf '%s' $'Usage: q transit FUNCTION [ARG...]
+Transit helpers.
+
+Available functions:
+\033[1m  sbb
+\033[0m\033[36m\033[0m'
+}
+
+function __q_dump_transit() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  sbb)
+    $__dump_cmd transit_sbb
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[transit/sbb]=""
+__q_complete_positional[transit/sbb]=""
@@ -0,0 +1,111 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module util, sourced by __q_load.
+
+function __q_help_util() {
+  printf '%s' $'Usage: q util FUNCTION [ARG...]
+Catch-all utility functions that don\'t fit anywhere else.
+
+Available functions:
+\033[1m  ddu
+\033[0m\033[36m\033[0m\033[1m  sudo
+\033[0m\033[36m\033[0m\033[1m  reload
+\033[0m\033[36m\033[0m\033[1m  markdown
+\033[0m\033[36m\033[0m\033[1m  human_size [\033[0m\033[1m -b|-bb|-S|-h|-hh\033[0m\033[1m SIZE\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m    Convert SIZE to human-readable format.
+    
+    -b: bits
+    -bb: SI units
+    -S: SI bytes
+    -h: base-2 bytes
+    -hh: base-2 bytes, no space between number and unit
+    
+    If no mode switch is specified then normal, base-2 byte units are used.
+\033[1m  install_heroku_cli
+\033[0m\033[36m    alias heroku_install_cli=\'q util install_heroku_cli\'
+\033[0m\033[1m  install_bazelisk
+\033[0m\033[36m\033[0m\033[1m  jup
+\033[0m\033[36m\033[0m\033[1m  wait_for_file
+\033[0m\033[36m\033[0m\033[1m  forex [\033[0m\033[1m -f\033[0m\033[1m FROM\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -t\033[0m\033[1m TO\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -d\033[0m\033[1m DATE\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -a\033[0m\033[1m AMOUNT\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m -v\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m\033[1m  run [\033[0m\033[1m --sudo\033[0m\033[1m COMMAND\033[0m\033[1m ]\033[0m\033[1m [\033[0m\033[1m ARGUMENTS\033[0m\033[1m ...\033[0m\033[1m ]\033[0m\033[1m
+\033[0m\033[36m\033[0m'
+}
+
+function __q_dump_util() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  ddu)
+    $__dump_cmd util_ddu
+    ;;
+  sudo)
+    $__dump_cmd util_sudo
+    ;;
+  reload)
+    $__dump_cmd reload
+    ;;
+  markdown)
+    $__dump_cmd util_markdown
+    ;;
+  human_size)
+    $__dump_cmd human_size
+    ;;
+  install_heroku_cli)
+    $__dump_cmd install_heroku_cli
+    ;;
+  install_bazelisk)
+    $__dump_cmd install_bazelisk
+    ;;
+  jup)
+    $__dump_cmd jup
+    ;;
+  wait_for_file)
+    $__dump_cmd wait_for_file
+    ;;
+  forex)
+    $__dump_cmd util_forex
+    ;;
+  run)
+    $__dump_cmd util_run
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[util/ddu]=""
+__q_complete_positional[util/ddu]=""
+__q_complete_flags[util/sudo]=""
+__q_complete_positional[util/sudo]=""
+__q_complete_flags[util/reload]=""
+__q_complete_positional[util/reload]=""
+__q_complete_flags[util/markdown]=""
+__q_complete_positional[util/markdown]=""
+__q_complete_flags[util/human_size]="-b -bb -S -h -hh"
+__q_complete_positional[util/human_size]=""
+__q_complete_flag_type[util/human_size/-b]=STRING
+__q_complete_flag_type[util/human_size/-bb]=STRING
+__q_complete_flag_type[util/human_size/-S]=STRING
+__q_complete_flag_type[util/human_size/-h]=STRING
+__q_complete_flag_type[util/human_size/-hh]=STRING
+__q_complete_flags[util/install_heroku_cli]=""
+__q_complete_positional[util/install_heroku_cli]=""
+__q_complete_flags[util/install_bazelisk]=""
+__q_complete_positional[util/install_bazelisk]=""
+__q_complete_flags[util/jup]=""
+__q_complete_positional[util/jup]=""
+__q_complete_flags[util/wait_for_file]=""
+__q_complete_positional[util/wait_for_file]=""
+__q_complete_flags[util/forex]="-v -f -t -d -a"
+__q_complete_positional[util/forex]=""
+__q_complete_flag_type[util/forex/-f]=STRING
+__q_complete_flag_type[util/forex/-t]=STRING
+__q_complete_flag_type[util/forex/-d]=STRING
+__q_complete_flag_type[util/forex/-a]=STRING
+__q_complete_flag_type[util/forex/-v]=SWITCH
+__q_complete_flags[util/run]="--sudo"
+__q_complete_positional[util/run]="STRING"
+__q_complete_flag_type[util/run/--sudo]=STRING
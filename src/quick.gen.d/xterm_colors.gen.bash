@@ -0,0 +1,118 @@
+# This file is generated by quick.py. Do not edit.
+# Help, dump and completion for module xterm_colors, sourced by __q_load.
+
+function __q_help_xterm_colors() {
+  printf '%s' $'Usage: q xterm_colors FUNCTION [ARG...]
+Work with the xterm color space, convert to RGB, etc.
+
+Available functions:
+\033[1m  channel_step
+\033[0m\033[36m\033[0m    Takes one RGB channel value as a 2-byte hex string and returns a decimal
+    number representing the step in XTERM_CHANNEL_STEPS that\'s the closest.
+\033[1m  greyscale_step
+\033[0m\033[36m\033[0m    As channel_step, but for greyscale.
+\033[1m  rgb_to_xterm
+\033[0m\033[36m\033[0m    Takes an RGB color as a 6-byte hex string and returns the closest xterm color.
+\033[1m  hue_diff
+\033[0m\033[36m\033[0m    Computes the hue difference between two RGB colors passed as 6-byte hex
+    strings. Result is in the interval [0; 765]. Contrast values greater than ~400
+    are usually legible for text, if sufficient brightness contrast also exists.
+    (Depends on terminal.)
+\033[1m  brightness
+\033[0m\033[36m\033[0m    Computes the brightness of an RGB color passed as a 6-byte hex string. Result
+    is in the interval [0; 255]. Brightness contrast of ~100 is usually legible if
+    sufficient hue contrast also exists. (Depends on terminal.)
+\033[1m  contrast
+\033[0m\033[36m\033[0m    Computes a contrast value between two RGB colors passed as 6-byte hex strings.
+    Result is in the interval [0; 192]. Combines hue and brightness information.
+    Contrast values over 80 are usually legible, depending on terminal.
+\033[1m  xterm_to_rgb
+\033[0m\033[36m\033[0m    Takes an xterm color number as a decimal integer and returns a 6-byte hex of
+    the RGB color.
+\033[1m  xterm_to_fg
+\033[0m\033[36m\033[0m\033[1m  xterm_to_bg
+\033[0m\033[36m\033[0m\033[1m  tfmt
+\033[0m\033[36m\033[0m\033[1m  color
+\033[0m\033[36m\033[0m\033[1m  shades
+\033[0m\033[36m\033[0m\033[1m  colors
+\033[0m\033[36m\033[0m'
+}
+
+function __q_dump_xterm_colors() {
+  local __dump_cmd="type"
+  if [[ -n "$ZSH_VERSION" ]]; then
+    __dump_cmd="functions"
+  fi
+  case "$1" in
+  channel_step)
+    $__dump_cmd channel_step
+    ;;
+  greyscale_step)
+    $__dump_cmd greyscale_step
+    ;;
+  rgb_to_xterm)
+    $__dump_cmd rgb_to_xterm
+    ;;
+  hue_diff)
+    $__dump_cmd hue_diff
+    ;;
+  brightness)
+    $__dump_cmd brightness
+    ;;
+  contrast)
+    $__dump_cmd contrast
+    ;;
+  xterm_to_rgb)
+    $__dump_cmd xterm_to_rgb
+    ;;
+  xterm_to_fg)
+    $__dump_cmd xterm_to_fg
+    ;;
+  xterm_to_bg)
+    $__dump_cmd xterm_to_bg
+    ;;
+  tfmt)
+    $__dump_cmd tfmt
+    ;;
+  color)
+    $__dump_cmd color
+    ;;
+  shades)
+    $__dump_cmd shades
+    ;;
+  colors)
+    $__dump_cmd colors
+    ;;
+  *)
+    echo "Unknown function $1"
+    return 1
+    ;;
+  esac
+}
+
+__q_complete_flags[xterm_colors/channel_step]=""
+__q_complete_positional[xterm_colors/channel_step]=""
+__q_complete_flags[xterm_colors/greyscale_step]=""
+__q_complete_positional[xterm_colors/greyscale_step]=""
+__q_complete_flags[xterm_colors/rgb_to_xterm]=""
+__q_complete_positional[xterm_colors/rgb_to_xterm]=""
+__q_complete_flags[xterm_colors/hue_diff]=""
+__q_complete_positional[xterm_colors/hue_diff]=""
+__q_complete_flags[xterm_colors/brightness]=""
+__q_complete_positional[xterm_colors/brightness]=""
+__q_complete_flags[xterm_colors/contrast]=""
+__q_complete_positional[xterm_colors/contrast]=""
+__q_complete_flags[xterm_colors/xterm_to_rgb]=""
+__q_complete_positional[xterm_colors/xterm_to_rgb]=""
+__q_complete_flags[xterm_colors/xterm_to_fg]=""
+__q_complete_positional[xterm_colors/xterm_to_fg]=""
+__q_complete_flags[xterm_colors/xterm_to_bg]=""
+__q_complete_positional[xterm_colors/xterm_to_bg]=""
+__q_complete_flags[xterm_colors/tfmt]=""
+__q_complete_positional[xterm_colors/tfmt]=""
+__q_complete_flags[xterm_colors/color]=""
+__q_complete_positional[xterm_colors/color]=""
+__q_complete_flags[xterm_colors/shades]=""
+__q_complete_positional[xterm_colors/shades]=""
+__q_complete_flags[xterm_colors/colors]=""
+__q_complete_positional[xterm_colors/colors]=""
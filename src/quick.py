@@ -5,7 +5,9 @@
 # a janky bash function parser that only handles the cases we use in this
 # project.
 #
-# To regen quick.gen.bash on a system, just run `q quick rebuild`.
+# To regen quick.gen.bash on a system, just run `q quick rebuild`. Help and
+# argument completion for each module go to quick.gen.d/, which quick.gen.bash
+# sources on first use.
 #
 # To regenerate the checked-in version, run:
 #
@@ -19,6 +21,15 @@ from enum import Enum
 import re
 import sys
 import shlex
+import hashlib
+import io
+import json
+import multiprocessing
+import ctypes
+import ctypes.util
+import select
+import struct
+import time
 
 
 @dataclass
@@ -35,6 +46,13 @@ class Token:
             end=(d["end"]["line"], d["end"]["column"]),
         )
 
+    def toJSON(self):
+        return {
+            "value": self.value,
+            "start": {"line": self.start[0], "column": self.start[1]},
+            "end": {"line": self.end[0], "column": self.end[1]},
+        }
+
 
 class ArgumentType(Enum):
     DEFAULT = 1
@@ -95,6 +113,18 @@ class Argument:
             aliases=d["aliases"],
         )
 
+    def toJSON(self):
+        return {
+            "name": self.name,
+            "type": self.type.name,
+            "type_name": self.type_name,
+            "default": self.default,
+            "required": self.required,
+            "repeated": self.repeated,
+            "position": self.position,
+            "aliases": list(self.aliases),
+        }
+
 
 @dataclass
 class Function:
@@ -114,6 +144,15 @@ class Function:
             args=[Argument.from_dict(a) for a in d["args"]],
         )
 
+    def toJSON(self):
+        return {
+            "name": self.name.toJSON(),
+            "package": self.package,
+            "comment": self.comment,
+            "usage": self.usage,
+            "args": [a.toJSON() for a in self.args],
+        }
+
 
 @dataclass
 class Module:
@@ -121,9 +160,19 @@ class Module:
     functions: list[Function]
     func_to_alias: dict[str, list[str]]
     comment: list[str]
+    # The file the module was loaded from, if any.
+    path: str = ""
 
+    # The serialized form is the inverse of from_dict, so modules can
+    # round-trip through JSON (e.g. in the parse cache).
     def toJSON(self):
-        return dataclasses.asdict(self)
+        return {
+            "name": self.name,
+            "functions": [f.toJSON() for f in self.functions],
+            "aliases": self.func_to_alias,
+            "comment": self.comment,
+            "path": self.path,
+        }
 
     @classmethod
     def from_dict(cls, d):
@@ -132,6 +181,7 @@ class Module:
             functions=[Function.from_dict(f) for f in d["functions"]],
             func_to_alias=d["aliases"],
             comment=d["comment"],
+            path=d.get("path", ""),
         )
 
 
@@ -235,50 +285,62 @@ def _finalize_arguments(raw: list[Argument]) -> list[Argument]:
     return args
 
 
+# A single token of a usage string, with any leading whitespace. Exactly one of
+# the groups matches.
+USAGE_TOKEN = re.compile(
+    r"\s*(?:(?P<lbracket>\[)|(?P<rbracket>\])|(?P<arg>[a-z|A-Z_0-9\-]+)|(?P<repeated>\.\.\.))"
+)
+# Trailing whitespace and dots are ignored.
+USAGE_TAIL = re.compile(r"[\s\.]*$")
+
+
 def _parse_usage(usage: str) -> tuple[str, list[Argument]]:
     args = []  # result
-    # state - remaining string and character position
-    s = usage
+    # state - position of the next unconsumed character
     n = 0
     # While this is true, arguments are parsed as optional.
     # Set/unset by '[' and ']'.
     optional = False
     prev_token = "BEGIN"
 
-    # Single-pass state machine. s is consumed from the left, until it's empty.
-    while s:
-        if m := re.match(r"\s*\[", s):
+    # Single-pass scanner. Each token is matched in place at position n, until
+    # the whole string is consumed.
+    while n < len(usage):
+        m = USAGE_TOKEN.match(usage, n)
+        if m is None:
+            if USAGE_TAIL.match(usage, n):
+                break
+            raise ValueError(
+                f"Unexpected character {usage[n]} at position {n}: {usage}"
+            )
+
+        kind = m.lastgroup
+        if kind == "lbracket":
             if optional:
                 raise ValueError(f"Unexpected '[' after position {n}: {usage}")
             optional = True
-            s = s[m.end() :]
-            n += m.end()
             prev_token = "LBRACKET"
-        elif m := re.match(r"\s*\]", s):
+        elif kind == "rbracket":
             if not optional:
                 raise ValueError(f"Unexpected ']' after position {n}: {usage}")
             optional = False
-            s = s[m.end() :]
-            n += m.end()
             prev_token = "RBRACKET"
-        elif m := re.match(r"\s*([a-z|A-Z_0-9\-]+)", s):
-            s = s[m.end() :]
-            n += m.end()
+        elif kind == "arg":
             if prev_token == "BEGIN":
                 prev_token = "EXE"
-                continue
-            prev_token = "ARG"
-            args.append(
-                Argument(
-                    name=m.group(1),
-                    type=ArgumentType.DEFAULT,
-                    type_name="",
-                    default="",
-                    required=not optional,
-                    repeated=False,
+            else:
+                prev_token = "ARG"
+                args.append(
+                    Argument(
+                        name=m.group("arg"),
+                        type=ArgumentType.DEFAULT,
+                        type_name="",
+                        default="",
+                        required=not optional,
+                        repeated=False,
+                    )
                 )
-            )
-        elif m := re.match(r"\s*\.\.\.", s):
+        else:  # repeated
             if prev_token not in ("ARG", "RBRACKET"):
                 raise ValueError(f"Unexpected '...' after position {n}: {usage}")
             if not args:
@@ -286,13 +348,8 @@ def _parse_usage(usage: str) -> tuple[str, list[Argument]]:
                     f"Args is still empty on '...' after position {n}: {usage}"
                 )
             args[-1].repeated = True
-            s = s[m.end() :]
-            n += m.end()
             prev_token = "REPEATED"
-        elif re.match(r"[\s\.]*$", s):
-            break
-        else:
-            raise ValueError(f"Unexpected character {s[0]} at position {n}: {usage}")
+        n = m.end()
 
     return usage, _finalize_arguments(args)
 
@@ -315,12 +372,14 @@ def _parse_func_comment(comment: list[str]) -> tuple[str, list[Argument], list[s
     return usage, args, filtered_comment
 
 
-def parse_module(lines: Iterable[str], package: str) -> Module:
+def parse_module(lines: Iterable[str], package: str, path: str = "") -> Module:
     line_no = 1
     comment_no = 0
     last_comment_line: Union[int, None] = None
     comment_block: list[str] = []
-    module = Module(name=package, functions=[], func_to_alias={}, comment=[])
+    module = Module(
+        name=package, functions=[], func_to_alias={}, comment=[], path=path
+    )
     for line in lines:
         # Functions are emitted right away. If there is a comment block ending
         # on the previous line, it's attached to the function.
@@ -382,6 +441,10 @@ def gen_switch(modules: Iterable[Module]) -> Generator[str, None, None]:
     yield "    shift"
     yield '    __q_dump "$@"'
     yield "    ;;"
+    yield "  search)"
+    yield "    shift"
+    yield '    quick_search "$@"'
+    yield "    ;;"
     for module in modules:
         yield f"  {module.name})"
         yield f"    shift"
@@ -419,6 +482,76 @@ def gen_switch(modules: Iterable[Module]) -> Generator[str, None, None]:
     yield "}"
 
 
+def gen_table_switch(modules: Iterable[Module]) -> Generator[str, None, None]:
+    """Like gen_switch, but dispatches through associative arrays.
+
+    The tables are filled in once, when the file is sourced, so each call costs
+    two lookups instead of scanning a case statement module by module and then
+    function by function.
+
+    __q_modules: MODULE -> 1
+    __q_dispatch: MODULE/FUNCTION -> function name (also keyed by short name)
+    """
+    yield "unset __q_modules __q_dispatch"
+    yield "declare -gA __q_modules __q_dispatch"
+    for module in modules:
+        yield f"__q_modules[{module.name}]=1"
+        for function in module.functions:
+            if function.name.value.startswith("_"):
+                continue
+            name = function.name.value
+            yield f"__q_dispatch[{module.name}/{name}]={name}"
+            if (alias := _local_name(name, module.name)) != name:
+                yield f"__q_dispatch[{module.name}/{alias}]={name}"
+    yield ""
+    yield "function __q() {"
+    yield '  if [ "$#" -eq 0 ]; then'
+    yield "    __q_help"
+    yield "    return 0"
+    yield "  fi"
+    yield '  case "$1" in'
+    yield "  help|-h|--help|?)"
+    yield "    shift"
+    yield '    __q_help "$@"'
+    yield "    return"
+    yield "    ;;"
+    yield "  dump)"
+    yield "    shift"
+    yield '    __q_dump "$@"'
+    yield "    return"
+    yield "    ;;"
+    yield "  search)"
+    yield "    shift"
+    yield '    quick_search "$@"'
+    yield "    return"
+    yield "    ;;"
+    yield "  esac"
+    yield '  if [[ -z "$1" || -z "${__q_modules[$1]+x}" ]]; then'
+    yield '    echo "Unknown module ${1}"'
+    yield "    return 1"
+    yield "  fi"
+    yield '  local __q_module="$1"'
+    yield "  shift"
+    yield '  case "$1" in'
+    yield "  help|-h|--help|?)"
+    yield "    shift"
+    yield '    __q_help "${__q_module}" "$@"'
+    yield "    return"
+    yield "    ;;"
+    yield "  esac"
+    yield '  local __q_target="${__q_dispatch[${__q_module}/$1]}"'
+    yield '  if [[ -z "${__q_target}" ]]; then'
+    yield '    if [ -n "$1" ]; then'
+    yield '      echo "Module ${__q_module} has no function ${1}"'
+    yield "    fi"
+    yield '    __q_help "${__q_module}"'
+    yield "    return 1"
+    yield "  fi"
+    yield "  shift"
+    yield '  "${__q_target}" "$@"'
+    yield "}"
+
+
 def __gen_usage_color(function: Function) -> Iterable[Union[str,int]]:
     for arg in function.args:
         if not arg.required:
@@ -442,29 +575,44 @@ def __gen_usage_color(function: Function) -> Iterable[Union[str,int]]:
         if not arg.required:
             yield ']'
 
-def gen_dump(modules: Iterable[Module]) -> Generator[str, None, None]:
-    yield "function __q_dump() {"
+def _gen_dump_header() -> Generator[str, None, None]:
     yield '  if [[ ! "$#" -eq 2 ]]; then'
     yield '    echo "Usage: q dump MODULE FUNCTION"'
     yield "    return 1"
     yield "  fi"
+
+
+def _gen_dump_module(
+    module: Module, arg: str, indent: str
+) -> Generator[str, None, None]:
+    """The case statement that dumps the function named by arg in module."""
+    yield f'{indent}case \"{arg}\" in'
+    for function in module.functions:
+        yield f"{indent}{_local_name(function.name.value, module.name)})"
+        yield f"{indent}  $__dump_cmd {function.name.value}"
+        yield f"{indent}  ;;"
+    yield f"{indent}*)"
+    yield f'{indent}  echo "Unknown function {arg}"'
+    yield f"{indent}  return 1"
+    yield f"{indent}  ;;"
+    yield f"{indent}esac"
+
+
+def _gen_dump_cmd() -> Generator[str, None, None]:
     yield '  local __dump_cmd="type"'
     yield '  if [[ -n "$ZSH_VERSION" ]]; then'
     yield '    __dump_cmd="functions"'
     yield '  fi'
+
+
+def gen_dump(modules: Iterable[Module]) -> Generator[str, None, None]:
+    yield "function __q_dump() {"
+    yield from _gen_dump_header()
+    yield from _gen_dump_cmd()
     yield "  case \"$1\" in"
     for module in modules:
         yield f"  {module.name})"
-        yield f'    case \"$2\" in'
-        for function in module.functions:
-            yield f"    {_local_name(function.name.value, module.name)})"
-            yield f"      $__dump_cmd {function.name.value}"
-            yield f"      ;;"
-        yield f"    *)"
-        yield f'      echo "Unknown function $2"'
-        yield f"      return 1"
-        yield f"      ;;"
-        yield f"    esac"
+        yield from _gen_dump_module(module, "$2", "    ")
         yield f"    ;;"
     yield f"  *)"
     yield f'    echo "Unknown module $1"'
@@ -474,13 +622,96 @@ def gen_dump(modules: Iterable[Module]) -> Generator[str, None, None]:
     yield "}"
 
 
-def gen_help(modules: Iterable[Module]) -> Generator[str, None, None]:
-    column = 20
-    yield "function __q_help() {"
-    yield '  if [ "$#" -eq 0 ]; then'
+HELP_COLUMN = 20
+
+
+def _ansi(code: str) -> str:
+    """Turns one of the ANSI_* constants into the actual escape sequence."""
+    return code.replace("\\033", "\033")
+
+
+def _ansi_c_quote(text: str) -> str:
+    """Quotes text as a bash $'...' string. Newlines are kept literally."""
+    return "$'%s'" % (
+        text.replace("\\", "\\\\").replace("'", "\\'").replace("\033", "\\033")
+    )
+
+
+def _help_index_column_pad(module: Module) -> int:
+    pad = HELP_COLUMN - len(module.name) - 2
+    if pad < 0:
+        raise ValueError(
+            f"Module name {module.name} is too long for the help output"
+        )
+    return pad
+
+
+def render_help_index(modules: Iterable[Module]) -> str:
+    """The text printed by __q_help with no arguments."""
+    out = [
+        "q - redshell function registry\n",
+        "Usage: q [-h|--help] MODULE FUNCTION [ARG...]\n",
+        "Run q --help MODULE for more information on a module.\n",
+        "Run q search TERM... to find functions by name, argument or doc.\n",
+        "\n",
+        "Available modules:\n",
+    ]
+    for module in modules:
+        if not module.functions:
+            continue
+        doc = module.comment if module.comment else ["(no description)"]
+        pad = _help_index_column_pad(module)
+        out.append(f"{_ansi(ANSI_BOLD)}  {module.name}{_ansi(ANSI_RESET)}")
+        out.append(f"{' ' * pad}{doc[0]}\n")
+        for line in doc[1:]:
+            out.append(f"{' ' * HELP_COLUMN}{line}\n")
+    return "".join(out)
+
+
+def render_module_help(module: Module) -> str:
+    """The text printed by __q_help MODULE."""
+    bold, reset = _ansi(ANSI_BOLD), _ansi(ANSI_RESET)
+    out = [f"Usage: q {module.name} FUNCTION [ARG...]\n"]
+    out.extend(f"{line}\n" for line in module.comment)
+    out.append("\n")
+    out.append("Available functions:\n")
+    for function in module.functions:
+        if function.name.value.startswith("_"):
+            continue
+        local_name = _local_name(function.name.value, module.name)
+
+        # Usage
+        out.append(f"{bold}  {local_name}")
+        for s in __gen_usage_color(function):
+            if isinstance(s, int):
+                out.append(_ansi(ANSI_COLORS[s]))
+            else:
+                out.append(f" {s}{reset}{bold}")
+        out.append(f"\n{reset}")
+
+        # Aliases
+        out.append(_ansi(ANSI_COLORS[6]))
+        for alias in module.func_to_alias.get(function.name.value, []):
+            out.append(f"    alias {alias}='q {module.name} {local_name}'\n")
+        out.append(reset)
+
+        # Description
+        out.extend(f"    {line}\n" for line in function.comment)
+    return "".join(out)
+
+
+def _gen_help_index(
+    modules: Iterable[Module], prerender: bool = False
+) -> Generator[str, None, None]:
+    """The body of __q_help with no arguments - the list of modules."""
+    if prerender:
+        yield f"    printf '%s' {_ansi_c_quote(render_help_index(modules))}"
+        return
+    column = HELP_COLUMN
     yield '    echo "q - redshell function registry"'
     yield '    echo "Usage: q [-h|--help] MODULE FUNCTION [ARG...]"'
     yield '    echo "Run q --help MODULE for more information on a module."'
+    yield '    echo "Run q search TERM... to find functions by name, argument or doc."'
     yield "    echo"
     yield '    echo "Available modules:"'
     for module in modules:
@@ -488,54 +719,71 @@ def gen_help(modules: Iterable[Module]) -> Generator[str, None, None]:
             continue
         doc = module.comment if module.comment else ["(no description)"]
         doc = list(_escape_comment(doc))
-        pad = column - len(module.name) - 2
-        if pad < 0:
-            raise ValueError(
-                f"Module name {module.name} is too long for the help output"
-            )
+        pad = _help_index_column_pad(module)
         yield f"    echo -ne '{ANSI_BOLD}'"
         yield f"    echo -n '  {module.name}'"
         yield f"    echo -ne '{ANSI_RESET}'"
         yield f"    echo '{' ' * pad}{doc[0]}'"
         for line in doc[1:]:
             yield f"    echo '{' ' * column}{line}'"
+
+
+def gen_module_help(
+    module: Module, indent: str = "", prerender: bool = False
+) -> Generator[str, None, None]:
+    """The commands that print help for a single module.
+
+    If prerender is set, the help text is rendered here and printed by a single
+    printf. Otherwise, it's printed line by line and token by token."""
+    if prerender:
+        yield f"{indent}printf '%s' {_ansi_c_quote(render_module_help(module))}"
+        return
+    yield f'{indent}echo "Usage: q {module.name} FUNCTION [ARG...]"'
+    for line in module.comment:
+        yield f'{indent}echo "{line}"'
+    yield f"{indent}echo"
+    yield f'{indent}echo "Available functions:"'
+    for function in module.functions:
+        if function.name.value.startswith("_"):
+            continue
+
+        # Usage
+        yield f"{indent}echo -ne '{ANSI_BOLD}'"
+        yield f"{indent}echo -n '  {_local_name(function.name.value, module.name)}'"
+        for s in __gen_usage_color(function):
+            if isinstance(s, int):
+                yield f"{indent}echo -ne '{ANSI_COLORS[s]}'"
+            else:
+                yield f"{indent}echo -n ' {s}'"
+                yield f"{indent}echo -ne '{ANSI_RESET}'"
+                yield f"{indent}echo -ne '{ANSI_BOLD}'"
+        yield f"{indent}echo"
+        yield f"{indent}echo -ne '{ANSI_RESET}'"
+
+        # Aliases
+        yield f"{indent}echo -ne '{ANSI_COLORS[6]}'"
+        for alias in module.func_to_alias.get(function.name.value, []):
+            yield f'{indent}echo "    alias {alias}=\'q {module.name} {_local_name(function.name.value, module.name)}\'"'
+        yield f"{indent}echo -ne '{ANSI_RESET}'"
+
+        # Description
+        for line in _escape_comment(function.comment):
+            yield f"{indent}echo '    {line}'"
+
+
+def gen_help(
+    modules: Iterable[Module], prerender: bool = False
+) -> Generator[str, None, None]:
+    yield "function __q_help() {"
+    yield '  if [ "$#" -eq 0 ]; then'
+    yield from _gen_help_index(modules, prerender)
     yield "    return 0"
     yield "  fi"
     yield '  if [ "$#" -eq 1 ]; then'
     yield '    case "$1" in'
     for module in modules:
         yield f"    {module.name})"
-        yield f'      echo "Usage: q {module.name} FUNCTION [ARG...]"'
-        for line in module.comment:
-            yield f'      echo "{line}"'
-        yield f"      echo"
-        yield f'      echo "Available functions:"'
-        for function in module.functions:
-            if function.name.value.startswith("_"):
-                continue
-
-            # Usage
-            yield f"      echo -ne '{ANSI_BOLD}'"
-            yield f"      echo -n '  {_local_name(function.name.value, module.name)}'"
-            for s in __gen_usage_color(function):
-                if isinstance(s, int):
-                    yield f"      echo -ne '{ANSI_COLORS[s]}'"
-                else:
-                    yield f"      echo -n ' {s}'"
-                    yield f"      echo -ne '{ANSI_RESET}'"
-                    yield f"      echo -ne '{ANSI_BOLD}'"
-            yield f"      echo"
-            yield f"      echo -ne '{ANSI_RESET}'"
-
-            # Aliases
-            yield f"      echo -ne '{ANSI_COLORS[6]}'"
-            for alias in module.func_to_alias.get(function.name.value, []):
-                yield f'      echo "    alias {alias}=\'q {module.name} {_local_name(function.name.value, module.name)}\'"'
-            yield f"      echo -ne '{ANSI_RESET}'"
-
-            # Description
-            for line in _escape_comment(function.comment):
-                yield f"      echo '    {line}'"
+        yield from gen_module_help(module, "      ", prerender)
         yield f"      ;;"
     yield f"    *)"
     yield f'      echo "Unknown module $1"'
@@ -596,36 +844,31 @@ def gen_complete_helpers() -> Generator[str, None, None]:
     yield "# 3. If there is a positional argument at the current position, we also"
     yield "#    suggest values for that argument (combined with flag names from #1)."
     yield "#"
-    yield "# Usage: __q_complete_func SWITCHES KEYWORDS KEYWORD_TYPES POSITIONAL_TYPES"
-    yield "#   SWITCHES: space-separated switch names (flags that take no value)"
-    yield "#   KEYWORDS: space-separated keyword names (flags that take a value)"
-    yield "#   KEYWORD_TYPES: colon-separated name:TYPE pairs for keywords"
-    yield "#   POSITIONAL_TYPES: space-separated types for positional args"
+    yield "# Flags and their types are looked up in the tables generated for each"
+    yield "# function (see __q_complete_flags), so each word costs a constant amount"
+    yield "# of work, regardless of how many flags the function has."
+    yield "#"
+    yield "# Usage: __q_complete_func MODULE/FUNCTION"
     yield "function __q_complete_func() {"
-    yield '  local switches="$1" keywords="$2" keyword_types="$3" positional_types_str="$4"'
+    yield '  local key="$1"'
+    yield '  local flags="${__q_complete_flags[$key]}"'
     yield '  local cur="${COMP_WORDS[COMP_CWORD]}"'
-    yield "  local i=3 pos=0 state=EXPECT_ARG"
-    yield "  local -a positional_types=(${positional_types_str})"
+    yield "  local i=3 pos=0 state=EXPECT_ARG flag_type"
+    yield "  local -a positional_types=(${__q_complete_positional[$key]})"
     yield ""
     yield "  # Walk through previous args to determine current state"
     yield '  while [[ "${i}" -lt "${COMP_CWORD}" ]]; do'
     yield '    local word="${COMP_WORDS[i]}"'
     yield '    case "${state}" in'
     yield "    EXPECT_ARG)"
+    yield '      flag_type="${__q_complete_flag_type[$key/$word]}"'
     yield '      if [[ "${word}" == "--" ]]; then'
     yield "        state=IDK"
-    yield '      elif [[ " ${keywords} " == *" ${word} "* ]]; then'
-    yield "        # This is a keyword arg, next word is its value"
-    yield "        local ktype"
-    yield '        for pair in ${keyword_types}; do'
-    yield '          if [[ "${pair%%:*}" == "${word}" ]]; then'
-    yield '            ktype="${pair#*:}"'
-    yield "            break"
-    yield "          fi"
-    yield "        done"
-    yield '        state="EXPECT_VALUE_${ktype:-STRING}"'
-    yield '      elif [[ " ${switches} " == *" ${word} "* ]]; then'
+    yield '      elif [[ "${flag_type}" == SWITCH ]]; then'
     yield "        state=EXPECT_ARG"
+    yield '      elif [[ -n "${flag_type}" ]]; then'
+    yield "        # This is a keyword arg, next word is its value"
+    yield '        state="EXPECT_VALUE_${flag_type}"'
     yield '      elif [[ "${word}" != -* ]]; then'
     yield "        # Positional argument consumed"
     yield "        (( pos++ ))"
@@ -649,7 +892,7 @@ def gen_complete_helpers() -> Generator[str, None, None]:
     yield '  case "${state}" in'
     yield "  EXPECT_ARG)"
     yield "    # Suggest switches and keywords"
-    yield '    COMPREPLY+=($(compgen -W "${switches} ${keywords}" -- "${cur}"))'
+    yield '    COMPREPLY+=($(compgen -W "${flags}" -- "${cur}"))'
     yield "    # Also complete positional arg if available"
     yield '    if [[ -n "${positional_types[$pos]}" ]]; then'
     yield '      __q_complete_type "${positional_types[$pos]}" "${cur}"'
@@ -659,7 +902,7 @@ def gen_complete_helpers() -> Generator[str, None, None]:
     yield '    __q_complete_type "${state#EXPECT_VALUE_}" "${cur}"'
     yield "    ;;"
     yield "  IDK)"
-    yield '    COMPREPLY+=($(compgen -W "${switches} ${keywords}" -- "${cur}"))'
+    yield '    COMPREPLY+=($(compgen -W "${flags}" -- "${cur}"))'
     yield '    COMPREPLY+=($(compgen -A file -- "${cur}"))'
     yield "    ;;"
     yield "  esac"
@@ -667,42 +910,44 @@ def gen_complete_helpers() -> Generator[str, None, None]:
     yield ""
 
 
-def _build_func_completion_data(function: Function) -> tuple[str, str, str, str]:
-    """Build completion data strings for a function.
+def _build_func_completion_data(
+    function: Function,
+) -> tuple[list[str], dict[str, str], list[str]]:
+    """Build completion data for a function.
 
-    Returns: (switches, keywords, keyword_types, positional_types)
+    Returns: (flags, flag_types, positional_types), where flag_types maps each
+    flag name (and alias) to SWITCH or the type of value it takes.
     """
     switches = []
     keywords = []
-    keyword_types = []  # "name:TYPE" pairs
+    flag_types = {}
     positional_types = []
 
     for arg in function.args:
         if arg.position is not None:
             positional_types.append(arg.type.name)
-        elif arg.type == ArgumentType.SWITCH:
-            switches.append(arg.name)
-            switches.extend(arg.aliases)
+            continue
+        names = [arg.name, *arg.aliases]
+        if arg.type == ArgumentType.SWITCH:
+            switches.extend(names)
         else:
-            keywords.append(arg.name)
-            keywords.extend(arg.aliases)
-            keyword_types.append(f"{arg.name}:{arg.type.name}")
-            for alias in arg.aliases:
-                keyword_types.append(f"{alias}:{arg.type.name}")
-
-    return (
-        " ".join(switches),
-        " ".join(keywords),
-        " ".join(keyword_types),
-        " ".join(positional_types),
-    )
+            keywords.extend(names)
+        for name in names:
+            # A name that is both a switch and a keyword completes as a keyword.
+            if flag_types.get(name) in (None, ArgumentType.SWITCH.name):
+                flag_types[name] = arg.type.name
 
+    return switches + keywords, flag_types, positional_types
 
-def gen_bash_complete(modules: Iterable[Module]) -> Generator[str, None, None]:
-    # First, emit the helper functions
-    yield from gen_complete_helpers()
 
-    yield "function __q_compgen() {"
+def _public_functions(module: Module) -> list[Function]:
+    return [f for f in module.functions if not f.name.value.startswith("_")]
+
+
+def _gen_module_names_complete(
+    modules: Iterable[Module],
+) -> Generator[str, None, None]:
+    """Completion of the first two words: the module and the function."""
     yield f'  local modules="{" ".join(module.name for module in modules)}"'
     yield '  case "${COMP_CWORD}" in'
 
@@ -719,8 +964,7 @@ def gen_bash_complete(modules: Iterable[Module]) -> Generator[str, None, None]:
         yield f"    {module.name})"
         names = " ".join(
             _local_name(function.name.value, module.name)
-            for function in module.functions
-            if not function.name.value.startswith("_")
+            for function in _public_functions(module)
         )
         yield f'      COMPREPLY=($(compgen -W "help {names}" -- ${{COMP_WORDS[COMP_CWORD]}}))'
         yield f"      return 0"
@@ -728,31 +972,223 @@ def gen_bash_complete(modules: Iterable[Module]) -> Generator[str, None, None]:
     yield "    esac"
     yield "    ;;"
 
-    # Remaining arguments - delegate to helper
+
+def gen_complete_tables() -> Generator[str, None, None]:
+    """Declare the completion tables filled in by gen_module_complete.
+
+    __q_complete_flags: MODULE/FUNCTION -> space-separated flag names
+    __q_complete_positional: MODULE/FUNCTION -> space-separated positional types
+    __q_complete_flag_type: MODULE/FUNCTION/FLAG -> SWITCH, or the value's type
+    """
+    tables = "__q_complete_flags __q_complete_positional __q_complete_flag_type"
+    yield f"unset {tables}"
+    yield f"declare -gA {tables}"
+
+
+def gen_module_complete(module: Module) -> Generator[str, None, None]:
+    """Fill in the completion tables for the functions in a single module."""
+    for function in _public_functions(module):
+        key = f"{module.name}/{_local_name(function.name.value, module.name)}"
+        flags, flag_types, positional_types = _build_func_completion_data(function)
+        yield f'__q_complete_flags[{key}]="{" ".join(flags)}"'
+        yield f'__q_complete_positional[{key}]="{" ".join(positional_types)}"'
+        for flag, flag_type in flag_types.items():
+            yield f"__q_complete_flag_type[{key}/{flag}]={flag_type}"
+
+
+def _gen_args_complete(lazy: bool = False) -> Generator[str, None, None]:
+    """Completion of the remaining words, for known functions.
+
+    If lazy is set, the module's fragment is loaded to fill in its tables."""
     yield "  *)"
-    yield '    case "${COMP_WORDS[1]}" in'
-    for module in modules:
-        public_funcs = [f for f in module.functions if not f.name.value.startswith("_")]
-        if not public_funcs:
-            continue
-        yield f"    {module.name})"
-        yield '      case "${COMP_WORDS[2]}" in'
-        for function in public_funcs:
-            local_name = _local_name(function.name.value, module.name)
-            switches, keywords, keyword_types, positional_types = _build_func_completion_data(function)
-            yield f"      {local_name})"
-            yield f'        __q_complete_func "{switches}" "{keywords}" "{keyword_types}" "{positional_types}"'
-            yield f"        ;;"
-        yield f"      esac"
-        yield f"      ;;"
-    yield "    esac"
+    if lazy:
+        yield '    __q_load "${COMP_WORDS[1]}" 2> /dev/null || return 0'
+    yield '    local key="${COMP_WORDS[1]}/${COMP_WORDS[2]}"'
+    yield '    [[ -n "${__q_complete_flags[$key]+x}" ]] || return 0'
+    yield '    __q_complete_func "${key}"'
     yield "    ;;"
+
+
+def gen_bash_complete(modules: Iterable[Module]) -> Generator[str, None, None]:
+    # First, emit the helper functions and the tables they use
+    yield from gen_complete_helpers()
+    yield from gen_complete_tables()
+    for module in modules:
+        yield from gen_module_complete(module)
+    yield ""
+
+    yield "function __q_compgen() {"
+    yield from _gen_module_names_complete(modules)
+    yield from _gen_args_complete()
+    yield "  esac"
+    yield "}"
+    yield ""
+    yield '[[ -z "${_REDSHELL_ZSH}" ]] && complete -F __q_compgen q'
+
+
+def _fragment_name(module_name: str) -> str:
+    """The name of a module's fragment file and functions.
+
+    Must match the substitution in __q_load."""
+    return re.sub(r"[^a-zA-Z0-9_]", "_", module_name)
+
+
+def gen_lazy_loader() -> Generator[str, None, None]:
+    """Generate __q_load, which sources a module's fragment on first use.
+
+    Fragments define __q_help_MODULE and __q_dump_MODULE and fill in the
+    completion tables.
+
+    Fragments live in FRAGMENT_DIR next to the file being sourced, which is
+    found at source time so that the generated file stays relocatable."""
+    yield "# Locate the fragment directory next to this file."
+    yield 'if [[ -n "${ZSH_VERSION}" ]]; then'
+    yield """  eval '__q_gen_dir="${(%):-%x}"'"""
+    yield "else"
+    yield '  __q_gen_dir="${BASH_SOURCE[0]}"'
+    yield "fi"
+    yield 'if [[ "${__q_gen_dir}" == */* ]]; then'
+    yield '  __q_gen_dir="${__q_gen_dir%/*}"'
+    yield "else"
+    yield "  __q_gen_dir=."
+    yield "fi"
+    yield '[[ "${__q_gen_dir}" == /* ]] || __q_gen_dir="${PWD}/${__q_gen_dir}"'
+    yield f'__q_gen_dir="${{__q_gen_dir}}/{FRAGMENT_DIR}"'
+    yield '__q_loaded=""'
+    yield ""
+    yield "# Source the help, dump and completion fragment of a module, once."
+    yield "# Usage: __q_load MODULE"
+    yield "function __q_load() {"
+    yield '  local frag="${1//[^a-zA-Z0-9_]/_}"'
+    yield '  [[ " ${__q_loaded} " == *" ${frag} "* ]] && return 0'
+    yield '  [[ -f "${__q_gen_dir}/${frag}.gen.bash" ]] || return 1'
+    yield '  source "${__q_gen_dir}/${frag}.gen.bash" || return 1'
+    yield '  __q_loaded+=" ${frag}"'
+    yield "}"
+
+
+def gen_lazy_help(
+    modules: Iterable[Module], prerender: bool = False
+) -> Generator[str, None, None]:
+    """Like gen_help, but module help is loaded from fragments on demand."""
+    yield "function __q_help() {"
+    yield '  if [ "$#" -eq 0 ]; then'
+    yield from _gen_help_index(modules, prerender)
+    yield "    return 0"
+    yield "  fi"
+    yield '  if [ "$#" -eq 1 ]; then'
+    yield '    if ! __q_load "$1"; then'
+    yield '      echo "Unknown module $1"'
+    yield "      return 1"
+    yield "    fi"
+    yield '    "__q_help_${1//[^a-zA-Z0-9_]/_}"'
+    yield "  fi"
+    yield "}"
+
+
+def gen_lazy_dump() -> Generator[str, None, None]:
+    """Like gen_dump, but each module's functions are in its fragment."""
+    yield "function __q_dump() {"
+    yield from _gen_dump_header()
+    yield '  if ! __q_load "$1"; then'
+    yield '    echo "Unknown module $1"'
+    yield "    return 1"
+    yield "  fi"
+    yield '  "__q_dump_${1//[^a-zA-Z0-9_]/_}" "$2"'
+    yield "}"
+
+
+def gen_lazy_bash_complete(modules: Iterable[Module]) -> Generator[str, None, None]:
+    """Like gen_bash_complete, but argument completion is loaded from
+    fragments on demand."""
+    yield from gen_complete_helpers()
+    yield from gen_complete_tables()
+    yield ""
+
+    yield "function __q_compgen() {"
+    yield from _gen_module_names_complete(modules)
+
+    yield from _gen_args_complete(lazy=True)
     yield "  esac"
     yield "}"
     yield ""
     yield '[[ -z "${_REDSHELL_ZSH}" ]] && complete -F __q_compgen q'
 
 
+def gen_fragment(
+    module: Module, prerender: bool = False
+) -> Generator[str, None, None]:
+    """Generate the help, dump and completion fragment of a single module."""
+    name = _fragment_name(module.name)
+    yield "# This file is generated by quick.py. Do not edit."
+    yield f"# Help, dump and completion for module {module.name}, sourced by __q_load."
+    yield ""
+    yield f"function __q_help_{name}() {{"
+    yield from gen_module_help(module, "  ", prerender)
+    yield "}"
+    yield ""
+    yield f"function __q_dump_{name}() {{"
+    yield from _gen_dump_cmd()
+    yield from _gen_dump_module(module, "$1", "  ")
+    yield "}"
+    yield ""
+    yield from gen_module_complete(module)
+
+
+def gen_autoload(modules: Iterable[Module]) -> Generator[str, None, None]:
+    """Generate autoload stubs for every function in modules.
+
+    Each stub sources the module the function is defined in, which replaces
+    the stubs for that module with the real functions, and then calls the
+    function again. Aliases are defined right away. Modules must have been
+    loaded from files (Module.path).
+    """
+    yield "# This file is generated by quick.py. Do not edit."
+    yield "# Run q quick rebuild to regenerate."
+    yield "#"
+    yield "# Autoload stubs: each function sources its module on first call."
+    yield ""
+    yield 'if [[ -z "${_REDSHELL_GEN_AUTOLOAD}" || -n "${_REDSHELL_RELOAD}" ]]; then'
+    yield "_REDSHELL_GEN_AUTOLOAD=1"
+    yield '__q_autoloaded=""'
+    yield ""
+    yield "# Usage: __q_autoload MODULE_FILE FUNCTION [ARG...]"
+    yield "function __q_autoload() {"
+    yield '  local __q_file="$1" __q_func="$2"'
+    yield "  shift 2"
+    yield "  # If the module was already sourced and the stub is still there, the"
+    yield "  # module no longer defines the function. Don't recurse forever."
+    yield '  if [[ "${__q_autoloaded}" == *":${__q_file}:"* ]]; then'
+    yield '    echo "${__q_file} does not define ${__q_func}, run q quick rebuild" >&2'
+    yield "    return 127"
+    yield "  fi"
+    yield '  __q_autoloaded+=":${__q_file}:"'
+    yield "  # Modules source their dependencies by relative path."
+    yield '  pushd "${__q_file%/*}" > /dev/null || return 127'
+    yield '  source "${__q_file}"'
+    yield "  popd > /dev/null"
+    yield '  "${__q_func}" "$@"'
+    yield "}"
+    for module in modules:
+        if not module.path:
+            raise ValueError(f"Module {module.name} has no path to autoload from")
+        path = shlex.quote(module.path)
+        yield ""
+        yield f"# {module.name}"
+        seen = set()
+        for function in module.functions:
+            name = function.name.value
+            if name in seen:
+                continue
+            seen.add(name)
+            yield f'function {name}() {{ __q_autoload {path} {name} "$@"; }}'
+        for function, aliases in module.func_to_alias.items():
+            for alias in aliases:
+                yield f"alias {alias}={function}"
+    yield ""
+    yield "fi"
+
+
 def gen_zsh_complete(modules: Iterable[Module]) -> Generator[str, None, None]:
     """Generate a zsh completion function for the q command."""
     yield "#compdef q"
@@ -802,66 +1238,650 @@ def gen_zsh_complete(modules: Iterable[Module]) -> Generator[str, None, None]:
     yield "compdef _q q"
 
 
+# Weight of a match on each part of a function, in q search results.
+SEARCH_WEIGHT_NAME = 4
+SEARCH_WEIGHT_ALIAS = 3
+SEARCH_WEIGHT_ARG = 2
+SEARCH_WEIGHT_DOC = 1
+
+
+def _search_terms(text: str) -> list[str]:
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+
+def gen_search_index(modules: Iterable[Module]) -> Generator[str, None, None]:
+    """Generate the inverted index that quick_search reads.
+
+    Each public function is a document, numbered from 0 in the order of the D
+    lines:
+
+      D <TAB> MODULE <TAB> FUNCTION <TAB> USAGE <TAB> SUMMARY
+
+    Words in the function name, aliases, argument names and doc comment are
+    lowercased and split on anything that's not a letter or digit. Each word
+    gets one T line, in sorted order, listing the documents it appears in and
+    the highest weight of a match in each:
+
+      T <TAB> TERM <TAB> DOC:WEIGHT,DOC:WEIGHT,...
+
+    All T lines come before the D lines, so the file can be answered in one
+    pass.
+    """
+    docs: list[str] = []
+    postings: dict[str, dict[int, int]] = {}
+
+    def add(text: str, doc: int, weight: int) -> None:
+        for term in _search_terms(text):
+            posting = postings.setdefault(term, {})
+            if posting.get(doc, 0) < weight:
+                posting[doc] = weight
+
+    for module in modules:
+        for function in _public_functions(module):
+            doc = len(docs)
+            name = function.name.value
+            local_name = _local_name(name, module.name)
+            summary = next((line for line in function.comment if line), "")
+            fields = (module.name, local_name, function.usage, summary)
+            docs.append("\t".join(field.replace("\t", " ") for field in fields))
+            add(name, doc, SEARCH_WEIGHT_NAME)
+            for alias in [module.name, local_name] + module.func_to_alias.get(name, []):
+                add(alias, doc, SEARCH_WEIGHT_ALIAS)
+            for arg in function.args:
+                add(arg.name, doc, SEARCH_WEIGHT_ARG)
+            for line in function.comment:
+                add(line, doc, SEARCH_WEIGHT_DOC)
+
+    for term in sorted(postings):
+        posting = ",".join(f"{doc}:{weight}" for doc, weight in postings[term].items())
+        yield f"T\t{term}\t{posting}"
+    for doc in docs:
+        yield f"D\t{doc}"
+
+
 def path_to_package(path: str, root: str) -> str:
     return path.removeprefix(root).removeprefix("/").removesuffix(".bash")
 
 
-def load_modules(path: str) -> Generator[Module, None, None]:
-    for root, _, files in os.walk(path):
+# Bump this whenever the parser or the serialized form of Module changes, so
+# stale cache entries are discarded instead of trusted.
+CACHE_VERSION = 2
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".redshell_persist", "quick_cache.json"
+)
+
+
+class ParseCache:
+    """Persistent cache of parsed modules.
+
+    Entries are keyed by the absolute path of the .bash file and validated
+    against the SHA-256 of its contents, so only changed files are re-parsed.
+    Only entries that were used since the cache was opened are written back,
+    which drops files that no longer exist.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._entries: dict[str, dict] = {}
+        self._used: dict[str, dict] = {}
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION:
+                self._entries = data["entries"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def get(self, file_path: str, digest: str, package: str) -> Union[Module, None]:
+        entry = self._entries.get(file_path)
+        if (
+            entry is None
+            or entry["digest"] != digest
+            or entry["module"]["name"] != package
+        ):
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._used[file_path] = entry
+        return Module.from_dict(entry["module"])
+
+    def put(self, file_path: str, digest: str, module: Module) -> None:
+        self._used[file_path] = {"digest": digest, "module": module.toJSON()}
+        self._dirty = True
+
+    def discard(self, file_path: str) -> None:
+        self._used.pop(file_path, None)
+
+    def save(self) -> None:
+        # Nothing was parsed or dropped - the file on disk is already current.
+        if not self._dirty and self._used.keys() == self._entries.keys():
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"version": CACHE_VERSION, "entries": self._used}, f)
+        os.replace(tmp, self.path)
+        self._entries = dict(self._used)
+        self._dirty = False
+
+
+def _read_module_file(file_path: str) -> tuple[str, str]:
+    """Returns the contents of the file and their SHA-256 hex digest."""
+    with open(file_path, "r") as f:
+        text = f.read()
+    return text, hashlib.sha256(text.encode()).hexdigest()
+
+
+def _module_files(path: str) -> Generator[tuple[str, str], None, None]:
+    """Yields (file_path, package) for every module under path."""
+    for root, dirs, files in os.walk(path):
+        # Generated files (including quick.gen.* directories) are not modules.
+        dirs[:] = [d for d in dirs if ".gen." not in d]
         for file in files:
             if not file.endswith(".bash"):
                 continue
             if ".gen." in file:
                 continue
-            with open(os.path.join(root, file), "r") as f:
-                sys.stderr.write(f"Loading {os.path.join(root, file)}\n")
-                yield parse_module(f, path_to_package(os.path.join(root, file), path))
-
-
-def gen_all(modules: list[Module], output: str) -> None:
-    with open(output, "w") as f:
-        f.write("# This file is generated by quick.py. Do not edit.\n")
-        f.write("# Run q quick rebuild to regenerate.\n")
-        f.write("\n")
-        f.write(
-            'if [[ -z "${_REDSHELL_GEN_QUICK}" || -n "${_REDSHELL_RELOAD}" ]]; then\n'
-        )
-        f.write("_REDSHELL_GEN_QUICK=1\n")
-        for line in gen_switch(modules):
-            f.write(line)
-            f.write("\n")
-        f.write("\n")
-        for line in gen_help(modules):
-            f.write(line)
-            f.write("\n")
-        for line in gen_dump(modules):
-            f.write(line)
-            f.write("\n")
-        f.write("\n")
-        for line in gen_bash_complete(modules):
-            f.write(line)
-            f.write("\n")
-        f.write("\n")
-        f.write("fi\n")
-
-    sys.stderr.write(f"Generated {output} with {len(modules)} modules\n")
+            file_path = os.path.join(root, file)
+            yield file_path, path_to_package(file_path, path)
+
+
+def _parse_module_text(task: tuple[str, str, str]) -> Module:
+    text, package, file_path = task
+    return parse_module(io.StringIO(text), package, file_path)
+
+
+def _load_files(
+    files: Iterable[tuple[str, str]],
+    cache: Union[ParseCache, None] = None,
+    workers: int = 1,
+) -> list[Module]:
+    """Loads the given (file_path, package) pairs, in order.
+
+    Files not found in the cache are parsed in a pool of worker processes if
+    workers is greater than 1, or in as many processes as there are CPUs if
+    workers is 0. The result is the same as parsing them one by one.
+    """
+    return [module for _, module in _load_files_with_digests(files, cache, workers)]
+
+
+def _load_files_with_digests(
+    files: Iterable[tuple[str, str]],
+    cache: Union[ParseCache, None] = None,
+    workers: int = 1,
+) -> list[tuple[str, Module]]:
+    """Like _load_files, but returns (digest, module) pairs.
+
+    The digest is of the contents the module was loaded from.
+    """
+    digests: list[str] = []
+    modules: list[Union[Module, None]] = []
+    pending: list[tuple[int, str]] = []  # (index, file_path)
+    tasks: list[tuple[str, str, str]] = []  # (text, package, file_path)
+    for file_path, package in files:
+        text, digest = _read_module_file(file_path)
+        digests.append(digest)
+        if cache is not None:
+            if module := cache.get(file_path, digest, package):
+                modules.append(module)
+                continue
+        sys.stderr.write(f"Loading {file_path}\n")
+        pending.append((len(modules), file_path))
+        tasks.append((text, package, file_path))
+        modules.append(None)
+
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(tasks))
+    if workers > 1:
+        with multiprocessing.Pool(workers) as pool:
+            chunksize = max(1, len(tasks) // (workers * 4))
+            parsed = pool.map(_parse_module_text, tasks, chunksize=chunksize)
+    else:
+        parsed = [_parse_module_text(task) for task in tasks]
+
+    for (i, file_path), module in zip(pending, parsed):
+        modules[i] = module
+        if cache is not None:
+            cache.put(file_path, digests[i], module)
+    return list(zip(digests, modules))
+
+
+def load_modules(
+    path: str, cache: Union[ParseCache, None] = None, workers: int = 1
+) -> Generator[Module, None, None]:
+    yield from _load_files(_module_files(path), cache, workers)
+
+
+# Directory, next to the generated file, that holds per-module fragments.
+FRAGMENT_DIR = "quick.gen.d"
+# Autoload stubs, next to the generated file. Not .bash, so that the rc files
+# don't source it along with the modules.
+AUTOLOAD_FILE = "quick.gen.autoload.sh"
+# Search index for quick_search, next to the generated file.
+SEARCH_INDEX_FILE = "quick.gen.search.tsv"
+
+
+def _write_if_changed(path: str, lines: Iterable[str]) -> bool:
+    """Atomically replace path with lines, unless it already has that content.
+
+    Returns whether the file was written. Unchanged files keep their mtime.
+    """
+    content = "".join(f"{line}\n" for line in lines)
+    try:
+        with open(path, "r") as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(content)
+    os.replace(tmp, path)
+    return True
+
+
+def gen_fragments(
+    modules: list[Module],
+    fragment_dir: str,
+    prerender: bool = False,
+    changed: Union[set[str], None] = None,
+) -> int:
+    """Write one fragment per module and remove fragments of deleted modules.
+
+    If changed is given, only fragments of modules with those names are
+    regenerated. Returns the number of fragments written.
+    """
+    os.makedirs(fragment_dir, exist_ok=True)
+    expected = set()
+    written = 0
+    for module in modules:
+        file = f"{_fragment_name(module.name)}.gen.bash"
+        expected.add(file)
+        if changed is not None and module.name not in changed:
+            continue
+        if _write_if_changed(
+            os.path.join(fragment_dir, file), gen_fragment(module, prerender)
+        ):
+            written += 1
+    for file in os.listdir(fragment_dir):
+        if file.endswith(".gen.bash") and file not in expected:
+            os.remove(os.path.join(fragment_dir, file))
+    return written
+
+
+def _gen_main(
+    modules: list[Module], lazy: bool, prerender: bool, dispatch: str
+) -> Generator[str, None, None]:
+    yield "# This file is generated by quick.py. Do not edit."
+    yield "# Run q quick rebuild to regenerate."
+    yield ""
+    yield 'if [[ -z "${_REDSHELL_GEN_QUICK}" || -n "${_REDSHELL_RELOAD}" ]]; then'
+    yield "_REDSHELL_GEN_QUICK=1"
+    if dispatch == "table":
+        yield from gen_table_switch(modules)
+    else:
+        yield from gen_switch(modules)
+    yield ""
+    if lazy:
+        yield from gen_lazy_loader()
+        yield ""
+        yield from gen_lazy_help(modules, prerender)
+        yield from gen_lazy_dump()
+    else:
+        yield from gen_help(modules, prerender)
+        yield from gen_dump(modules)
+    yield ""
+    if lazy:
+        yield from gen_lazy_bash_complete(modules)
+    else:
+        yield from gen_bash_complete(modules)
+    yield ""
+    yield "fi"
+
+
+def _report_write(path: str, written: bool, what: str = "") -> None:
+    status = "Generated" if written else "Unchanged"
+    sys.stderr.write(f"{status} {path}{what}\n")
+
+
+def gen_all(
+    modules: list[Module],
+    output: str,
+    lazy: bool = True,
+    prerender: bool = True,
+    dispatch: str = "case",
+    autoload: bool = False,
+    changed: Union[set[str], None] = None,
+) -> None:
+    """Generate quick.gen.bash and quick.gen.zsh.
+
+    If lazy is set, per-module help, dump and argument completion go to
+    fragments in FRAGMENT_DIR, which the generated file only sources when
+    they're first needed. Otherwise everything goes into one file.
+
+    If prerender is set, each help screen is rendered at generation time and
+    printed with one printf, instead of one echo per line and color change.
+
+    dispatch selects how q finds the function to call: "case" generates a
+    case statement, "table" an associative array (see gen_table_switch).
+
+    If autoload is set, also generate AUTOLOAD_FILE with stubs that source each
+    module on first use (see gen_autoload). Otherwise, remove a stale one.
+
+    The search index for q search always goes to SEARCH_INDEX_FILE.
+
+    Files are replaced atomically, and only if their content changed. If
+    changed is given, only the fragments of modules with those names are
+    regenerated (see watch).
+    """
+    if dispatch not in ("case", "table"):
+        raise ValueError(f"Unknown dispatch {dispatch}, expected case or table")
+
+    written = _write_if_changed(
+        output, _gen_main(modules, lazy, prerender, dispatch)
+    )
+    _report_write(output, written, f" with {len(modules)} modules")
+
+    if lazy:
+        fragment_dir = os.path.join(os.path.dirname(output), FRAGMENT_DIR)
+        count = gen_fragments(modules, fragment_dir, prerender, changed)
+        sys.stderr.write(f"Generated {count} fragments in {fragment_dir}\n")
+
+    autoload_output = os.path.join(os.path.dirname(output), AUTOLOAD_FILE)
+    if autoload:
+        written = _write_if_changed(autoload_output, gen_autoload(modules))
+        _report_write(autoload_output, written, " (autoload stubs)")
+    elif os.path.exists(autoload_output):
+        os.remove(autoload_output)
+
+    search_output = os.path.join(os.path.dirname(output), SEARCH_INDEX_FILE)
+    written = _write_if_changed(search_output, gen_search_index(modules))
+    _report_write(search_output, written, " (search index)")
 
     # Also generate zsh completion file
     zsh_output = output.replace(".gen.bash", ".gen.zsh")
-    with open(zsh_output, "w") as f:
-        for line in gen_zsh_complete(modules):
-            f.write(line)
-            f.write("\n")
+    written = _write_if_changed(zsh_output, gen_zsh_complete(modules))
+    _report_write(zsh_output, written, " (zsh completion)")
+
+
+def build_all(
+    paths: list[str],
+    output: str,
+    cache_path: str = "",
+    workers: int = 1,
+    lazy: bool = True,
+    prerender: bool = True,
+    dispatch: str = "case",
+    autoload: bool = False,
+) -> None:
+    """Parse all modules under paths and generate output from them.
 
-    sys.stderr.write(f"Generated {zsh_output} (zsh completion)\n")
+    Parsed modules are cached in cache_path (by default in ~/.redshell_persist),
+    so that only changed files are re-parsed. Pass "none" to disable the cache.
 
+    Modules that need parsing are parsed in parallel by this many worker
+    processes. Pass 0 to use all CPUs.
 
-def build_all(paths: list[str], output: str) -> None:
-    modules = []
+    See gen_all for lazy, prerender, dispatch and autoload.
+    """
     sys.stderr.write(f"Building quick.gen.bash from {paths}\n")
-    for path in paths:
-        modules.extend(load_modules(path))
+    cache = None
+    if cache_path != "none":
+        cache = ParseCache(cache_path or DEFAULT_CACHE_PATH)
+    files = [f for path in paths for f in _module_files(path)]
+    modules = _load_files(files, cache, workers)
+
+    if cache is not None:
+        sys.stderr.write(
+            f"Parse cache: {cache.hits} unchanged, {cache.misses} parsed\n"
+        )
+        cache.save()
 
     modules.sort(key=lambda m: m.name)
 
-    gen_all(modules, output)
+    gen_all(modules, output, lazy, prerender, dispatch, autoload)
+
+
+class _InotifyWatcher:
+    """Reports changes to .bash files under paths, using inotify via ctypes.
+
+    Raises OSError if inotify is not available.
+    """
+
+    IN_MODIFY = 0x2
+    IN_ATTRIB = 0x4
+    IN_CLOSE_WRITE = 0x8
+    IN_MOVED_FROM = 0x40
+    IN_MOVED_TO = 0x80
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_DELETE_SELF = 0x400
+    IN_MOVE_SELF = 0x800
+    IN_Q_OVERFLOW = 0x4000
+    IN_IGNORED = 0x8000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    MASK = (
+        IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+        | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+    )
+    EVENT = struct.Struct("iIII")  # wd, mask, cookie, len
+
+    def __init__(self, paths: list[str]):
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+        self._fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: dict[int, str] = {}
+        for path in paths:
+            self._add_tree(path)
+
+    def _add_tree(self, path: str) -> None:
+        for root, dirs, _ in os.walk(path):
+            dirs[:] = [d for d in dirs if ".gen." not in d]
+            wd = self._libc.inotify_add_watch(
+                self._fd, os.fsencode(root), self.MASK
+            )
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch {root} failed")
+            self._dirs[wd] = root
+
+    def wait(self, timeout: Union[float, None]) -> Union[set[str], None]:
+        """Waits up to timeout seconds (forever if None) for changes.
+
+        Returns the changed paths, or None if events were lost and anything
+        might have changed.
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        changed: set[str] = set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = self.EVENT.unpack_from(data, offset)
+            offset += self.EVENT.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            if mask & self.IN_Q_OVERFLOW:
+                return None
+            if mask & self.IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            root = self._dirs.get(wd)
+            if root is None or ".gen." in name:
+                continue
+            path = os.path.join(root, name)
+            if mask & self.IN_ISDIR:
+                # A new directory might already have files in it. Modules are
+                # found by walking the tree on rebuild, so just report it.
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    self._add_tree(path)
+                changed.add(path)
+            elif name.endswith(".bash"):
+                changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class _PollWatcher:
+    """Reports changes to .bash files under paths by polling their mtimes."""
+
+    def __init__(self, paths: list[str], interval: float):
+        self._paths = paths
+        self._interval = interval
+        self._stats = self._snapshot()
+
+    def _snapshot(self) -> dict[str, tuple[int, int]]:
+        stats = {}
+        for path in self._paths:
+            for file_path, _ in _module_files(path):
+                try:
+                    st = os.stat(file_path)
+                except OSError:
+                    continue
+                stats[file_path] = (st.st_mtime_ns, st.st_size)
+        return stats
+
+    def wait(self, timeout: Union[float, None]) -> Union[set[str], None]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self._interval
+            if deadline is not None:
+                delay = min(delay, max(0.0, deadline - time.monotonic()))
+            time.sleep(delay)
+            stats = self._snapshot()
+            changed = {
+                f for f in stats.keys() | self._stats.keys()
+                if stats.get(f) != self._stats.get(f)
+            }
+            self._stats = stats
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self) -> None:
+        pass
+
+
+def _wait_for_changes(watcher, debounce: float) -> Union[set[str], None]:
+    """Blocks until something changes, then until nothing has for debounce
+    seconds. Returns all changed paths, or None if unknown."""
+    changed = watcher.wait(None)
+    while True:
+        more = watcher.wait(debounce)
+        if more is not None and not more:
+            return changed
+        if changed is None or more is None:
+            changed = None
+        else:
+            changed |= more
+
+
+def watch(
+    paths: list[str],
+    output: str,
+    cache_path: str = "",
+    workers: int = 1,
+    poll: bool = False,
+    interval: float = 1.0,
+    debounce: float = 0.3,
+    lazy: bool = True,
+    prerender: bool = True,
+    dispatch: str = "case",
+    autoload: bool = False,
+) -> None:
+    """Build output like build_all, then rebuild it whenever a module changes.
+
+    Changes are detected with inotify or, if that's not available or poll is
+    set, by checking mtimes every interval seconds. A burst of changes is
+    handled once, after nothing changed for debounce seconds. Only changed
+    files are re-parsed, only fragments of changed modules are regenerated,
+    and files whose content is the same are not rewritten.
+
+    See build_all for cache_path and workers, and gen_all for the rest.
+    Runs until interrupted.
+    """
+    cache = None
+    if cache_path != "none":
+        cache = ParseCache(cache_path or DEFAULT_CACHE_PATH)
+
+    # file_path -> (digest, module), in walk order.
+    state: dict[str, tuple[str, Module]] = {}
+    files = [f for path in paths for f in _module_files(path)]
+    loaded = _load_files_with_digests(files, cache, workers)
+    for (file_path, _), (digest, module) in zip(files, loaded):
+        state[file_path] = (digest, module)
+    if cache is not None:
+        cache.save()
+
+    def generate(changed: Union[set[str], None]) -> None:
+        modules = sorted((m for _, m in state.values()), key=lambda m: m.name)
+        gen_all(modules, output, lazy, prerender, dispatch, autoload, changed)
+
+    generate(None)
+
+    watcher = None
+    if not poll:
+        try:
+            watcher = _InotifyWatcher(paths)
+        except (OSError, AttributeError) as e:
+            sys.stderr.write(f"inotify unavailable ({e}), polling instead\n")
+    if watcher is None:
+        watcher = _PollWatcher(paths, interval)
+    sys.stderr.write(f"Watching {paths} for changes. Press Ctrl-C to stop.\n")
+
+    try:
+        while True:
+            changed_paths = _wait_for_changes(watcher, debounce)
+            new_state: dict[str, tuple[str, Module]] = {}
+            changed_modules: set[str] = set()
+            for file_path, package in (f for path in paths for f in _module_files(path)):
+                old = state.get(file_path)
+                if old is not None and changed_paths is not None and not any(
+                    p == file_path or file_path.startswith(p + os.sep)
+                    for p in changed_paths
+                ):
+                    new_state[file_path] = old
+                    continue
+                try:
+                    text, digest = _read_module_file(file_path)
+                except OSError:
+                    continue
+                if old is not None and old[0] == digest:
+                    new_state[file_path] = old
+                    continue
+                sys.stderr.write(f"Loading {file_path}\n")
+                module = _parse_module_text((text, package, file_path))
+                new_state[file_path] = (digest, module)
+                changed_modules.add(module.name)
+                if cache is not None:
+                    cache.put(file_path, digest, module)
+            for file_path in state.keys() - new_state.keys():
+                changed_modules.add(state[file_path][1].name)
+                if cache is not None:
+                    cache.discard(file_path)
+            state = new_state
+            if not changed_modules:
+                continue
+            if cache is not None:
+                cache.save()
+            sys.stderr.write(f"Changed modules: {' '.join(sorted(changed_modules))}\n")
+            generate(changed_modules)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
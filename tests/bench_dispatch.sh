@@ -0,0 +1,67 @@
+#!/bin/bash
+# Microbenchmark for q dispatch: case statement vs. associative array.
+#
+# Generates quick.gen.bash from src/ in both dispatch modes and times calls to
+# the first function of the first module and the last function of the last
+# module. The target functions are replaced by no-ops, so only dispatch is
+# measured.
+#
+# Usage: tests/bench_dispatch.sh [ITERATIONS]
+
+set -e
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+SRC_DIR="$(cd "${SCRIPT_DIR}/../src" && pwd)"
+ITERATIONS="${1:-2000}"
+WORK_DIR="$(mktemp -d)"
+trap 'rm -rf "${WORK_DIR}"' EXIT
+
+# Generates both variants and prints "MODULE FUNCTION LOCAL_NAME" for the first
+# and the last public function.
+GEN_SCRIPT='
+import sys
+import quick
+
+src, work = sys.argv[1], sys.argv[2]
+for dispatch in ("case", "table"):
+    quick.build_all([src], f"{work}/{dispatch}/quick.gen.bash", "none", dispatch=dispatch)
+
+modules = sorted(quick.load_modules(src), key=lambda m: m.name)
+modules = [m for m in modules if quick._public_functions(m)]
+first = quick._public_functions(modules[0])[0]
+last = quick._public_functions(modules[-1])[-1]
+for module, function in ((modules[0], first), (modules[-1], last)):
+    name = function.name.value
+    print(module.name, name, quick._local_name(name, module.name))
+'
+mkdir -p "${WORK_DIR}/case" "${WORK_DIR}/table"
+if ! targets="$(cd "${SRC_DIR}" && python3 -c "${GEN_SCRIPT}" "${SRC_DIR}" "${WORK_DIR}" 2> "${WORK_DIR}/log")"; then
+    echo "Failed to generate quick.gen.bash:" >&2
+    cat "${WORK_DIR}/log" >&2
+    exit 1
+fi
+
+# Usage: bench DISPATCH MODULE FUNCTION LOCAL_NAME
+# Prints the mean time per call in microseconds.
+bench() {
+    local dispatch="$1" module="$2" function="$3" local_name="$4"
+    bash -c '
+        source "'"${SRC_DIR}"'/compat.sh"
+        source "'"${WORK_DIR}/${dispatch}"'/quick.gen.bash"
+        function '"${function}"'() { :; }
+        start="${EPOCHREALTIME/./}"
+        for (( i = 0; i < '"${ITERATIONS}"'; i++ )); do
+            __q '"${module}"' '"${local_name}"' arg
+        done
+        end="${EPOCHREALTIME/./}"
+        echo "$(( (end - start) / '"${ITERATIONS}"' ))"
+    '
+}
+
+printf "%-8s %-40s %10s\n" "dispatch" "call" "us/call"
+while read -r module function local_name; do
+    for dispatch in case table; do
+        printf "%-8s %-40s %10s\n" "${dispatch}" "q ${module} ${local_name}" \
+            "$(bench "${dispatch}" "${module}" "${function}" "${local_name}")"
+    done
+done <<< "${targets}"
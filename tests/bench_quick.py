@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2024 Adam Sindelar
+
+# Benchmarks for quick.py.
+#
+# Usage: python3 tests/bench_quick.py [usage] [scale]
+#
+# usage: Compares _parse_usage against the original slicing implementation on
+#        progressively longer Usage: lines, and checks that both accept and
+#        reject the same inputs with the same errors.
+# scale: Times the parser and each generator on synthetic corpora of 10 to
+#        10,000 functions, and reports peak memory and the size of the output.
+
+import os
+import random
+import re
+import sys
+import time
+import timeit
+import tracemalloc
+from typing import Iterable
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import quick
+from quick import Argument, ArgumentType
+
+
+# The net_gallery usage line, which is the longest one in src/.
+NET_GALLERY_USAGE = (
+    "net_gallery [--dedupe] [--copy-to DIR] [--scan-only] [--serve-only] "
+    "[--force] [--clean] [--title TITLE] [-l|--port PORT] [-u|--username USER] "
+    "[-P|--password PASS] [-C|--certfile FILE] [--keyfile FILE] [DIR]"
+)
+
+
+def _parse_usage_legacy(usage: str) -> tuple[str, list[Argument]]:
+    """The original implementation of quick._parse_usage, for comparison."""
+    args = []
+    s = usage
+    n = 0
+    optional = False
+    prev_token = "BEGIN"
+
+    while s:
+        if m := re.match(r"\s*\[", s):
+            if optional:
+                raise ValueError(f"Unexpected '[' after position {n}: {usage}")
+            optional = True
+            s = s[m.end() :]
+            n += m.end()
+            prev_token = "LBRACKET"
+        elif m := re.match(r"\s*\]", s):
+            if not optional:
+                raise ValueError(f"Unexpected ']' after position {n}: {usage}")
+            optional = False
+            s = s[m.end() :]
+            n += m.end()
+            prev_token = "RBRACKET"
+        elif m := re.match(r"\s*([a-z|A-Z_0-9\-]+)", s):
+            s = s[m.end() :]
+            n += m.end()
+            if prev_token == "BEGIN":
+                prev_token = "EXE"
+                continue
+            prev_token = "ARG"
+            args.append(
+                Argument(
+                    name=m.group(1),
+                    type=ArgumentType.DEFAULT,
+                    type_name="",
+                    default="",
+                    required=not optional,
+                    repeated=False,
+                )
+            )
+        elif m := re.match(r"\s*\.\.\.", s):
+            if prev_token not in ("ARG", "RBRACKET"):
+                raise ValueError(f"Unexpected '...' after position {n}: {usage}")
+            if not args:
+                raise ValueError(
+                    f"Args is still empty on '...' after position {n}: {usage}"
+                )
+            args[-1].repeated = True
+            s = s[m.end() :]
+            n += m.end()
+            prev_token = "REPEATED"
+        elif re.match(r"[\s\.]*$", s):
+            break
+        else:
+            raise ValueError(f"Unexpected character {s[0]} at position {n}: {usage}")
+
+    return usage, quick._finalize_arguments(args)
+
+
+def _outcome(parse, usage: str):
+    try:
+        return parse(usage)
+    except ValueError as e:
+        return str(e)
+
+
+def check_usage_equivalence(samples: int = 20000) -> None:
+    """Checks both parsers on random inputs built from usage-like fragments."""
+    fragments = ["[", "]", " ", "  ", "...", ".", "-", "--flag", "ARG", "a|b",
+                 "FILE", "x", "\t", "\n", "(", ",", "'", "=", "|"]
+    rng = random.Random(1)
+    inputs = [NET_GALLERY_USAGE, "", " ", "...", "f ...", "f [A]...", "f [[A]]"]
+    for _ in range(samples):
+        inputs.append("".join(rng.choice(fragments) for _ in range(rng.randint(1, 12))))
+    for usage in inputs:
+        expected = _outcome(_parse_usage_legacy, usage)
+        actual = _outcome(quick._parse_usage, usage)
+        if expected != actual:
+            raise AssertionError(f"{usage!r}: {expected!r} != {actual!r}")
+    print(f"_parse_usage: {len(inputs)} inputs parsed identically")
+
+
+def bench_usage() -> None:
+    check_usage_equivalence()
+    print(f"{'args':>6} {'legacy (us)':>12} {'current (us)':>13} {'speedup':>8}")
+    for repeat in (1, 4, 16, 64):
+        # Repeat the flags of net_gallery to simulate longer usage lines.
+        usage = "f " + " ".join([NET_GALLERY_USAGE.split(" ", 1)[1]] * repeat)
+        n_args = len(quick._parse_usage(usage)[1])
+        number = max(1, 2000 // repeat)
+        legacy = min(timeit.repeat(lambda: _parse_usage_legacy(usage), number=number, repeat=3))
+        current = min(timeit.repeat(lambda: quick._parse_usage(usage), number=number, repeat=3))
+        print(
+            f"{n_args:>6} {legacy / number * 1e6:>12.1f} "
+            f"{current / number * 1e6:>13.1f} {legacy / current:>7.1f}x"
+        )
+
+
+# Number of functions in each synthetic corpus.
+SCALE_SIZES = (10, 100, 1000, 10000)
+FUNCTIONS_PER_MODULE = 20
+
+# Usage line templates for the synthetic corpus. {f} is the function name.
+SYNTHETIC_USAGES = (
+    "{f}",
+    "{f} FILE",
+    "{f} [-v|--verbose] [DIR]",
+    "{f} [--title TITLE] [-u|--username USER] HOST [PORT]",
+    "{f} [--dedupe] [--copy-to DIR] [--force] [-l|--port PORT] PATH...",
+    "{f} [-C|--certfile FILE] [--keyfile FILE] [--format STRING] ARGS...",
+)
+
+
+def synthetic_module(name: str, n_functions: int, seed: int) -> list[str]:
+    """Returns the lines of a module file shaped like the ones in src/."""
+    rng = random.Random(seed)
+    lines = [
+        "# SPDX-License-Identifier: Apache-2.0",
+        "# Copyright (c) 2024 Adam Sindelar",
+        "",
+        f"# Synthetic module {name}, generated by bench_quick.py.",
+        "# It has realistic usage lines, aliases and private helpers.",
+        "",
+        'source "compat.sh"',
+        "",
+        f'if [[ -z "${{_REDSHELL_{name.upper()}}}" || -n "${{_REDSHELL_RELOAD}}" ]]; then',
+        f"_REDSHELL_{name.upper()}=1",
+        "",
+    ]
+    for i in range(n_functions):
+        fname = f"{name}_func_{i}"
+        if i % 7 == 6:
+            # Private helpers have no comment and don't show up in help.
+            lines += [f"function _{fname}() {{", "    true", "}", ""]
+            continue
+        usage = rng.choice(SYNTHETIC_USAGES).format(f=fname)
+        lines += [
+            f"# Does thing number {i} of module {name}.",
+            "#",
+            f"# Usage: {usage}",
+            "#",
+            "# Longer description of the function, which spans a couple of",
+            f"# lines and mentions $variables and 'quotes' like module {name}.",
+            f"function {fname}() {{",
+            '    echo "$@"',
+            "}",
+            "",
+        ]
+        if i % 5 == 0:
+            lines += [f"alias {name}{i}={fname}", ""]
+    lines.append("fi # _REDSHELL_" + name.upper())
+    return lines
+
+
+def synthetic_corpus(n_functions: int) -> list[tuple[str, list[str]]]:
+    """Splits n_functions into modules of FUNCTIONS_PER_MODULE functions."""
+    corpus = []
+    for start in range(0, n_functions, FUNCTIONS_PER_MODULE):
+        name = f"syn{start // FUNCTIONS_PER_MODULE}"
+        count = min(FUNCTIONS_PER_MODULE, n_functions - start)
+        corpus.append((name, synthetic_module(name, count, seed=start)))
+    return corpus
+
+
+def _measure(stage, min_time: float = 0.2) -> tuple[float, int, object]:
+    """Returns seconds per call, peak traced bytes and the result of stage.
+
+    The timing runs without tracemalloc, which would slow it down several
+    times. The stage is run once more under tracemalloc to get the peak.
+    """
+    result = stage()
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            stage()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1000:
+            break
+        number *= 10
+    best = min(elapsed, timeit.timeit(stage, number=number))
+
+    tracemalloc.start()
+    try:
+        stage()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best / number, peak, result
+
+
+def _output_size(lines: Iterable[str]) -> int:
+    """Drains a generator and returns the size of its output in bytes."""
+    return sum(len(line) + 1 for line in lines)
+
+
+def bench_scale() -> None:
+    print(
+        f"{'functions':>9} {'stage':<18} {'time (ms)':>10} "
+        f"{'peak (KiB)':>11} {'output (KiB)':>13}"
+    )
+    for n_functions in SCALE_SIZES:
+        corpus = synthetic_corpus(n_functions)
+        modules = [quick.parse_module(lines, name) for name, lines in corpus]
+        usages = [
+            line[len("# Usage: "):]
+            for _, lines in corpus
+            for line in lines
+            if line.startswith("# Usage: ")
+        ]
+        # Parsers keep their results, like load_modules does. Generators are
+        # drained line by line, like gen_all does.
+        stages = {
+            "parse_module": lambda: [
+                quick.parse_module(lines, name) for name, lines in corpus
+            ],
+            "_parse_usage": lambda: [quick._parse_usage(usage) for usage in usages],
+            "gen_switch": lambda: _output_size(quick.gen_switch(modules)),
+            "gen_help": lambda: _output_size(quick.gen_help(modules, prerender=True)),
+            "gen_dump": lambda: _output_size(quick.gen_dump(modules)),
+            "gen_bash_complete": lambda: _output_size(quick.gen_bash_complete(modules)),
+            "gen_zsh_complete": lambda: _output_size(quick.gen_zsh_complete(modules)),
+            "gen_search_index": lambda: _output_size(quick.gen_search_index(modules)),
+        }
+        for name, stage in stages.items():
+            seconds, peak, result = _measure(stage)
+            output = f"{result / 1024:.1f}" if isinstance(result, int) else "-"
+            print(
+                f"{n_functions:>9} {name:<18} {seconds * 1e3:>10.3f} "
+                f"{peak / 1024:>11.1f} {output:>13}"
+            )
+
+
+BENCHMARKS = {
+    "usage": bench_usage,
+    "scale": bench_scale,
+}
+
+
+def main(argv: list[str]) -> int:
+    names = argv or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"Unknown benchmark {name}. Available: {' '.join(BENCHMARKS)}", file=sys.stderr)
+            return 1
+    for name in names:
+        print(f"== {name}")
+        BENCHMARKS[name]()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,112 @@
+#!/bin/bash
+# Shell-side benchmarks for redshell. Run by run_benchmarks.sh under each shell.
+#
+# Prints one tab-separated line per measurement:
+#   SHELL NAME ITERATIONS MEAN_US
+#
+# Usage: bench_shell.sh SRC_DIR SHELL_BINARY [ITERATIONS]
+
+SRC_DIR="${1}"
+BENCH_SHELL="${2}"
+ITERATIONS="${3:-20}"
+
+if [[ -n "${ZSH_VERSION}" ]]; then
+    SHELL_NAME=zsh
+else
+    SHELL_NAME=bash
+fi
+
+# Sets __bench_t to the current time in microseconds.
+if [[ -n "${ZSH_VERSION}" ]]; then
+    zmodload zsh/datetime
+    integer __bench_t
+    __bench_now() { (( __bench_t = EPOCHREALTIME * 1000000 )); }
+else
+    __bench_now() { __bench_t="${EPOCHREALTIME/./}"; }
+fi
+
+# Usage: __bench_report NAME ITERATIONS TOTAL_US
+__bench_report() {
+    printf "%s\t%s\t%s\t%s\n" "${SHELL_NAME}" "$1" "$2" "$(( $3 / $2 ))"
+}
+
+# Times a command in a fresh shell, ITERATIONS times. SETUP runs first, in
+# SRC_DIR and after compat.sh, and is not timed.
+# Usage: __bench_fresh NAME SETUP COMMAND
+__bench_fresh() {
+    local name="$1" setup="$2" command="$3" total=0 i us
+    for (( i = 0; i < ITERATIONS; i++ )); do
+        us="$("${BENCH_SHELL}" -c '
+            cd "'"${SRC_DIR}"'" || exit 1
+            source ./compat.sh
+            '"${setup}"' > /dev/null 2>&1
+            if [[ -n "${ZSH_VERSION}" ]]; then
+                zmodload zsh/datetime
+                integer s e
+                (( s = EPOCHREALTIME * 1000000 ))
+                '"${command}"' > /dev/null 2>&1
+                (( e = EPOCHREALTIME * 1000000 ))
+            else
+                s="${EPOCHREALTIME/./}"
+                '"${command}"' > /dev/null 2>&1
+                e="${EPOCHREALTIME/./}"
+            fi
+            echo $(( e - s ))
+        ')"
+        (( total += ${us:-0} ))
+    done
+    __bench_report "${name}" "${ITERATIONS}" "${total}"
+}
+
+# Times running a command in this shell ITERATIONS times, after one warm-up run.
+# Usage: __bench_run NAME COMMAND...
+__bench_run() {
+    local name="$1" i start
+    shift
+    "$@" > /dev/null 2>&1
+    __bench_now
+    start="${__bench_t}"
+    for (( i = 0; i < ITERATIONS; i++ )); do
+        "$@" > /dev/null 2>&1
+    done
+    __bench_now
+    __bench_report "${name}" "${ITERATIONS}" "$(( __bench_t - start ))"
+}
+
+# Completion is driven by bash's COMP_WORDS, which is 0-indexed.
+__bench_compgen() {
+    [[ -n "${ZSH_VERSION}" ]] && emulate -L ksh
+    COMP_WORDS=("$@")
+    COMP_CWORD=$(( ${#COMP_WORDS[@]} - 1 ))
+    COMPREPLY=()
+    __q_compgen
+}
+
+# Startup: the generated file, then each module in isolation.
+__bench_fresh "source/quick.gen.bash" : "source ./quick.gen.bash"
+for f in "${SRC_DIR}"/*.bash; do
+    f="${f##*/}"
+    [[ "${f}" == *.gen.* ]] && continue
+    __bench_fresh "source/${f}" : "source ./${f}"
+done
+
+# First use of a module's help, which loads its fragment.
+__bench_fresh "q/help_module_cold" "source ./quick.bash" "q help net"
+
+# Latency of q itself, in a shell with quick.bash loaded.
+pushd "${SRC_DIR}" > /dev/null
+source ./compat.sh
+source ./quick.bash > /dev/null 2>&1
+popd > /dev/null
+__bench_tmp="$(mktemp -d)"
+trap 'rm -rf "${__bench_tmp}"' EXIT
+cd "${__bench_tmp}"
+
+# The target is replaced, so only dispatch is measured.
+function quick_rebuild() { :; }
+__bench_run "q/dispatch" q quick rebuild
+__bench_run "q/help" q help
+__bench_run "q/help_module" q help net
+__bench_run "q/compgen_module" __bench_compgen q ne
+__bench_run "q/compgen_function" __bench_compgen q net ga
+__bench_run "q/compgen_flags" __bench_compgen q net gallery --dedupe --title x --
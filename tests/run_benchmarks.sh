@@ -0,0 +1,117 @@
+#!/bin/bash
+# Benchmark runner for redshell. Measures shell startup (sourcing
+# quick.gen.bash and each module) and q latency under both bash and zsh, and
+# compares the results to a stored baseline.
+#
+# Usage: run_benchmarks.sh [-n|--iterations N] [-o|--output FILE]
+#                          [-b|--baseline FILE] [--save-baseline]
+#                          [-t|--threshold PERCENT]
+#
+# The report is a TSV file with the columns shell, name, iterations and
+# mean_us. A measurement is a regression if it's more than PERCENT (default 25)
+# and at least 100us slower than the baseline. Exits with 1 if there are any.
+#
+# Example:
+#   tests/run_benchmarks.sh --save-baseline   # Before a change
+#   tests/run_benchmarks.sh                   # After a change
+
+set -e
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+SRC_DIR="$(cd "${SCRIPT_DIR}/../src" && pwd)"
+BENCH_DIR="${HOME}/.redshell_persist/bench"
+
+ITERATIONS=20
+OUTPUT="${BENCH_DIR}/report.tsv"
+BASELINE="${BENCH_DIR}/baseline.tsv"
+SAVE_BASELINE=""
+THRESHOLD=25
+# Differences smaller than this are noise, no matter the percentage.
+MIN_DELTA_US=100
+
+while [[ "${#}" -ne 0 ]]; do
+    case "${1}" in
+        -n|--iterations)
+            ITERATIONS="${2}"
+            shift
+            ;;
+        -o|--output)
+            OUTPUT="${2}"
+            shift
+            ;;
+        -b|--baseline)
+            BASELINE="${2}"
+            shift
+            ;;
+        --save-baseline)
+            SAVE_BASELINE=1
+            ;;
+        -t|--threshold)
+            THRESHOLD="${2}"
+            shift
+            ;;
+        *)
+            echo "Unknown argument: ${1}" >&2
+            exit 1
+            ;;
+    esac
+    shift
+done
+
+mkdir -p "$(dirname "${OUTPUT}")"
+printf "shell\tname\titerations\tmean_us\n" > "${OUTPUT}"
+
+echo "Running redshell benchmarks (${ITERATIONS} iterations)..."
+echo "Source directory: ${SRC_DIR}"
+for shell in bash zsh; do
+    if ! command -v "${shell}" > /dev/null 2>&1; then
+        echo "  SKIP [${shell}] (${shell} not found)"
+        continue
+    fi
+    echo "  RUN  [${shell}]"
+    "${shell}" "${SCRIPT_DIR}/bench_shell.sh" \
+        "${SRC_DIR}" "$(command -v "${shell}")" "${ITERATIONS}" >> "${OUTPUT}"
+done
+echo "Report: ${OUTPUT}"
+echo ""
+
+if [[ -n "${SAVE_BASELINE}" ]]; then
+    mkdir -p "$(dirname "${BASELINE}")"
+    cp "${OUTPUT}" "${BASELINE}"
+    echo "Saved baseline: ${BASELINE}"
+    exit 0
+fi
+
+if [[ ! -f "${BASELINE}" ]]; then
+    column -t -s $'\t' "${OUTPUT}" 2> /dev/null || cat "${OUTPUT}"
+    echo ""
+    echo "No baseline at ${BASELINE}. Run with --save-baseline to create one."
+    exit 0
+fi
+
+awk -F '\t' -v threshold="${THRESHOLD}" -v min_delta="${MIN_DELTA_US}" '
+    FNR == 1 { next }
+    NR == FNR { baseline[$1 "\t" $2] = $4; next }
+    {
+        key = $1 "\t" $2
+        if (!(key in baseline)) {
+            printf "  NEW        %-5s %-32s %8d us\n", $1, $2, $4
+            next
+        }
+        old = baseline[key]
+        delta = $4 - old
+        pct = old > 0 ? 100 * delta / old : 0
+        status = "OK"
+        if (delta >= min_delta && pct > threshold) {
+            status = "REGRESSION"
+            regressions++
+        } else if (-delta >= min_delta && -pct > threshold) {
+            status = "FASTER"
+        }
+        printf "  %-10s %-5s %-32s %8d us (baseline %d us, %+.0f%%)\n", status, $1, $2, $4, old, pct
+    }
+    END {
+        printf "\n%d regression(s) against baseline\n", regressions
+        exit regressions > 0 ? 1 : 0
+    }
+' "${BASELINE}" "${OUTPUT}"
@@ -40,6 +40,84 @@ if [[ -z "${result}" ]]; then
     (( FAILURES++ ))
 fi
 
+# Test: module help is loaded from its fragment on demand
+result="$(q help quick 2>&1)"
+if [[ "${result}" != "Usage: q quick FUNCTION"* ]]; then
+    echo "FAIL: q help quick did not print module help: ${result}" >&2
+    (( FAILURES++ ))
+fi
+
+# Test: help for an unknown module fails
+if q help no_such_module > /dev/null 2>&1; then
+    echo "FAIL: q help no_such_module succeeded" >&2
+    (( FAILURES++ ))
+fi
+
+# Test: q dump loads the module's fragment on demand
+result="$(q dump quick search 2>&1)"
+if [[ "${result}" != *"quick_search"* ]]; then
+    echo "FAIL: q dump quick search did not print quick_search: ${result}" >&2
+    (( FAILURES++ ))
+fi
+
+# Test: dump of an unknown module fails
+if q dump no_such_module no_such_function > /dev/null 2>&1; then
+    echo "FAIL: q dump no_such_module succeeded" >&2
+    (( FAILURES++ ))
+fi
+
+# Test: q search answers from the generated index
+result="$(q search --index "${SRC_DIR}/quick.gen.search.tsv" REBUILD 2>&1)"
+if [[ "${result}" != "q quick rebuild "* ]]; then
+    echo "FAIL: q search REBUILD did not find quick rebuild: ${result}" >&2
+    (( FAILURES++ ))
+fi
+
+# Test: q search finds the first function in the index
+first="$(grep -m 1 $'^D\t' "${SRC_DIR}/quick.gen.search.tsv" | cut -f 2,3)"
+first_module="${first%%$'\t'*}"
+first_name="${first#*$'\t'}"
+result="$(q search --index "${SRC_DIR}/quick.gen.search.tsv" "${first_module}" "${first_name}" 2>&1)"
+if [[ "${result}" != *"q ${first_module} ${first_name} "* ]]; then
+    echo "FAIL: q search did not find the first function ${first_module} ${first_name}: ${result}" >&2
+    (( FAILURES++ ))
+fi
+
+# Test: q search fails if nothing matches
+if q search --index "${SRC_DIR}/quick.gen.search.tsv" no_such_word > /dev/null 2>&1; then
+    echo "FAIL: q search no_such_word succeeded" >&2
+    (( FAILURES++ ))
+fi
+
+# Test: flag completion uses the module's completion tables (bash only, zsh
+# uses quick.gen.zsh)
+if [[ -z "${_REDSHELL_ZSH}" ]]; then
+    COMP_WORDS=(q quick rebuild --no-cache --sk)
+    COMP_CWORD=4
+    __q_compgen
+    if [[ "${COMPREPLY[*]}" != "--skip-extra-paths" ]]; then
+        echo "FAIL: completion of q quick rebuild --sk: ${COMPREPLY[*]}" >&2
+        (( FAILURES++ ))
+    fi
+fi
+
+# Test: the checked-in generated files match the modules. Run quick_rebuild
+# after changing a function's usage line or doc comment.
+gen_dir="$(mktemp -d)"
+if ! (cd "${SRC_DIR}" && python3 -c 'import sys, quick; quick.build_all([sys.argv[1]], sys.argv[2], "none")' \
+        "${SRC_DIR}" "${gen_dir}/quick.gen.bash") > /dev/null 2>&1; then
+    echo "FAIL: could not generate quick files" >&2
+    (( FAILURES++ ))
+else
+    for gen_file in quick.gen.bash quick.gen.zsh quick.gen.search.tsv quick.gen.d; do
+        if ! diff -r "${gen_dir}/${gen_file}" "${SRC_DIR}/${gen_file}" > /dev/null; then
+            echo "FAIL: ${gen_file} is out of date, run q quick rebuild" >&2
+            (( FAILURES++ ))
+        fi
+    done
+fi
+rm -rf "${gen_dir}"
+
 if [[ "${FAILURES}" -gt 0 ]]; then
     echo "${FAILURES} test(s) failed" >&2
     exit 1